@@ -0,0 +1,26 @@
+"""Index initiatives by company
+
+Revision ID: 2a7c5e9f0b36
+Revises: c61d8f4a93e2
+Create Date: 2026-10-15 14:02:36.771408
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2a7c5e9f0b36'
+down_revision: Union[str, None] = 'c61d8f4a93e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_initiatives_company_updated', 'initiatives', ['company_profile_id', 'updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_initiatives_company_updated', table_name='initiatives')
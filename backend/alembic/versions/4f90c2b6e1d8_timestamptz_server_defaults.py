@@ -0,0 +1,66 @@
+"""Timestamps as timestamptz with server-side now() defaults
+
+Revision ID: 4f90c2b6e1d8
+Revises: e3a6d05c8f19
+Create Date: 2026-10-15 12:31:44.602913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f90c2b6e1d8'
+down_revision: Union[str, None] = 'e3a6d05c8f19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, filled by now() on insert)
+_TIMESTAMP_COLUMNS = [
+    ('teams', 'created_at', True),
+    ('users', 'created_at', True),
+    ('company_profiles', 'created_at', True),
+    ('company_profiles', 'updated_at', True),
+    ('company_profiles', 'deleted_at', False),
+    ('initiatives', 'created_at', True),
+    ('initiatives', 'updated_at', True),
+    ('research_sessions', 'started_at', False),
+    ('research_sessions', 'completed_at', False),
+    ('research_cycles', 'started_at', True),
+    ('research_cycles', 'completed_at', False),
+    ('research_paths', 'started_at', True),
+    ('research_paths', 'completed_at', False),
+    ('research_findings', 'created_at', True),
+    ('synthesized_intelligence', 'created_at', True),
+    ('synthesized_intelligence', 'updated_at', True),
+    ('dashboard_content', 'created_at', True),
+    ('dashboard_content', 'updated_at', True),
+    ('portfolio_items', 'created_at', True),
+    ('portfolio_items', 'updated_at', True),
+]
+
+
+def upgrade() -> None:
+    # Existing naive values were written with utcnow()
+    for table, column, defaulted in _TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(timezone=True),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            server_default=sa.text('now()') if defaulted else None,
+        )
+
+
+def downgrade() -> None:
+    for table, column, defaulted in _TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            server_default=None,
+        )
@@ -0,0 +1,40 @@
+"""Composite indexes for research findings, sessions and paths
+
+Revision ID: 5c2e8a91d4f7
+Revises: 1ff3412e7cbd
+Create Date: 2026-10-15 10:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c2e8a91d4f7'
+down_revision: Union[str, None] = '1ff3412e7cbd'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_research_findings_initiative_category',
+        'research_findings',
+        ['initiative_id', 'category', 'created_at'],
+        unique=False,
+        postgresql_include=['confidence_score'],
+    )
+    op.drop_index('ix_research_findings_initiative', table_name='research_findings')
+    op.drop_index('ix_research_findings_category', table_name='research_findings')
+    op.create_index('ix_research_sessions_initiative_started', 'research_sessions', ['initiative_id', 'started_at'], unique=False)
+    op.create_index('ix_research_paths_cycle_assignment', 'research_paths', ['research_cycle_id', 'assignment_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_research_paths_cycle_assignment', table_name='research_paths')
+    op.drop_index('ix_research_sessions_initiative_started', table_name='research_sessions')
+    op.create_index('ix_research_findings_category', 'research_findings', ['category'], unique=False)
+    op.create_index('ix_research_findings_initiative', 'research_findings', ['initiative_id'], unique=False)
+    op.drop_index('ix_research_findings_initiative_category', table_name='research_findings')
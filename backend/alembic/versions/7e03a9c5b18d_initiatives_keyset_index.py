@@ -0,0 +1,28 @@
+"""Add id to the initiatives company index for keyset pagination
+
+Revision ID: 7e03a9c5b18d
+Revises: d84b1f6c2e57
+Create Date: 2026-10-15 14:49:12.630584
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e03a9c5b18d'
+down_revision: Union[str, None] = 'd84b1f6c2e57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_initiatives_company_updated', table_name='initiatives')
+    op.create_index('ix_initiatives_company_updated', 'initiatives', ['company_profile_id', 'updated_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_initiatives_company_updated', table_name='initiatives')
+    op.create_index('ix_initiatives_company_updated', 'initiatives', ['company_profile_id', 'updated_at'], unique=False)
@@ -0,0 +1,53 @@
+"""GIN indexes on JSONB content columns
+
+Revision ID: 8d41f3b07a62
+Revises: 5c2e8a91d4f7
+Create Date: 2026-10-15 10:41:05.532918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d41f3b07a62'
+down_revision: Union[str, None] = '5c2e8a91d4f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # jsonb_path_ops: smaller and faster than the default opclass for @>
+    # containment, at the cost of key-exists (?) support
+    op.create_index(
+        'ix_research_findings_content_gin',
+        'research_findings',
+        ['content'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'content': 'jsonb_path_ops'},
+    )
+    op.create_index(
+        'ix_synthesized_intelligence_content_gin',
+        'synthesized_intelligence',
+        ['structured_content'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'structured_content': 'jsonb_path_ops'},
+    )
+    op.create_index(
+        'ix_portfolio_items_capabilities_gin',
+        'portfolio_items',
+        ['capabilities'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'capabilities': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_portfolio_items_capabilities_gin', table_name='portfolio_items')
+    op.drop_index('ix_synthesized_intelligence_content_gin', table_name='synthesized_intelligence')
+    op.drop_index('ix_research_findings_content_gin', table_name='research_findings')
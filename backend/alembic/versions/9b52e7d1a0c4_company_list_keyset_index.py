@@ -0,0 +1,40 @@
+"""Add id to the live company index for keyset pagination
+
+Revision ID: 9b52e7d1a0c4
+Revises: 4f90c2b6e1d8
+Create Date: 2026-10-15 13:07:51.284630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b52e7d1a0c4'
+down_revision: Union[str, None] = '4f90c2b6e1d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_company_profiles_live_team', table_name='company_profiles')
+    op.create_index(
+        'ix_company_profiles_live_team',
+        'company_profiles',
+        ['team_id', 'updated_at', 'id'],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_company_profiles_live_team', table_name='company_profiles')
+    op.create_index(
+        'ix_company_profiles_live_team',
+        'company_profiles',
+        ['team_id', 'updated_at'],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
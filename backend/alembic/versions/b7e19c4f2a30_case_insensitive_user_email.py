@@ -0,0 +1,41 @@
+"""Case-insensitive unique index on users.email
+
+Revision ID: b7e19c4f2a30
+Revises: 8d41f3b07a62
+Create Date: 2026-10-15 11:20:17.904411
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e19c4f2a30'
+down_revision: Union[str, None] = '8d41f3b07a62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Accounts whose emails differ only by case can't be merged automatically,
+    # so stop before touching the schema and name them
+    conflicts = op.get_bind().execute(sa.text(
+        "SELECT lower(email) FROM users GROUP BY 1 HAVING count(*) > 1 ORDER BY 1"
+    )).scalars().all()
+    if conflicts:
+        raise RuntimeError(
+            "Cannot add a case-insensitive unique index on users.email; merge the "
+            f"accounts whose emails differ only by case first: {', '.join(conflicts)}"
+        )
+
+    op.create_index('ux_users_email_lower', 'users', [sa.text('lower(email)')], unique=True)
+    op.drop_index('ix_users_email', table_name='users')
+    op.drop_constraint('users_email_key', 'users', type_='unique')
+
+
+def downgrade() -> None:
+    op.create_unique_constraint('users_email_key', 'users', ['email'])
+    op.create_index('ix_users_email', 'users', ['email'], unique=False)
+    op.drop_index('ux_users_email_lower', table_name='users')
@@ -0,0 +1,26 @@
+"""Index portfolio items by team and vendor name
+
+Revision ID: c61d8f4a93e2
+Revises: 9b52e7d1a0c4
+Create Date: 2026-10-15 13:41:19.057382
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c61d8f4a93e2'
+down_revision: Union[str, None] = '9b52e7d1a0c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_portfolio_items_team_vendor', 'portfolio_items', ['team_id', 'vendor_name'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_portfolio_items_team_vendor', table_name='portfolio_items')
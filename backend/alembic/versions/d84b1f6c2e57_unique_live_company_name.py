@@ -0,0 +1,49 @@
+"""Unique live company name per team
+
+Revision ID: d84b1f6c2e57
+Revises: 2a7c5e9f0b36
+Create Date: 2026-10-15 14:26:58.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd84b1f6c2e57'
+down_revision: Union[str, None] = '2a7c5e9f0b36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The old SELECT-then-INSERT in start_research could race into duplicate
+    # live profiles; keep the newest of each and soft-delete the rest so the
+    # unique index can build
+    op.execute("""
+        UPDATE company_profiles SET deleted_at = now()
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY team_id, company_name
+                    ORDER BY created_at DESC, id DESC
+                ) AS rn
+                FROM company_profiles
+                WHERE deleted_at IS NULL
+            ) ranked
+            WHERE rn > 1
+        )
+    """)
+    op.create_index(
+        'ux_company_profiles_live_team_name',
+        'company_profiles',
+        ['team_id', 'company_name'],
+        unique=True,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ux_company_profiles_live_team_name', table_name='company_profiles')
@@ -0,0 +1,34 @@
+"""Partial index on live company profiles per team
+
+Revision ID: e3a6d05c8f19
+Revises: b7e19c4f2a30
+Create Date: 2026-10-15 11:58:02.316547
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a6d05c8f19'
+down_revision: Union[str, None] = 'b7e19c4f2a30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_company_profiles_live_team',
+        'company_profiles',
+        ['team_id', 'updated_at'],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+    op.drop_index('ix_company_profiles_team', table_name='company_profiles')
+
+
+def downgrade() -> None:
+    op.create_index('ix_company_profiles_team', 'company_profiles', ['team_id'], unique=False)
+    op.drop_index('ix_company_profiles_live_team', table_name='company_profiles')
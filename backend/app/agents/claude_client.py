@@ -1,8 +1,12 @@
 """Claude client via Vertex AI."""
 
+import asyncio
+import re
+import httpx
 import structlog
-from anthropic import AnthropicVertex
-from typing import Any
+from anthropic import AsyncAnthropicVertex, DefaultAsyncHttpxClient
+from functools import lru_cache
+from typing import Any, Callable, Literal
 
 from app.config import get_settings
 
@@ -15,12 +19,46 @@ CLAUDE_MODELS = {
     "haiku": "claude-3-haiku",  # Claude 3 Haiku is available
 }
 
+# "simple" calls (small structured outputs, short tool turns) are routed to Haiku
+Complexity = Literal["simple", "complex"]
 
-def get_claude_client() -> AnthropicVertex:
-    """Get Anthropic client configured for Vertex AI."""
-    return AnthropicVertex(
+# Response that is already a bare JSON object
+_LEADING_BRACE = re.compile(r"\s*\{")
+
+# Fenced JSON object in a model response, with or without a "json" language tag.
+# The closing fence is optional so responses cut short at the end of the object still parse.
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*(?:```|$)", re.DOTALL)
+
+# Beta required for "defer_loading" tool definitions and the tool search tool
+ADVANCED_TOOL_USE_BETA = "advanced-tool-use-2025-11-20"
+
+# Prompt caching marker - static prefixes (system prompt, tool definitions)
+# are billed at the cache-read rate on repeat calls within the TTL.
+EPHEMERAL_CACHE = {"type": "ephemeral"}
+
+# Process-wide cap on in-flight Claude requests across all sessions and
+# sub-agents - past the provider's rate limit, retries cost more than waiting
+_LLM_SEMAPHORE = asyncio.Semaphore(settings.llm_max_concurrency)
+
+
+@lru_cache(maxsize=1)
+def get_claude_client() -> AsyncAnthropicVertex:
+    """
+    Get the shared async Anthropic client configured for Vertex AI.
+    
+    The client (and its connection pool and Vertex credentials) is created once
+    and reused, sized so every sub-agent in a cycle can hold a connection.
+    """
+    max_connections = settings.max_subagents_per_cycle * settings.tool_call_budget
+    return AsyncAnthropicVertex(
         region=settings.vertex_ai_region,
         project_id=settings.gcp_project_id,
+        http_client=DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=settings.max_subagents_per_cycle,
+            ),
+        ),
     )
 
 
@@ -31,27 +69,38 @@ async def call_claude(
     max_tokens: int = 4096,
     model: str = "sonnet",
     temperature: float = 0.7,
+    complexity: Complexity = "complex",
+    on_text_delta: Callable[[str], None] | None = None,
+    stop_at_json_end: bool = False,
 ) -> dict[str, Any]:
     """
     Call Claude via Vertex AI.
     
     Args:
         messages: Conversation messages
-        system: System prompt
+        system: System prompt (sent as a cached block)
         tools: Tool definitions for tool use
         max_tokens: Max tokens to generate
         model: Model name ("sonnet" or "haiku")
         temperature: Sampling temperature
+        complexity: "simple" routes the call to Haiku regardless of model
+        on_text_delta: Optional callback for streamed text deltas
+        stop_at_json_end: Stream the response and stop as soon as the first
+            top-level JSON object closes, skipping any trailing commentary
     
     Returns:
         {
             "content": list of content blocks,
             "stop_reason": str,
-            "usage": {"input_tokens": int, "output_tokens": int},
+            "usage": {"input_tokens": int, "output_tokens": int,
+                      "cache_creation_input_tokens": int,
+                      "cache_read_input_tokens": int},
             "tool_calls": list of tool use blocks (if any),
         }
     """
     client = get_claude_client()
+    if complexity == "simple":
+        model = "haiku"
     model_id = CLAUDE_MODELS.get(model, CLAUDE_MODELS["sonnet"])
     
     logger.info(
@@ -69,12 +118,25 @@ async def call_claude(
     }
     
     if system:
-        kwargs["system"] = system
+        kwargs["system"] = [
+            {"type": "text", "text": system, "cache_control": EPHEMERAL_CACHE},
+        ]
     
     if tools:
         kwargs["tools"] = tools
+        if any(t.get("defer_loading") for t in tools):
+            kwargs["extra_headers"] = {"anthropic-beta": ADVANCED_TOOL_USE_BETA}
     
-    response = client.messages.create(**kwargs)
+    stopped_early = False
+    async with _LLM_SEMAPHORE:
+        if on_text_delta is None and not stop_at_json_end:
+            response = await client.messages.create(**kwargs)
+        else:
+            response, stopped_early = await _stream_message(
+                client, kwargs, on_text_delta, stop_at_json_end,
+            )
+    stop_reason = "json_complete" if stopped_early else response.stop_reason
+    usage = _usage_to_dict(response.usage)
     
     # Extract tool calls if any
     tool_calls = []
@@ -92,24 +154,174 @@ async def call_claude(
     
     logger.info(
         "Claude response received",
-        stop_reason=response.stop_reason,
+        stop_reason=stop_reason,
         tool_call_count=len(tool_calls),
-        input_tokens=response.usage.input_tokens,
-        output_tokens=response.usage.output_tokens,
+        **usage,
     )
     
     return {
         "content": response.content,
         "text": "\n".join(text_content),
-        "stop_reason": response.stop_reason,
-        "usage": {
-            "input_tokens": response.usage.input_tokens,
-            "output_tokens": response.usage.output_tokens,
-        },
+        "stop_reason": stop_reason,
+        "usage": usage,
         "tool_calls": tool_calls,
     }
 
 
+async def _stream_message(
+    client: AsyncAnthropicVertex,
+    kwargs: dict[str, Any],
+    on_text_delta: Callable[[str], None] | None,
+    stop_at_json_end: bool,
+) -> tuple[Any, bool]:
+    """
+    Stream a message, optionally closing the stream once a JSON object completes.
+    
+    Returns:
+        (message, stopped_early) - the final message, or the partial snapshot
+        if the stream was closed at the end of the JSON object.
+    """
+    scanner = _JsonObjectScanner() if stop_at_json_end else None
+    
+    async with client.messages.stream(**kwargs) as stream:
+        async for text in stream.text_stream:
+            if on_text_delta is not None:
+                on_text_delta(text)
+            if scanner is not None and scanner.feed(text):
+                return stream.current_message_snapshot, True
+        return await stream.get_final_message(), False
+
+
+class _JsonObjectScanner:
+    """Incrementally detect when the first top-level JSON object in a text stream closes."""
+    
+    def __init__(self):
+        self._depth = 0
+        self._started = False
+        self._in_string = False
+        self._escaped = False
+    
+    def feed(self, chunk: str) -> bool:
+        """Consume a text delta; return True once the top-level object has closed."""
+        for ch in chunk:
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == "{":
+                self._depth += 1
+                self._started = True
+            elif not self._started:
+                continue
+            elif ch == '"':
+                self._in_string = True
+            elif ch == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    return True
+        return False
+
+
+def extract_json_text(text: str) -> str:
+    """Return the fenced JSON object from a model response, or the text itself if unfenced."""
+    # Bare JSON (the common case with early stop) needs no fence scan; JSON
+    # parsers accept the surrounding whitespace, so return it unstripped
+    if _LEADING_BRACE.match(text):
+        return text
+    match = _JSON_FENCE.search(text)
+    return match.group(1) if match else text
+
+
+def _usage_to_dict(usage: Any) -> dict[str, int]:
+    """Flatten SDK usage into plain ints, including prompt cache counters."""
+    return {
+        "input_tokens": usage.input_tokens,
+        "output_tokens": usage.output_tokens,
+        "cache_creation_input_tokens": getattr(usage, "cache_creation_input_tokens", None) or 0,
+        "cache_read_input_tokens": getattr(usage, "cache_read_input_tokens", None) or 0,
+    }
+
+
+def _with_cached_tools(tools: list[dict]) -> list[dict]:
+    """Return a copy of tools with a cache breakpoint on the last always-loaded definition."""
+    for i in range(len(tools) - 1, -1, -1):
+        if not tools[i].get("defer_loading"):
+            return [*tools[:i], {**tools[i], "cache_control": EPHEMERAL_CACHE}, *tools[i + 1:]]
+    return tools
+
+
+def _truncate_old_tool_results(messages: list[dict], keep_recent: int, batch: int = 1) -> None:
+    """
+    Replace tool_result content outside the last keep_recent tool turns with a placeholder.
+    
+    Claude has already acted on those results, so only the reference is kept. Full
+    results are still returned in "tool_results".
+    
+    Shortening a turn rewrites history before the rolling cache breakpoint, so the
+    next call re-writes the cache from that turn on. Stale turns are therefore only
+    truncated once batch of them have built up: the prefix stays byte-stable (and
+    cache-read) in between, at the cost of up to batch - 1 extra verbatim turns.
+    """
+    tool_turns = [
+        m for m in messages
+        if m["role"] == "user"
+        and isinstance(m["content"], list)
+        and any(b.get("type") == "tool_result" for b in m["content"])
+    ]
+    stale_turns = tool_turns[:-keep_recent] if keep_recent > 0 else tool_turns
+    
+    pending_turns = [m for m in stale_turns if any(map(_tool_result_placeholder, m["content"]))]
+    if len(pending_turns) < batch:
+        return
+    
+    for message in pending_turns:
+        for block in message["content"]:
+            placeholder = _tool_result_placeholder(block)
+            if placeholder:
+                block["content"] = placeholder
+
+
+def _tool_result_placeholder(block: dict) -> str | None:
+    """Return the placeholder for a tool_result block it would shorten, else None."""
+    if block.get("type") != "tool_result":
+        return None
+    placeholder = f"[tool_result_id={block['tool_use_id']} truncated]"
+    return placeholder if len(block["content"]) > len(placeholder) else None
+
+
+def _with_cache_breakpoints(messages: list[dict]) -> list[dict]:
+    """
+    Return a copy of messages with cache breakpoints on the first and latest user turns.
+    
+    The first user turn (the assignment) is a static prefix; the latest user turn
+    (the newest tool results) is a rolling breakpoint so each iteration of the tool
+    loop reads the prior history from cache. Markers are applied to copies only,
+    so stale breakpoints never accumulate in the stored history.
+    """
+    user_indexes = [i for i, m in enumerate(messages) if m["role"] == "user"]
+    if not user_indexes:
+        return messages
+    
+    marked = list(messages)
+    for i in {user_indexes[0], user_indexes[-1]}:
+        marked[i] = _mark_last_block(marked[i])
+    return marked
+
+
+def _mark_last_block(message: dict) -> dict:
+    """Attach an ephemeral cache marker to the final content block of a message."""
+    content = message["content"]
+    if isinstance(content, str):
+        content = [{"type": "text", "text": content}]
+    if not content:
+        return message
+    *head, last = content
+    return {**message, "content": [*head, {**last, "cache_control": EPHEMERAL_CACHE}]}
+
+
 async def call_claude_with_tools(
     messages: list[dict],
     system: str,
@@ -117,6 +329,9 @@ async def call_claude_with_tools(
     tool_executor: callable,
     max_turns: int = 10,
     model: str = "sonnet",
+    complexity: Complexity = "complex",
+    keep_recent_tool_turns: int = 3,
+    truncate_batch_turns: int = 3,
 ) -> dict[str, Any]:
     """
     Call Claude in a tool-use loop until completion.
@@ -128,11 +343,17 @@ async def call_claude_with_tools(
         tool_executor: Async function to execute tools (name, input) -> result
         max_turns: Maximum agentic turns
         model: Model to use
+        complexity: "simple" routes every turn to Haiku
+        keep_recent_tool_turns: Tool-result turns kept verbatim in the history;
+            older results are replaced by a short placeholder to bound payload growth
+        truncate_batch_turns: Stale tool turns collected before they are truncated
+            together, so the cached prefix isn't rewritten on every turn
     
     Returns:
         Final response with all tool results accumulated
     """
     current_messages = list(messages)
+    cached_tools = _with_cached_tools(tools)
     all_tool_results = []
     turns = 0
     
@@ -140,10 +361,11 @@ async def call_claude_with_tools(
         turns += 1
         
         response = await call_claude(
-            messages=current_messages,
+            messages=_with_cache_breakpoints(current_messages),
             system=system,
-            tools=tools,
+            tools=cached_tools,
             model=model,
+            complexity=complexity,
         )
         
         # Check if we need to handle tool calls
@@ -153,19 +375,22 @@ async def call_claude_with_tools(
             response["turns"] = turns
             return response
         
-        # Execute tool calls
+        # Execute tool calls concurrently - results keep tool_use order
         tool_use_content = response["content"]
+        tool_calls = response["tool_calls"]
         tool_results = []
         
-        for tool_call in response["tool_calls"]:
-            logger.info(
-                "Executing tool",
-                tool=tool_call["name"],
-                turn=turns,
-            )
-            
-            result = await tool_executor(tool_call["name"], tool_call["input"])
-            
+        logger.info(
+            "Executing tools",
+            tools=[tc["name"] for tc in tool_calls],
+            turn=turns,
+        )
+        
+        results = await asyncio.gather(
+            *[tool_executor(tc["name"], tc["input"]) for tc in tool_calls]
+        )
+        
+        for tool_call, result in zip(tool_calls, results):
             tool_results.append({
                 "type": "tool_result",
                 "tool_use_id": tool_call["id"],
@@ -187,6 +412,7 @@ async def call_claude_with_tools(
             "role": "user",
             "content": tool_results,
         })
+        _truncate_old_tool_results(current_messages, keep_recent_tool_turns, truncate_batch_turns)
     
     logger.warning("Max turns reached in tool loop", max_turns=max_turns)
     response["tool_results"] = all_tool_results
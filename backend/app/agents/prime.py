@@ -1,13 +1,40 @@
 """Prime Agent - Plans and orchestrates research."""
 
+import copy
+import hashlib
 import json
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+import orjson
 import structlog
 from typing import Any
 
-from app.agents.claude_client import call_claude
+from app.agents.claude_client import call_claude, extract_json_text
+from app.config import get_settings
 from app.models.research import ConfidenceLevel, FindingCategory
 
 logger = structlog.get_logger()
+settings = get_settings()
+
+# Plans keyed by a hash of everything that feeds the planning prompt
+# Format: {key: (expires_at, plan)}
+_PLAN_CACHE: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+PLAN_CACHE_MAX_ENTRIES = 256
+
+# Category names in FindingCategory declaration order
+_CATEGORY_NAMES = tuple(category.value for category in FindingCategory)
+
+# Numeric rank per confidence level, in ConfidenceLevel declaration order
+_LEVELS = tuple(level.value for level in ConfidenceLevel)
+_CONFIDENCE_RANK = MappingProxyType({level: rank for rank, level in enumerate(_LEVELS)})
+
+# Confidence level by finding count (index min(count, 6)):
+# 0 -> none, 1 -> low, 2-3 -> medium, 4-5 -> high, 6+ -> sufficient
+_LEVEL_BY_COUNT = ("none", "low", "medium", "medium", "high", "high", "sufficient")
+
+# Levels counted towards the "most categories are covered" stop condition
+_HIGH_OR_SUFFICIENT = frozenset({"high", "sufficient"})
 
 PRIME_SYSTEM_PROMPT = """You are the Prime Agent for Scout, an AI-powered sales intelligence platform.
 
@@ -34,7 +61,8 @@ OUTPUT FORMAT (JSON):
             "topic": "Search topic or question",
             "priority": "high" | "medium" | "low",
             "category": "people" | "initiative" | "technology" | "competitive" | "financial" | "market",
-            "instructions": "Specific instructions for the research sub-agent"
+            "instructions": "Specific instructions for the research sub-agent",
+            "batch_candidate": true | false
         }
     ],
     "confidence_assessment": {
@@ -55,8 +83,14 @@ GUIDELINES:
 - Stop when all categories reach "sufficient" or after 5 cycles
 - For follow-up questions, focus paths on the specific question
 - Be specific in instructions - tell sub-agents exactly what to look for
+- Set batch_candidate to true only for shallow paths answerable with one or two searches
 """
 
+# Planning user message templates - the research target is stable across cycles
+RESEARCH_TARGET_TEMPLATE = "**Company:** {company}\n**Initiative:** {initiative}"
+INDUSTRY_TEMPLATE = "\n**Industry:** {industry}"
+PLAN_INSTRUCTION = "\nPlan the next research cycle. Output valid JSON only."
+
 
 async def plan_research(
     company_name: str,
@@ -70,6 +104,10 @@ async def plan_research(
     """
     Plan research paths for the current cycle.
     
+    The plan's "confidence_assessment" comes from the same Claude call as the
+    plan; assess_confidence folds it into earlier cycles' levels without ever
+    lowering them. The local heuristic stands in when Claude omits it.
+    
     Args:
         company_name: Target company
         initiative_description: What we're researching
@@ -82,16 +120,32 @@ async def plan_research(
     Returns:
         Parsed planning output with research paths
     """
-    # Build context message
-    context_parts = [
-        f"**Company:** {company_name}",
-        f"**Initiative:** {initiative_description}",
-    ]
+    cache_key = _plan_cache_key(
+        company_name=company_name,
+        initiative_description=initiative_description,
+        industry=industry,
+        current_findings=current_findings,
+        current_confidence=current_confidence,
+        cycle_number=cycle_number,
+        follow_up_question=follow_up_question,
+    )
+    cached_plan = _get_cached_plan(cache_key)
+    if cached_plan is not None:
+        logger.info("Research plan cache hit", company=company_name, cycle=cycle_number)
+        return cached_plan
     
+    # Stable per-research block, sent first. A breakpoint here would sit below
+    # the minimum cacheable prefix and never be cached, so the system prompt's
+    # breakpoint in call_claude is the only one
+    target_block = RESEARCH_TARGET_TEMPLATE.format(
+        company=company_name,
+        initiative=initiative_description,
+    )
     if industry:
-        context_parts.append(f"**Industry:** {industry}")
+        target_block += INDUSTRY_TEMPLATE.format(industry=industry)
     
-    context_parts.append(f"\n**Cycle:** {cycle_number} of 5")
+    # Per-cycle delta - changes every call
+    context_parts = [f"**Cycle:** {cycle_number} of 5"]
     
     if follow_up_question:
         context_parts.append(f"\n**Follow-up Question:** {follow_up_question}")
@@ -111,8 +165,8 @@ async def plan_research(
                     summary = f.get("summary", str(f))[:200]
                     context_parts.append(f"  - {summary}")
     
-    user_message = "\n".join(context_parts)
-    user_message += "\n\nPlan the next research cycle. Output valid JSON only."
+    context_parts.append(PLAN_INSTRUCTION)
+    cycle_block = "\n".join(context_parts)
     
     logger.info(
         "Planning research cycle",
@@ -122,11 +176,19 @@ async def plan_research(
     )
     
     response = await call_claude(
-        messages=[{"role": "user", "content": user_message}],
+        messages=[{
+            "role": "user",
+            "content": [
+                {"type": "text", "text": target_block},
+                {"type": "text", "text": cycle_block},
+            ],
+        }],
         system=PRIME_SYSTEM_PROMPT,
         max_tokens=2048,
         model="sonnet",
         temperature=0.3,  # Lower temperature for planning
+        complexity="simple",  # Small deterministic JSON plan - Haiku is enough
+        stop_at_json_end=True,  # Skip trailing commentary after the plan
     )
     
     # Parse JSON response
@@ -135,18 +197,15 @@ async def plan_research(
         text = response["text"]
         
         # Handle markdown code blocks
-        if "```json" in text:
-            text = text.split("```json")[1].split("```")[0]
-        elif "```" in text:
-            text = text.split("```")[1].split("```")[0]
-        
-        plan = json.loads(text.strip())
+        plan = orjson.loads(extract_json_text(text))
         
         # Validate structure
         if "research_paths" not in plan:
             plan["research_paths"] = []
-        if "confidence_assessment" not in plan:
-            plan["confidence_assessment"] = {cat.value: "none" for cat in FindingCategory}
+        if not isinstance(plan.get("confidence_assessment"), dict):
+            plan["confidence_assessment"] = await assess_confidence(
+                current_findings or {}, current_confidence,
+            )
         if "should_continue" not in plan:
             plan["should_continue"] = cycle_number < 5
         
@@ -159,9 +218,10 @@ async def plan_research(
             should_continue=plan["should_continue"],
         )
         
+        _store_plan(cache_key, plan)
         return plan
         
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error("Failed to parse Prime Agent response", error=str(e), text=response["text"][:500])
         
         # Return a default plan
@@ -176,62 +236,110 @@ async def plan_research(
                     "instructions": "Search for general information about this initiative",
                 }
             ],
-            "confidence_assessment": {cat.value: "none" for cat in FindingCategory},
+            "confidence_assessment": await assess_confidence(
+                current_findings or {}, current_confidence,
+            ),
             "should_continue": True,
             "reasoning": "Default plan due to parsing error",
         }
 
 
+def _plan_cache_key(
+    company_name: str,
+    initiative_description: str,
+    industry: str | None,
+    current_findings: dict[str, list] | None,
+    current_confidence: dict[str, str] | None,
+    cycle_number: int,
+    follow_up_question: str | None,
+) -> str:
+    """Build a stable cache key from the inputs that shape the planning prompt."""
+    payload = json.dumps(
+        {
+            "co": company_name,
+            "init": initiative_description,
+            "ind": industry,
+            "cyc": cycle_number,
+            "fu": follow_up_question,
+            "conf": current_confidence,
+            "f_hash": _hash_findings(current_findings),
+        },
+        sort_keys=True,
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _hash_findings(findings_by_category: dict[str, list] | None) -> str:
+    """Hash only the finding summaries that are included in the planning prompt."""
+    digest = hashlib.blake2b(digest_size=16)
+    for cat, findings in sorted((findings_by_category or {}).items()):
+        if not findings:
+            continue
+        digest.update(cat.encode())
+        for f in findings[:3]:
+            digest.update(f.get("summary", str(f))[:200].encode())
+    return digest.hexdigest()
+
+
+def _get_cached_plan(key: str) -> dict | None:
+    """Return a copy of a cached plan if present and not expired."""
+    entry = _PLAN_CACHE.get(key)
+    if entry is None:
+        return None
+    
+    expires_at, plan = entry
+    if expires_at < time.monotonic():
+        del _PLAN_CACHE[key]
+        return None
+    
+    _PLAN_CACHE.move_to_end(key)
+    return copy.deepcopy(plan)
+
+
+def _store_plan(key: str, plan: dict) -> None:
+    """Cache a successfully parsed plan, evicting the oldest entries when full."""
+    _PLAN_CACHE[key] = (time.monotonic() + settings.plan_cache_ttl_seconds, copy.deepcopy(plan))
+    _PLAN_CACHE.move_to_end(key)
+    while len(_PLAN_CACHE) > PLAN_CACHE_MAX_ENTRIES:
+        _PLAN_CACHE.popitem(last=False)
+
+
 async def assess_confidence(
     findings_by_category: dict[str, list],
     previous_assessment: dict[str, str] | None = None,
+    plan_assessment: dict[str, str] | None = None,
 ) -> dict[str, str]:
     """
     Assess confidence levels based on current findings.
     
-    This is a simplified version - could be enhanced with Claude.
+    Local count-based heuristic - no Claude call. Used as the fallback when
+    plan_research gets no confidence_assessment from Claude, and to fold a
+    cycle's new findings into the plan's assessment. Each category gets the
+    highest of the heuristic, previous_assessment and plan_assessment, so a
+    plan that rates a category lower than an earlier cycle never downgrades it.
     """
     assessment = {}
+    previous_assessment = previous_assessment or {}
+    plan_assessment = plan_assessment or {}
     
-    for category in FindingCategory:
-        cat_name = category.value
-        findings = findings_by_category.get(cat_name, [])
-        
-        # Simple heuristic based on finding count and quality
-        count = len(findings)
-        
-        if count == 0:
-            level = "none"
-        elif count == 1:
-            level = "low"
-        elif count <= 3:
-            level = "medium"
-        elif count <= 5:
-            level = "high"
-        else:
-            level = "sufficient"
+    for cat_name in _CATEGORY_NAMES:
+        # Simple heuristic based on finding count
+        count = len(findings_by_category.get(cat_name, ()))
+        level = _LEVEL_BY_COUNT[min(count, len(_LEVEL_BY_COUNT) - 1)]
         
         # Carry forward if we had higher confidence before
-        if previous_assessment:
-            prev_level = previous_assessment.get(cat_name, "none")
-            if _confidence_rank(prev_level) > _confidence_rank(level):
-                level = prev_level
-        
-        assessment[cat_name] = level
+        prev_rank = max(
+            _confidence_rank(previous_assessment.get(cat_name, "none")),
+            _confidence_rank(plan_assessment.get(cat_name, "none")),
+        )
+        assessment[cat_name] = _LEVELS[max(_CONFIDENCE_RANK[level], prev_rank)]
     
     return assessment
 
 
 def _confidence_rank(level: str) -> int:
     """Get numeric rank for confidence level."""
-    ranks = {
-        "none": 0,
-        "low": 1,
-        "medium": 2,
-        "high": 3,
-        "sufficient": 4,
-    }
-    return ranks.get(level, 0)
+    return _CONFIDENCE_RANK.get(level, 0)
 
 
 def should_stop_research(assessment: dict[str, str], cycle_number: int) -> bool:
@@ -240,19 +348,15 @@ def should_stop_research(assessment: dict[str, str], cycle_number: int) -> bool:
     if cycle_number >= 5:
         return True
     
-    # Stop if all categories are sufficient
-    all_sufficient = all(
-        level == "sufficient"
-        for level in assessment.values()
-    )
+    # Single pass: all sufficient, or most categories high or sufficient
+    all_sufficient = True
+    high_count = 0
+    for level in assessment.values():
+        all_sufficient &= level == "sufficient"
+        high_count += level in _HIGH_OR_SUFFICIENT
     if all_sufficient:
         return True
     
-    # Stop if most categories are high or sufficient
-    high_count = sum(
-        1 for level in assessment.values()
-        if level in ("high", "sufficient")
-    )
     if high_count >= 5:  # 5 of 6 categories
         return True
     
@@ -1,15 +1,19 @@
 """Research Sub-Agent - Executes research paths with tools."""
 
-import json
+import asyncio
+import orjson
 import structlog
-from typing import Any
+from typing import Any, AsyncIterator, Awaitable, Callable
 
-from app.agents.claude_client import call_claude_with_tools
+from app.agents.claude_client import Complexity, call_claude_with_tools, extract_json_text
 from app.agents.tools.base import ToolRegistry, run_tool
 from app.models.research import FindingCategory
 
 logger = structlog.get_logger()
 
+# Categories still at these levels need deeper (Sonnet) research
+LOW_CONFIDENCE_LEVELS = frozenset({"none", "low"})
+
 RESEARCHER_SYSTEM_PROMPT = """You are a Research Sub-Agent for Scout, an AI sales intelligence platform.
 
 Your task is to research a specific topic and extract actionable intelligence for sales teams.
@@ -55,6 +59,15 @@ Be specific. Names, dates, and numbers are more valuable than vague statements.
 """
 
 
+class BatchedResearchError(ValueError):
+    """A batched response couldn't be parsed after its turns were already spent."""
+    
+    def __init__(self, message: str, turns: int, usage: dict[str, int]):
+        super().__init__(message)
+        self.turns = turns
+        self.usage = usage
+
+
 async def execute_research_path(
     topic: str,
     instructions: str,
@@ -62,6 +75,8 @@ async def execute_research_path(
     company_name: str,
     tool_registry: ToolRegistry,
     max_tool_calls: int = 10,
+    complexity: Complexity = "complex",
+    tools_schema: list[dict] | None = None,
 ) -> dict[str, Any]:
     """
     Execute a single research path.
@@ -73,6 +88,8 @@ async def execute_research_path(
         company_name: Company being researched
         tool_registry: Registry of available tools
         max_tool_calls: Maximum number of tool calls
+        complexity: "simple" runs the tool loop on Haiku
+        tools_schema: Precomputed Anthropic tool definitions (defaults to the registry's)
     
     Returns:
         Research results with findings
@@ -88,13 +105,6 @@ async def execute_research_path(
 
 Use the available tools to research this topic. When you have gathered enough information, provide your findings in the JSON format specified."""
 
-    # Tool executor function
-    async def execute_tool(name: str, input_data: dict) -> str:
-        result = await run_tool(tool_registry, name, input_data)
-        if "error" in result:
-            return f"Error: {result['error']}"
-        return json.dumps(result.get("result", {}), indent=2)
-    
     logger.info(
         "Starting research path",
         topic=topic,
@@ -106,10 +116,11 @@ Use the available tools to research this topic. When you have gathered enough in
     response = await call_claude_with_tools(
         messages=[{"role": "user", "content": user_message}],
         system=RESEARCHER_SYSTEM_PROMPT,
-        tools=tool_registry.to_anthropic_tools(),
-        tool_executor=execute_tool,
+        tools=tools_schema if tools_schema is not None else tool_registry.to_anthropic_tools(),
+        tool_executor=_make_tool_executor(tool_registry),
         max_turns=max_tool_calls,
         model="sonnet",
+        complexity=complexity,
     )
     
     # Parse findings from response
@@ -117,23 +128,9 @@ Use the available tools to research this topic. When you have gathered enough in
         text = response["text"]
         
         # Extract JSON from response
-        if "```json" in text:
-            text = text.split("```json")[1].split("```")[0]
-        elif "```" in text:
-            text = text.split("```")[1].split("```")[0]
+        result = orjson.loads(extract_json_text(text))
         
-        result = json.loads(text.strip())
-        
-        # Ensure findings have required fields
-        findings = []
-        for f in result.get("findings", []):
-            findings.append({
-                "category": f.get("category", target_category),
-                "summary": f.get("summary", ""),
-                "details": f.get("details", ""),
-                "source_url": f.get("source_url"),
-                "confidence": float(f.get("confidence", 0.5)),
-            })
+        findings = _normalize_findings(result.get("findings", []), target_category)
         
         logger.info(
             "Research path completed",
@@ -151,7 +148,7 @@ Use the available tools to research this topic. When you have gathered enough in
             "usage": response.get("usage", {}),
         }
         
-    except (json.JSONDecodeError, KeyError) as e:
+    except (orjson.JSONDecodeError, KeyError) as e:
         logger.warning(
             "Failed to parse research response",
             error=str(e),
@@ -168,28 +165,192 @@ Use the available tools to research this topic. When you have gathered enough in
         }
 
 
+async def execute_research_paths_batched(
+    paths: list[dict],
+    company_name: str,
+    tool_registry: ToolRegistry,
+    max_tool_calls: int = 10,
+    tools_schema: list[dict] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Execute several shallow research paths in one Claude conversation on Haiku.
+    
+    Amortizes the system prompt, tool definitions and per-request overhead across
+    paths that each need only a search or two.
+    
+    Args:
+        paths: Research path definitions (all batch candidates)
+        company_name: Company being researched
+        tool_registry: Registry of available tools
+        max_tool_calls: Maximum number of tool-use turns for the whole batch
+        tools_schema: Precomputed Anthropic tool definitions (defaults to the registry's)
+    
+    Returns:
+        List of results for each path, in the same shape as
+        execute_research_paths_parallel. The batch's turns and usage are
+        reported once, on the first result, so per-path sums stay correct
+    
+    Raises:
+        BatchedResearchError: If the batched response can't be parsed; carries
+            the batch's turns and usage so they can still be accounted for
+    """
+    task_blocks = [
+        f"""### {path.get("id", f"path_{i + 1}")}
+**Topic:** {path["topic"]}
+**Target Category:** {path.get("category", "initiative")}
+**Instructions:** {path.get("instructions", "")}"""
+        for i, path in enumerate(paths)
+    ]
+    user_message = f"""Research Tasks:
+**Company:** {company_name}
+
+Research each of these short topics:
+
+{chr(10).join(task_blocks)}
+
+Use the available tools sparingly - these topics need only a search or two each. When done, output JSON keyed by task id, each value in the findings format specified:
+{{"paths": {{"<task id>": {{"findings": [...], "tangential_signals": [...], "search_exhausted": true | false}}}}}}"""
+    
+    logger.info("Starting batched research paths", path_count=len(paths), company=company_name)
+    
+    response = await call_claude_with_tools(
+        messages=[{"role": "user", "content": user_message}],
+        system=RESEARCHER_SYSTEM_PROMPT,
+        tools=tools_schema if tools_schema is not None else tool_registry.to_anthropic_tools(),
+        tool_executor=_make_tool_executor(tool_registry),
+        max_turns=max_tool_calls,
+        complexity="simple",
+    )
+    
+    try:
+        by_path = orjson.loads(extract_json_text(response["text"]))["paths"]
+    except (KeyError, TypeError, ValueError) as e:
+        raise BatchedResearchError(
+            f"Batched research response missing paths: {e}",
+            turns=response.get("turns", 0),
+            usage=response.get("usage", {}),
+        ) from e
+    
+    results = []
+    for i, path in enumerate(paths):
+        path_id = path.get("id", f"path_{i + 1}")
+        category = path.get("category", "initiative")
+        path_result = by_path.get(path_id) or {}
+        results.append({
+            "path_id": path.get("id", "unknown"),
+            "topic": path["topic"],
+            "category": category,
+            "status": "completed",
+            "findings": _normalize_findings(path_result.get("findings", []), category),
+            "tangential_signals": path_result.get("tangential_signals", []),
+            "search_exhausted": path_result.get("search_exhausted", False),
+            "tool_results": [],
+            "turns": response.get("turns", 0) if i == 0 else 0,
+            "usage": response.get("usage", {}) if i == 0 else {},
+        })
+    
+    logger.info(
+        "Batched research paths completed",
+        path_count=len(paths),
+        total_findings=sum(len(r["findings"]) for r in results),
+        tool_calls=len(response.get("tool_results", [])),
+    )
+    
+    return results
+
+
 async def execute_research_paths_parallel(
     paths: list[dict],
     company_name: str,
     tool_registry: ToolRegistry,
     max_parallel: int = 5,
+    current_confidence: dict[str, str] | None = None,
 ) -> list[dict[str, Any]]:
     """
     Execute multiple research paths in parallel.
     
+    When every path is a shallow batch candidate, they are first tried as a
+    single batched Claude conversation (see execute_research_paths_batched),
+    falling back to per-path execution if the batch fails.
+    
     Args:
         paths: List of research path definitions
         company_name: Company being researched
         tool_registry: Registry of available tools
-        max_parallel: Maximum concurrent paths
+        max_parallel: Maximum paths running concurrently (all paths run)
+        current_confidence: Confidence by category; paths whose category is
+            already past "low" are refinements and run as "simple"
     
     Returns:
-        List of results for each path
+        List of results for each path, in path order
+    """
+    results: list[dict[str, Any]] = [{}] * len(paths)
+    async for index, result in _iter_path_results(
+        paths, company_name, tool_registry, max_parallel, current_confidence,
+    ):
+        results[index] = result
+    return results
+
+
+async def iter_research_paths_parallel(
+    paths: list[dict],
+    company_name: str,
+    tool_registry: ToolRegistry,
+    max_parallel: int = 5,
+    current_confidence: dict[str, str] | None = None,
+) -> AsyncIterator[dict[str, Any]]:
     """
-    import asyncio
+    Execute research paths like execute_research_paths_parallel, yielding each
+    result as soon as its path finishes (completion order, not path order).
     
-    # Limit parallelism
-    paths = paths[:max_parallel]
+    Lets callers report and store a fast path's findings while slower paths
+    are still running. Remaining paths are cancelled if the caller stops early.
+    """
+    async for _, result in _iter_path_results(
+        paths, company_name, tool_registry, max_parallel, current_confidence,
+    ):
+        yield result
+
+
+async def _iter_path_results(
+    paths: list[dict],
+    company_name: str,
+    tool_registry: ToolRegistry,
+    max_parallel: int,
+    current_confidence: dict[str, str] | None,
+) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+    """Run research paths, yielding (path index, result) pairs as they complete."""
+    tools_schema = tool_registry.to_anthropic_tools()
+    
+    # A failed batch's spend, added to the first fallback result so per-path
+    # usage sums still cover both conversations
+    batch_turns = 0
+    batch_usage: dict[str, int] = {}
+    
+    if _can_batch(paths, current_confidence):
+        try:
+            batched = await execute_research_paths_batched(
+                paths=paths,
+                company_name=company_name,
+                tool_registry=tool_registry,
+                tools_schema=tools_schema,
+            )
+        except Exception as e:
+            if isinstance(e, BatchedResearchError):
+                batch_turns, batch_usage = e.turns, e.usage
+            logger.warning(
+                "Batched research failed, running paths individually",
+                error=str(e),
+                turns=batch_turns,
+                usage=batch_usage,
+            )
+        else:
+            for item in enumerate(batched):
+                yield item
+            return
+    
+    # Bound concurrency without dropping paths beyond max_parallel
+    semaphore = asyncio.Semaphore(max_parallel)
     
     async def run_path(path: dict) -> dict:
         try:
@@ -199,6 +360,8 @@ async def execute_research_paths_parallel(
                 target_category=path.get("category", "initiative"),
                 company_name=company_name,
                 tool_registry=tool_registry,
+                complexity=_path_complexity(path, current_confidence),
+                tools_schema=tools_schema,
             )
             return {
                 "path_id": path.get("id", "unknown"),
@@ -224,11 +387,25 @@ async def execute_research_paths_parallel(
     
     logger.info("Executing research paths", path_count=len(paths))
     
-    results = await asyncio.gather(*[run_path(p) for p in paths])
+    async def run_bounded(index: int, path: dict) -> tuple[int, dict]:
+        async with semaphore:
+            return index, await run_path(path)
     
-    # Count successful paths
-    success_count = sum(1 for r in results if r["status"] == "completed")
-    total_findings = sum(len(r.get("findings", [])) for r in results)
+    tasks = [asyncio.create_task(run_bounded(i, p)) for i, p in enumerate(paths)]
+    success_count = 0
+    total_findings = 0
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            index, result = await next_done
+            if batch_turns or batch_usage:
+                _add_spend(result, batch_turns, batch_usage)
+                batch_turns, batch_usage = 0, {}
+            success_count += result["status"] == "completed"
+            total_findings += len(result.get("findings", []))
+            yield index, result
+    finally:
+        for task in tasks:
+            task.cancel()
     
     logger.info(
         "Research paths completed",
@@ -236,5 +413,54 @@ async def execute_research_paths_parallel(
         total_count=len(paths),
         total_findings=total_findings,
     )
+
+
+def _add_spend(result: dict, turns: int, usage: dict[str, int]) -> None:
+    """Add turns and token usage spent elsewhere to a path result."""
+    result["turns"] = result.get("turns", 0) + turns
+    path_usage = result.get("usage") or {}
+    result["usage"] = {
+        key: path_usage.get(key, 0) + usage.get(key, 0) for key in path_usage.keys() | usage.keys()
+    }
+
+
+def _path_complexity(path: dict, current_confidence: dict[str, str] | None) -> Complexity:
+    """Use Haiku for paths refining a category that already has some confidence."""
+    if not current_confidence:
+        return "complex"
+    level = current_confidence.get(path.get("category", "initiative"), "none")
+    return "complex" if level in LOW_CONFIDENCE_LEVELS else "simple"
+
+
+def _can_batch(paths: list[dict], current_confidence: dict[str, str] | None) -> bool:
+    """Batch only when there are several paths and every one is a shallow, simple candidate."""
+    return len(paths) > 1 and all(
+        path.get("batch_candidate") and _path_complexity(path, current_confidence) == "simple"
+        for path in paths
+    )
+
+
+def _make_tool_executor(tool_registry: ToolRegistry) -> Callable[[str, dict], Awaitable[str]]:
+    """Build the tool executor passed to the Claude tool-use loop."""
+    async def execute_tool(name: str, input_data: dict) -> str:
+        result = await run_tool(tool_registry, name, input_data)
+        if "error" in result:
+            return f"Error: {result['error']}"
+        # Compact output - Claude doesn't need indentation, and it costs input tokens
+        return orjson.dumps(result.get("result", {}), default=str).decode()
     
-    return results
+    return execute_tool
+
+
+def _normalize_findings(raw_findings: list[dict], target_category: str) -> list[dict]:
+    """Ensure findings have required fields."""
+    return [
+        {
+            "category": f.get("category", target_category),
+            "summary": f.get("summary", ""),
+            "details": f.get("details", ""),
+            "source_url": f.get("source_url"),
+            "confidence": float(f.get("confidence", 0.5)),
+        }
+        for f in raw_findings
+    ]
@@ -1,13 +1,60 @@
 """Synthesis Agent - Merges and structures findings."""
 
+import copy
+import hashlib
+import io
 import json
+import time
+from collections import OrderedDict
+import orjson
 import structlog
 from typing import Any
 
-from app.agents.claude_client import call_claude
+from app.agents.claude_client import call_claude, extract_json_text
+from app.config import get_settings
 from app.models.research import FindingCategory, ConfidenceLevel
 
 logger = structlog.get_logger()
+settings = get_settings()
+
+# Syntheses keyed by a hash of everything that feeds the synthesis prompt
+# Format: {key: (expires_at, synthesis)}
+_SYNTHESIS_CACHE: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+SYNTHESIS_CACHE_MAX_ENTRIES = 256
+
+# Category names and their prompt headings, in FindingCategory declaration order
+_CATEGORY_NAMES = tuple(category.value for category in FindingCategory)
+_CATEGORY_HEADINGS = tuple(zip(_CATEGORY_NAMES, (name.title() for name in _CATEGORY_NAMES)))
+
+# Compact output - indentation only costs tokens
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=str)
+
+# Per-category placeholder used when the synthesis response can't be parsed
+_FAILED_CATEGORIES = {
+    name: {
+        "summary": "Synthesis failed - raw findings available",
+        "insights": [],
+        "confidence": "low",
+    }
+    for name in _CATEGORY_NAMES
+}
+
+# Returned without a Claude call when there is nothing to synthesize
+_EMPTY_SYNTHESIS = {
+    "categories": {
+        name: {
+            "summary": "No findings yet",
+            "insights": [],
+            "confidence": "none",
+        }
+        for name in _CATEGORY_NAMES
+    },
+    "tangential_initiatives": [],
+    "overall_assessment": "No findings available to assess yet",
+}
+
+# Syntheses at these levels give recommendations nothing to work from
+_UNINFORMATIVE_CONFIDENCE = frozenset({"none", "low"})
 
 SYNTHESIS_SYSTEM_PROMPT = """You are the Synthesis Agent for Scout, an AI sales intelligence platform.
 
@@ -79,12 +126,18 @@ GUIDELINES:
 - Be concise but comprehensive
 """
 
+RECOMMENDATION_SYSTEM_PROMPT = (
+    "You recommend relevant vendor partners based on research findings. "
+    "Be specific about why each vendor is relevant."
+)
+
 
 async def synthesize_findings(
     company_name: str,
     initiative_description: str,
     findings_by_category: dict[str, list],
     previous_synthesis: dict | None = None,
+    no_cache: bool = False,
 ) -> dict[str, Any]:
     """
     Synthesize findings into structured intelligence.
@@ -94,35 +147,26 @@ async def synthesize_findings(
         initiative_description: What we're researching
         findings_by_category: Findings organized by category
         previous_synthesis: Previous synthesis to merge with
+        no_cache: Skip the cache lookup and force a fresh synthesis
     
     Returns:
         Synthesized intelligence structure
     """
-    # Build context
-    context_parts = [
-        f"**Company:** {company_name}",
-        f"**Initiative:** {initiative_description}",
-        "\n**Findings by Category:**",
-    ]
-    
-    for category in FindingCategory:
-        cat_name = category.value
-        cat_findings = findings_by_category.get(cat_name, [])
-        
-        if cat_findings:
-            context_parts.append(f"\n### {cat_name.title()}")
-            for f in cat_findings:
-                context_parts.append(f"- **{f.get('summary', 'No summary')}**")
-                if f.get("details"):
-                    context_parts.append(f"  {f['details'][:300]}")
-                if f.get("source_url"):
-                    context_parts.append(f"  Source: {f['source_url']}")
+    if not previous_synthesis and not _has_findings(findings_by_category):
+        return copy.deepcopy(_EMPTY_SYNTHESIS)
     
-    if previous_synthesis:
-        context_parts.append("\n**Previous Synthesis to Merge:**")
-        context_parts.append(json.dumps(previous_synthesis, indent=2)[:2000])
+    cache_key = _synthesis_cache_key(
+        company_name, initiative_description, findings_by_category, previous_synthesis
+    )
+    if not no_cache:
+        cached_synthesis = _get_cached_synthesis(cache_key)
+        if cached_synthesis is not None:
+            logger.info("Synthesis cache hit", company=company_name)
+            return cached_synthesis
     
-    user_message = "\n".join(context_parts)
+    user_message = _build_synthesis_message(
+        company_name, initiative_description, findings_by_category, previous_synthesis
+    )
     user_message += "\n\nSynthesize these findings into structured intelligence. Output valid JSON only."
     
     logger.info(
@@ -141,35 +185,109 @@ async def synthesize_findings(
     
     # Parse response
     try:
-        text = response["text"]
-        
-        if "```json" in text:
-            text = text.split("```json")[1].split("```")[0]
-        elif "```" in text:
-            text = text.split("```")[1].split("```")[0]
-        
-        synthesis = json.loads(text.strip())
+        synthesis = _parse_synthesis(response["text"])
         
         logger.info("Synthesis completed", has_categories="categories" in synthesis)
         
+        _store_synthesis(cache_key, synthesis)
         return synthesis
         
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error("Failed to parse synthesis response", error=str(e))
+        return _fallback_synthesis(e)
+
+
+async def synthesize_and_recommend(
+    company_name: str,
+    initiative_description: str,
+    findings_by_category: dict[str, list],
+    portfolio_items: list[dict],
+    previous_synthesis: dict | None = None,
+    no_cache: bool = False,
+) -> tuple[dict[str, Any], list[dict]]:
+    """
+    Synthesize findings and recommend portfolio vendors in a single Claude call.
+    
+    Folds generate_portfolio_recommendations into the synthesis prompt so the
+    findings are sent and tokenized once. Without portfolio items this is just
+    synthesize_findings.
+    
+    Args:
+        company_name: Target company
+        initiative_description: What we're researching
+        findings_by_category: Findings organized by category
+        portfolio_items: Team's vendor portfolio
+        previous_synthesis: Previous synthesis to merge with
+        no_cache: Skip the cache lookup and force a fresh synthesis
+    
+    Returns:
+        Tuple of (synthesized intelligence, portfolio recommendations)
+    """
+    if not portfolio_items or (
+        not previous_synthesis and not _has_findings(findings_by_category)
+    ):
+        synthesis = await synthesize_findings(
+            company_name=company_name,
+            initiative_description=initiative_description,
+            findings_by_category=findings_by_category,
+            previous_synthesis=previous_synthesis,
+            no_cache=no_cache,
+        )
+        return synthesis, []
+    
+    cache_key = _synthesis_cache_key(
+        company_name, initiative_description, findings_by_category, previous_synthesis,
+        portfolio_items=portfolio_items,
+    )
+    synthesis = None if no_cache else _get_cached_synthesis(cache_key)
+    if synthesis is not None:
+        logger.info("Synthesis cache hit", company=company_name)
+        return synthesis, synthesis.pop("portfolio_recommendations", [])
+    
+    user_message = _build_synthesis_message(
+        company_name, initiative_description, findings_by_category, previous_synthesis
+    )
+    user_message += f"""
+
+**Vendor Portfolio:**
+{_format_portfolio(portfolio_items)}
+
+Synthesize these findings into structured intelligence, and recommend which portfolio vendors are most relevant to this opportunity. Output valid JSON only, in the format specified plus a top-level "portfolio_recommendations" key:
+"portfolio_recommendations": [
+    {{
+        "vendor": "Vendor Name",
+        "capability": "Relevant capability",
+        "relevance": "Why this vendor is relevant",
+        "supporting_findings": ["Finding that supports this"]
+    }}
+]"""
+    
+    logger.info(
+        "Synthesizing findings with portfolio recommendations",
+        company=company_name,
+        category_count=len([c for c in findings_by_category if findings_by_category[c]]),
+        portfolio_count=len(portfolio_items),
+    )
+    
+    response = await call_claude(
+        messages=[{"role": "user", "content": user_message}],
+        system=SYNTHESIS_SYSTEM_PROMPT,
+        max_tokens=5120,
+        model="haiku",
+        temperature=0.2,
+    )
+    
+    try:
+        synthesis = _parse_synthesis(response["text"])
         
-        # Return basic structure
-        return {
-            "categories": {
-                cat.value: {
-                    "summary": "Synthesis failed - raw findings available",
-                    "insights": [],
-                    "confidence": "low",
-                }
-                for cat in FindingCategory
-            },
-            "overall_assessment": "Synthesis parsing failed",
-            "error": str(e),
-        }
+        logger.info("Synthesis completed", has_categories="categories" in synthesis)
+        
+        _store_synthesis(cache_key, synthesis)
+        return synthesis, synthesis.pop("portfolio_recommendations", [])
+        
+    except orjson.JSONDecodeError as e:
+        logger.error("Failed to parse synthesis response", error=str(e))
+        return _fallback_synthesis(e), []
 
 
 async def generate_portfolio_recommendations(
@@ -189,18 +307,19 @@ async def generate_portfolio_recommendations(
     if not portfolio_items:
         return []
     
-    # Build context
-    portfolio_summary = []
-    for item in portfolio_items:
-        caps = ", ".join(item.get("capabilities", [])) if item.get("capabilities") else "General"
-        portfolio_summary.append(f"- {item['vendor_name']} ({item.get('partnership_level', 'Partner')}): {caps}")
+    # Nothing learned yet - no basis for recommending vendors
+    if all(
+        cat.get("confidence") in _UNINFORMATIVE_CONFIDENCE
+        for cat in synthesis.get("categories", {}).values()
+    ):
+        return []
     
     user_message = f"""Based on this synthesized intelligence:
 
-{json.dumps(synthesis.get('categories', {}), indent=2)[:3000]}
+{_truncated_dumps(synthesis.get('categories', {}), 3000)}
 
 And this vendor portfolio:
-{chr(10).join(portfolio_summary)}
+{_format_portfolio(portfolio_items)}
 
 Recommend which portfolio vendors are most relevant to this opportunity. Output JSON:
 {{
@@ -216,21 +335,161 @@ Recommend which portfolio vendors are most relevant to this opportunity. Output
 
     response = await call_claude(
         messages=[{"role": "user", "content": user_message}],
-        system="You recommend relevant vendor partners based on research findings. Be specific about why each vendor is relevant.",
+        system=RECOMMENDATION_SYSTEM_PROMPT,
         max_tokens=1024,
         model="haiku",
         temperature=0.3,
     )
     
     try:
-        text = response["text"]
-        if "```json" in text:
-            text = text.split("```json")[1].split("```")[0]
-        elif "```" in text:
-            text = text.split("```")[1].split("```")[0]
-        
-        result = json.loads(text.strip())
+        result = orjson.loads(extract_json_text(response["text"]))
         return result.get("recommendations", [])
         
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         return []
+
+
+def _has_findings(findings_by_category: dict[str, list]) -> bool:
+    """Check whether any category has at least one finding."""
+    return any(findings_by_category.values())
+
+
+def _build_synthesis_message(
+    company_name: str,
+    initiative_description: str,
+    findings_by_category: dict[str, list],
+    previous_synthesis: dict | None,
+) -> str:
+    """Build the findings context shared by the synthesis prompts."""
+    buf = io.StringIO()
+    buf.write(f"**Company:** {company_name}\n**Initiative:** {initiative_description}\n\n**Findings by Category:**")
+    
+    get_findings = findings_by_category.get
+    for cat_name, heading in _CATEGORY_HEADINGS:
+        cat_findings = get_findings(cat_name)
+        if not cat_findings:
+            continue
+        
+        buf.write(f"\n\n### {heading}")
+        for f in cat_findings:
+            buf.write(f"\n- **{f.get('summary', 'No summary')}**")
+            details = f.get("details")
+            if details:
+                buf.write(f"\n  {details[:300]}")
+            source_url = f.get("source_url")
+            if source_url:
+                buf.write(f"\n  Source: {source_url}")
+    
+    # Sent in full: with incremental synthesis it's the only place earlier
+    # cycles' findings reach the model, so a cut here would lose them for good
+    if previous_synthesis:
+        buf.write("\n\n**Previous Synthesis to Merge:**\n")
+        buf.write(orjson.dumps(previous_synthesis, default=str).decode())
+    
+    return buf.getvalue()
+
+
+def _truncated_dumps(obj: Any, limit: int) -> str:
+    """
+    Serialize obj as compact JSON, cut to limit characters.
+    
+    Encodes incrementally and stops once the budget is reached, so a large
+    synthesis costs O(limit) rather than a full dump that is mostly discarded.
+    """
+    buf = io.StringIO()
+    size = 0
+    for chunk in _COMPACT_ENCODER.iterencode(obj):
+        buf.write(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return buf.getvalue()[:limit]
+
+
+def _format_portfolio(portfolio_items: list[dict]) -> str:
+    """Render portfolio vendors as one bullet line each."""
+    lines = []
+    for item in portfolio_items:
+        caps = ", ".join(item.get("capabilities", [])) if item.get("capabilities") else "General"
+        lines.append(f"- {item['vendor_name']} ({item.get('partnership_level', 'Partner')}): {caps}")
+    return "\n".join(lines)
+
+
+def _parse_synthesis(text: str) -> dict:
+    """Parse a synthesis JSON object from a (possibly fenced) Claude response."""
+    return orjson.loads(extract_json_text(text))
+
+
+def _fallback_synthesis(error: Exception) -> dict[str, Any]:
+    """Basic structure returned when the synthesis response can't be parsed."""
+    return {
+        "categories": copy.deepcopy(_FAILED_CATEGORIES),
+        "overall_assessment": "Synthesis parsing failed",
+        "error": str(error),
+    }
+
+
+def _synthesis_cache_key(
+    company_name: str,
+    initiative_description: str,
+    findings_by_category: dict[str, list],
+    previous_synthesis: dict | None,
+    portfolio_items: list[dict] | None = None,
+) -> str:
+    """
+    Build a stable cache key from the inputs that shape the synthesis prompt.
+    
+    Findings are hashed individually and sorted, so the same findings arriving
+    in a different order map to the same key.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{company_name}\0{initiative_description}".encode())
+    for cat, findings in sorted(findings_by_category.items()):
+        if not findings:
+            continue
+        digest.update(f"\0{cat}".encode())
+        for finding_hash in sorted(_hash_finding(f) for f in findings):
+            digest.update(finding_hash)
+    if previous_synthesis:
+        digest.update(orjson.dumps(previous_synthesis, default=str, option=orjson.OPT_SORT_KEYS))
+    if portfolio_items:
+        digest.update(f"\0{_format_portfolio(portfolio_items)}".encode())
+    return digest.hexdigest()
+
+
+def _hash_finding(finding: dict) -> bytes:
+    """Hash the finding fields that appear in the synthesis prompt."""
+    return hashlib.blake2b(
+        "\0".join((
+            finding.get("summary") or "",
+            (finding.get("details") or "")[:300],
+            finding.get("source_url") or "",
+        )).encode(),
+        digest_size=16,
+    ).digest()
+
+
+def _get_cached_synthesis(key: str) -> dict | None:
+    """Return a copy of a cached synthesis if present and not expired."""
+    entry = _SYNTHESIS_CACHE.get(key)
+    if entry is None:
+        return None
+    
+    expires_at, synthesis = entry
+    if expires_at < time.monotonic():
+        del _SYNTHESIS_CACHE[key]
+        return None
+    
+    _SYNTHESIS_CACHE.move_to_end(key)
+    return copy.deepcopy(synthesis)
+
+
+def _store_synthesis(key: str, synthesis: dict) -> None:
+    """Cache a successfully parsed synthesis, evicting the oldest entries when full."""
+    _SYNTHESIS_CACHE[key] = (
+        time.monotonic() + settings.synthesis_cache_ttl_seconds,
+        copy.deepcopy(synthesis),
+    )
+    _SYNTHESIS_CACHE.move_to_end(key)
+    while len(_SYNTHESIS_CACHE) > SYNTHESIS_CACHE_MAX_ENTRIES:
+        _SYNTHESIS_CACHE.popitem(last=False)
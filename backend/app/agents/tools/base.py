@@ -10,27 +10,21 @@ from app.config import get_settings
 logger = structlog.get_logger()
 settings = get_settings()
 
+# Server-side tool Claude uses to pull in deferred tool schemas on demand
+TOOL_SEARCH_TOOL = {"type": "tool_search_tool_regex_20251119", "name": "tool_search_tool_regex"}
+
 
 class Tool(ABC):
     """Base class for all research tools."""
     
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Unique tool name."""
-        pass
-    
-    @property
-    @abstractmethod
-    def description(self) -> str:
-        """Human-readable description for the AI."""
-        pass
+    # Rarely-used tools can have their schema loaded on demand via tool search
+    defer_loading: bool = False
     
-    @property
-    @abstractmethod
-    def schema(self) -> dict:
-        """Anthropic tool use JSON schema."""
-        pass
+    # Plain class attributes set by each tool - read on every registry and
+    # dispatch lookup, so they aren't properties
+    name: str  # Unique tool name
+    description: str  # Human-readable description for the AI
+    schema: dict  # Anthropic tool use JSON schema
     
     @abstractmethod
     async def execute(self, **kwargs) -> dict:
@@ -38,12 +32,15 @@ class Tool(ABC):
         pass
     
     def to_anthropic_tool(self) -> dict:
-        """Convert to Anthropic tool definition format."""
-        return {
-            "name": self.name,
-            "description": self.description,
-            "input_schema": self.schema,
-        }
+        """Convert to Anthropic tool definition format (built once per tool, treat as read-only)."""
+        definition = self.__dict__.get("_anthropic_tool")
+        if definition is None:
+            definition = self._anthropic_tool = {
+                "name": self.name,
+                "description": self.description,
+                "input_schema": self.schema,
+            }
+        return definition
 
 
 class ToolRegistry:
@@ -51,10 +48,12 @@ class ToolRegistry:
     
     def __init__(self):
         self._tools: dict[str, Tool] = {}
+        self._anthropic_tools: list[dict] | None = None
     
     def register(self, tool: Tool) -> None:
         """Register a tool."""
         self._tools[tool.name] = tool
+        self._anthropic_tools = None
         logger.debug("Tool registered", tool=tool.name)
     
     def get(self, name: str) -> Tool | None:
@@ -66,8 +65,24 @@ class ToolRegistry:
         return list(self._tools.values())
     
     def to_anthropic_tools(self) -> list[dict]:
-        """Get all tools in Anthropic format."""
-        return [tool.to_anthropic_tool() for tool in self._tools.values()]
+        """
+        Get all tools in Anthropic format (built once, rebuilt after register).
+        
+        The same list is returned to every caller - treat it as read-only.
+        
+        With settings.defer_tool_loading, tools flagged defer_loading are sent
+        with "defer_loading": true and the tool search tool is added so Claude
+        only loads their schemas when it needs them.
+        """
+        if self._anthropic_tools is None:
+            tools = [tool.to_anthropic_tool() for tool in self._tools.values()]
+            if settings.defer_tool_loading and any(t.defer_loading for t in self._tools.values()):
+                tools = [TOOL_SEARCH_TOOL] + [
+                    {**schema, "defer_loading": True} if tool.defer_loading else schema
+                    for tool, schema in zip(self._tools.values(), tools)
+                ]
+            self._anthropic_tools = tools
+        return self._anthropic_tools
 
 
 async def run_tool(
@@ -92,14 +107,14 @@ async def run_tool(
     timeout = timeout or settings.tool_timeout_seconds
     
     try:
-        logger.info("Executing tool", tool=tool_name, input_keys=list(tool_input.keys()))
+        logger.info("Executing tool", tool=tool_name, input_count=len(tool_input))
         
-        result = await asyncio.wait_for(
-            tool.execute(**tool_input),
-            timeout=timeout,
-        )
+        # A total deadline for every tool - httpx timeouts only bound each
+        # connect/read phase, not a slow-drip body or a multi-request fan-out
+        async with asyncio.timeout(timeout):
+            result = await tool.execute(**tool_input)
         
-        logger.info("Tool completed", tool=tool_name, result_keys=list(result.keys()) if isinstance(result, dict) else "non-dict")
+        logger.info("Tool completed", tool=tool_name, result_type=type(result).__name__)
         return {"result": result}
         
     except asyncio.TimeoutError:
@@ -0,0 +1,59 @@
+"""Shared HTTP clients for research tools."""
+
+import httpx
+
+# Pooled so repeated tool calls reuse TCP/TLS connections to the same hosts
+# (api.search.brave.com, efts.sec.gov, and pages scraped more than once).
+# Brave and EDGAR speak HTTP/2, so concurrent calls from parallel subagents
+# multiplex over one connection per host instead of opening more.
+_clients: dict[str, httpx.AsyncClient] = {}
+
+
+def _get_client(key: str, **client_kwargs) -> httpx.AsyncClient:
+    """Get a shared client by key, creating it on first use."""
+    client = _clients.get(key)
+    if client is None or client.is_closed:
+        client = _clients[key] = httpx.AsyncClient(**client_kwargs)
+    return client
+
+
+def get_brave_client() -> httpx.AsyncClient:
+    """Get the shared Brave Search client."""
+    return _get_client(
+        "brave",
+        http2=True,
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+        headers={
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip",
+        },
+    )
+
+
+def get_sec_client() -> httpx.AsyncClient:
+    """Get the shared SEC EDGAR client."""
+    return _get_client(
+        "sec",
+        http2=True,
+        timeout=15.0,
+        limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+    )
+
+
+def get_scrape_client() -> httpx.AsyncClient:
+    """Get the shared client for scraping arbitrary pages."""
+    return _get_client(
+        "scrape",
+        timeout=15.0,
+        follow_redirects=True,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+    )
+
+
+async def close_http_clients() -> None:
+    """Close all shared clients on shutdown."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
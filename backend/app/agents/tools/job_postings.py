@@ -1,11 +1,13 @@
 """Job postings search tool using Brave Search + scraping."""
 
+import asyncio
 import re
-import httpx
+from dataclasses import dataclass
+import orjson
 import structlog
-from bs4 import BeautifulSoup
 
 from app.agents.tools.base import Tool
+from app.agents.tools.http_client import get_brave_client
 from app.config import get_settings
 
 logger = structlog.get_logger()
@@ -25,39 +27,85 @@ TECH_KEYWORDS = [
     "agile", "scrum", "jira", "confluence",
 ]
 
+# One pass over the text finds every keyword starting at a word boundary. The
+# lookahead lets overlapping keywords ("google cloud" and "cloud") both match,
+# and longest-first ordering prefers "javascript" over "java" at one position.
+_TECH_PATTERN = re.compile(
+    r"\b(?=("
+    + "|".join(re.escape(tech) for tech in sorted(TECH_KEYWORDS, key=len, reverse=True))
+    + r")\b)"
+)
+
+_JOB_INDICATOR_PATTERN = re.compile(
+    "|".join(map(re.escape, [
+        "career", "job", "position", "hiring", "apply",
+        "engineer", "manager", "director", "analyst", "developer",
+        "specialist", "coordinator", "lead", "architect",
+    ])),
+    re.IGNORECASE,
+)
+
+# Host part of a URL - everything between "//" and the next path, query or fragment
+_URL_HOST = re.compile(r"//([^/?#]*)")
+
+_TITLE_TOKEN = re.compile(r"[a-z]+")
+
+# Seniority by title word; when a title has several, the earliest level listed wins
+_SENIORITY_ORDER = ("senior", "director", "manager", "junior", "intern")
+_SENIORITY_BY_TOKEN = {
+    "senior": "senior", "sr": "senior", "lead": "senior", "principal": "senior", "staff": "senior",
+    "director": "director", "head": "director", "vp": "director", "vice": "director",
+    "manager": "manager", "mgr": "manager",
+    "junior": "junior", "jr": "junior", "entry": "junior", "associate": "junior",
+    "intern": "intern", "internship": "intern",
+}
+
+
+def _normalize_url(url: str) -> str:
+    """Normalize a URL for deduplication: drop the query string, trailing slash and case."""
+    return url.split("?", 1)[0].rstrip("/").lower()
+
+
+@dataclass(slots=True)
+class JobResult:
+    """A job posting found for the company (serialized as a JSON object by orjson)."""
+    
+    title: str
+    url: str
+    source: str
+    description_excerpt: str
+    technologies_mentioned: list[str]
+    seniority: str | None
+
 
 class JobPostingsTool(Tool):
     """Search for job postings to infer technology stack and priorities."""
     
-    @property
-    def name(self) -> str:
-        return "job_postings"
+    defer_loading = True
     
-    @property
-    def description(self) -> str:
-        return (
-            "Search for job postings from a company to infer their technology stack, "
-            "team structure, and strategic priorities. Job postings reveal what technologies "
-            "they use, what skills they're hiring for, and what initiatives they're investing in."
-        )
+    name = "job_postings"
     
-    @property
-    def schema(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "company_name": {
-                    "type": "string",
-                    "description": "The company name to search jobs for.",
-                },
-                "keywords": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Optional keywords to filter jobs (e.g., ['cloud', 'security', 'data']).",
-                },
+    description = (
+        "Search for job postings from a company to infer their technology stack, "
+        "team structure, and strategic priorities. Job postings reveal what technologies "
+        "they use, what skills they're hiring for, and what initiatives they're investing in."
+    )
+    
+    schema = {
+        "type": "object",
+        "properties": {
+            "company_name": {
+                "type": "string",
+                "description": "The company name to search jobs for.",
             },
-            "required": ["company_name"],
-        }
+            "keywords": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Optional keywords to filter jobs (e.g., ['cloud', 'security', 'data']).",
+            },
+        },
+        "required": ["company_name"],
+    }
     
     async def execute(
         self,
@@ -70,16 +118,7 @@ class JobPostingsTool(Tool):
         Returns:
             {
                 "company_name": str,
-                "jobs": [
-                    {
-                        "title": str,
-                        "url": str,
-                        "source": str,
-                        "description_excerpt": str,
-                        "technologies_mentioned": [str],
-                        "seniority": str | None,
-                    }
-                ],
+                "jobs": [JobResult],
                 "technology_signals": [str],
                 "total_found": int,
             }
@@ -93,60 +132,54 @@ class JobPostingsTool(Tool):
                 "error": "Brave Search API key not configured",
             }
         
-        # Build search query
-        query_parts = [f'"{company_name}"', "careers OR jobs OR hiring"]
-        if keywords:
-            query_parts.append(" OR ".join(keywords))
-        
-        query = " ".join(query_parts)
-        
-        headers = {
-            "Accept": "application/json",
-            "Accept-Encoding": "gzip",
-            "X-Subscription-Token": settings.brave_search_api_key,
-        }
-        
-        params = {
-            "q": query,
-            "count": 15,
-            "text_decorations": False,
-            "search_lang": "en",
-        }
+        # One query per keyword, run concurrently, so each keyword gets its own
+        # result slots; a single query when there's at most one keyword
+        base_query = f'"{company_name}" careers OR jobs OR hiring'
+        if keywords and len(keywords) > 1:
+            queries = [f"{base_query} {kw}" for kw in keywords]
+        else:
+            queries = [" ".join([base_query, *(keywords or [])])]
         
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    BRAVE_SEARCH_URL,
-                    headers=headers,
-                    params=params,
-                    timeout=10.0,
-                )
-                response.raise_for_status()
-                data = response.json()
-        
-        except Exception as e:
+        responses = await asyncio.gather(
+            *[self._search(q) for q in queries],
+            return_exceptions=True,
+        )
+        errors = [r for r in responses if isinstance(r, BaseException)]
+        if len(errors) == len(responses):
             return {
                 "company_name": company_name,
                 "jobs": [],
                 "technology_signals": [],
                 "total_found": 0,
-                "error": str(e),
+                "error": str(errors[0]),
             }
         
-        # Parse search results
-        web_results = data.get("web", {}).get("results", [])
+        web_results = [
+            item
+            for shard in responses
+            if not isinstance(shard, BaseException)
+            for item in shard
+        ]
         
         jobs = []
         all_technologies = set()
+        # Normalized URLs already taken, so the same posting (merged shards,
+        # tracking params, trailing slashes) fills only one slot
+        seen_urls: set[str] = set()
         
         for item in web_results:
             url = item.get("url", "")
+            norm_url = _normalize_url(url)
+            if norm_url in seen_urls:
+                continue
+            
             title = item.get("title", "")
             description = item.get("description", "")
             
             # Skip if doesn't look like a job posting
             if not self._looks_like_job(title, url):
                 continue
+            seen_urls.add(norm_url)
             
             # Extract technologies mentioned
             text_to_scan = f"{title} {description}".lower()
@@ -156,17 +189,18 @@ class JobPostingsTool(Tool):
             # Infer seniority
             seniority = self._infer_seniority(title)
             
-            jobs.append({
-                "title": title,
-                "url": url,
-                "source": self._get_domain(url),
-                "description_excerpt": description[:300] if description else "",
-                "technologies_mentioned": list(technologies),
-                "seniority": seniority,
-            })
-        
-        # Limit to top 10 most relevant
-        jobs = jobs[:10]
+            jobs.append(JobResult(
+                title=title,
+                url=url,
+                source=self._get_domain(norm_url),
+                description_excerpt=description[:300] if description else "",
+                technologies_mentioned=list(technologies),
+                seniority=seniority,
+            ))
+            
+            # Top 10 most relevant
+            if len(jobs) >= 10:
+                break
         
         logger.info(
             "Job postings search completed",
@@ -182,47 +216,44 @@ class JobPostingsTool(Tool):
             "total_found": len(jobs),
         }
     
+    async def _search(self, query: str) -> list[dict]:
+        """Run one Brave web search and return its web results."""
+        response = await get_brave_client().get(
+            BRAVE_SEARCH_URL,
+            headers={"X-Subscription-Token": settings.brave_search_api_key},
+            params={
+                "q": query,
+                "count": 15,
+                "text_decorations": False,
+                "search_lang": "en",
+                "result_filter": "web",
+            },
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+        return data.get("web", {}).get("results", [])
+    
     def _looks_like_job(self, title: str, url: str) -> bool:
         """Check if a result looks like a job posting."""
-        job_indicators = [
-            "career", "job", "position", "hiring", "apply",
-            "engineer", "manager", "director", "analyst", "developer",
-            "specialist", "coordinator", "lead", "architect",
-        ]
-        title_lower = title.lower()
-        url_lower = url.lower()
-        
-        return any(ind in title_lower or ind in url_lower for ind in job_indicators)
+        return bool(_JOB_INDICATOR_PATTERN.search(title) or _JOB_INDICATOR_PATTERN.search(url))
     
     def _extract_technologies(self, text: str) -> set[str]:
-        """Extract technology keywords from text."""
-        found = set()
-        for tech in TECH_KEYWORDS:
-            if tech in text:
-                found.add(tech)
-        return found
+        """Extract technology keywords from lowercased text."""
+        return {m.group(1) for m in _TECH_PATTERN.finditer(text)}
     
     def _infer_seniority(self, title: str) -> str | None:
         """Infer seniority level from job title."""
-        title_lower = title.lower()
-        
-        if any(x in title_lower for x in ["senior", "sr.", "sr ", "lead", "principal", "staff"]):
-            return "senior"
-        elif any(x in title_lower for x in ["director", "head of", "vp", "vice president"]):
-            return "director"
-        elif any(x in title_lower for x in ["manager", "mgr"]):
-            return "manager"
-        elif any(x in title_lower for x in ["junior", "jr.", "jr ", "entry", "associate"]):
-            return "junior"
-        elif any(x in title_lower for x in ["intern", "internship"]):
-            return "intern"
+        levels = {
+            _SENIORITY_BY_TOKEN.get(token)
+            for token in _TITLE_TOKEN.findall(title.lower())
+        }
+        for level in _SENIORITY_ORDER:
+            if level in levels:
+                return level
         
         return "mid-level"
     
     def _get_domain(self, url: str) -> str:
         """Extract domain from URL."""
-        try:
-            from urllib.parse import urlparse
-            return urlparse(url).netloc
-        except:
-            return ""
+        match = _URL_HOST.search(url)
+        return match.group(1) if match else ""
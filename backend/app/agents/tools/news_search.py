@@ -1,9 +1,12 @@
 """News search tool using Brave Search API."""
 
+from dataclasses import dataclass
 import httpx
+import orjson
 import structlog
 
 from app.agents.tools.base import Tool
+from app.agents.tools.http_client import get_brave_client
 from app.config import get_settings
 
 logger = structlog.get_logger()
@@ -12,45 +15,50 @@ settings = get_settings()
 BRAVE_NEWS_URL = "https://api.search.brave.com/res/v1/news/search"
 
 
+@dataclass(slots=True)
+class NewsResult:
+    """A news article (serialized as a JSON object by orjson)."""
+    
+    title: str
+    url: str
+    source: str
+    published_date: str
+    description: str
+
+
 class NewsSearchTool(Tool):
     """Search for recent news articles using Brave News API."""
     
-    @property
-    def name(self) -> str:
-        return "news_search"
+    name = "news_search"
     
-    @property
-    def description(self) -> str:
-        return (
-            "Search for recent news articles about a company or topic. "
-            "Returns recent press releases, news coverage, and announcements. "
-            "Useful for finding current events, executive quotes, and recent developments."
-        )
+    description = (
+        "Search for recent news articles about a company or topic. "
+        "Returns recent press releases, news coverage, and announcements. "
+        "Useful for finding current events, executive quotes, and recent developments."
+    )
     
-    @property
-    def schema(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "query": {
-                    "type": "string",
-                    "description": "The search query. Include company name and topic for best results.",
-                },
-                "count": {
-                    "type": "integer",
-                    "description": "Number of results to return (1-20). Default is 10.",
-                    "default": 10,
-                    "minimum": 1,
-                    "maximum": 20,
-                },
-                "freshness": {
-                    "type": "string",
-                    "description": "How recent the news should be. Options: 'past_day', 'past_week', 'past_month'.",
-                    "enum": ["past_day", "past_week", "past_month", ""],
-                },
+    schema = {
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "The search query. Include company name and topic for best results.",
             },
-            "required": ["query"],
-        }
+            "count": {
+                "type": "integer",
+                "description": "Number of results to return (1-20). Default is 10.",
+                "default": 10,
+                "minimum": 1,
+                "maximum": 20,
+            },
+            "freshness": {
+                "type": "string",
+                "description": "How recent the news should be. Options: 'past_day', 'past_week', 'past_month'.",
+                "enum": ["past_day", "past_week", "past_month", ""],
+            },
+        },
+        "required": ["query"],
+    }
     
     async def execute(
         self,
@@ -64,15 +72,7 @@ class NewsSearchTool(Tool):
         Returns:
             {
                 "query": str,
-                "results": [
-                    {
-                        "title": str,
-                        "url": str,
-                        "source": str,
-                        "published_date": str,
-                        "description": str,
-                    }
-                ],
+                "results": [NewsResult],
                 "total_results": int,
             }
         """
@@ -84,11 +84,7 @@ class NewsSearchTool(Tool):
                 "error": "Brave Search API key not configured",
             }
         
-        headers = {
-            "Accept": "application/json",
-            "Accept-Encoding": "gzip",
-            "X-Subscription-Token": settings.brave_search_api_key,
-        }
+        headers = {"X-Subscription-Token": settings.brave_search_api_key}
         
         params = {
             "q": query,
@@ -106,15 +102,13 @@ class NewsSearchTool(Tool):
             params["freshness"] = "pm"
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    BRAVE_NEWS_URL,
-                    headers=headers,
-                    params=params,
-                    timeout=10.0,
-                )
-                response.raise_for_status()
-                data = response.json()
+            response = await get_brave_client().get(
+                BRAVE_NEWS_URL,
+                headers=headers,
+                params=params,
+            )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
         
         except httpx.HTTPStatusError as e:
             return {
@@ -134,15 +128,16 @@ class NewsSearchTool(Tool):
         # Parse results
         news_results = data.get("results", [])
         
-        results = []
-        for item in news_results:
-            results.append({
-                "title": item.get("title", ""),
-                "url": item.get("url", ""),
-                "source": item.get("meta_url", {}).get("hostname", ""),
-                "published_date": item.get("age", ""),
-                "description": item.get("description", ""),
-            })
+        results = [
+            NewsResult(
+                title=item.get("title", ""),
+                url=item.get("url", ""),
+                source=item.get("meta_url", {}).get("hostname", ""),
+                published_date=item.get("age", ""),
+                description=item.get("description", ""),
+            )
+            for item in news_results
+        ]
         
         logger.info(
             "News search completed",
@@ -1,10 +1,13 @@
 """SEC EDGAR filings search tool."""
 
+import time
+from collections import OrderedDict
 import httpx
+import orjson
 import structlog
-from urllib.parse import quote
 
 from app.agents.tools.base import Tool
+from app.agents.tools.http_client import get_sec_client
 
 logger = structlog.get_logger()
 
@@ -15,44 +18,67 @@ EDGAR_BASE_URL = "https://www.sec.gov"
 # User-Agent required by SEC (include contact email)
 SEC_USER_AGENT = "ScoutBot/1.0 (contact@aquaregia.life)"
 
+_SEC_HEADERS = {
+    "User-Agent": SEC_USER_AGENT,
+    "Accept": "application/json",
+}
+
+_STRIP_DASHES = str.maketrans("", "", "-")
+
+# Parameters shared by every search; each call adds "q" and "forms"
+_BASE_PARAMS = {
+    "dateRange": "custom",
+    "startdt": "2020-01-01",  # Last ~5 years
+    "enddt": "2026-12-31",
+    "from": 0,
+    "size": 10,
+}
+
+# Lucene query clauses; the optional ones are appended with " AND "
+_COMPANY_CLAUSE = 'companyName:"{}"'
+_FORM_CLAUSE = ' AND formType:"{}"'
+_KEYWORDS_CLAUSE = ' AND "{}"'
+
+# EDGAR responses by (company_name, filing_type, keywords). Searches are
+# idempotent and subagents often repeat them within a research session.
+_EDGAR_CACHE: OrderedDict[tuple[str, str, str], tuple[float, dict]] = OrderedDict()
+EDGAR_CACHE_MAX_ENTRIES = 512
+EDGAR_CACHE_TTL_SECONDS = 600
+
 
 class SECFilingsTool(Tool):
     """Search SEC EDGAR filings for public company information."""
     
-    @property
-    def name(self) -> str:
-        return "sec_filings"
+    defer_loading = True
     
-    @property
-    def description(self) -> str:
-        return (
-            "Search SEC EDGAR filings for public companies. Returns 10-K (annual reports), "
-            "10-Q (quarterly reports), 8-K (current events), and other filings. "
-            "Useful for finding financial information, strategic priorities, executive commentary, "
-            "and material business events for publicly traded companies."
-        )
+    name = "sec_filings"
     
-    @property
-    def schema(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "company_name": {
-                    "type": "string",
-                    "description": "The company name to search for (e.g., 'Apple Inc', 'Microsoft').",
-                },
-                "filing_type": {
-                    "type": "string",
-                    "description": "Optional filing type filter: '10-K', '10-Q', '8-K', or leave empty for all.",
-                    "enum": ["10-K", "10-Q", "8-K", ""],
-                },
-                "keywords": {
-                    "type": "string",
-                    "description": "Optional keywords to search within filings (e.g., 'cloud migration', 'AI strategy').",
-                },
+    description = (
+        "Search SEC EDGAR filings for public companies. Returns 10-K (annual reports), "
+        "10-Q (quarterly reports), 8-K (current events), and other filings. "
+        "Useful for finding financial information, strategic priorities, executive commentary, "
+        "and material business events for publicly traded companies."
+    )
+    
+    schema = {
+        "type": "object",
+        "properties": {
+            "company_name": {
+                "type": "string",
+                "description": "The company name to search for (e.g., 'Apple Inc', 'Microsoft').",
             },
-            "required": ["company_name"],
-        }
+            "filing_type": {
+                "type": "string",
+                "description": "Optional filing type filter: '10-K', '10-Q', '8-K', or leave empty for all.",
+                "enum": ["10-K", "10-Q", "8-K", ""],
+            },
+            "keywords": {
+                "type": "string",
+                "description": "Optional keywords to search within filings (e.g., 'cloud migration', 'AI strategy').",
+            },
+        },
+        "required": ["company_name"],
+    }
     
     async def execute(
         self,
@@ -79,42 +105,8 @@ class SECFilingsTool(Tool):
                 "total_found": int,
             }
         """
-        headers = {
-            "User-Agent": SEC_USER_AGENT,
-            "Accept": "application/json",
-        }
-        
-        # Build search query
-        query_parts = [f'companyName:"{company_name}"']
-        
-        if filing_type:
-            query_parts.append(f'formType:"{filing_type}"')
-        
-        if keywords:
-            query_parts.append(f'"{keywords}"')
-        
-        query = " AND ".join(query_parts)
-        
-        params = {
-            "q": query,
-            "dateRange": "custom",
-            "startdt": "2020-01-01",  # Last ~5 years
-            "enddt": "2026-12-31",
-            "forms": filing_type if filing_type else "-0",  # -0 means all forms
-            "from": 0,
-            "size": 10,
-        }
-        
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    EDGAR_SEARCH_URL,
-                    headers=headers,
-                    params=params,
-                    timeout=15.0,
-                )
-                response.raise_for_status()
-                data = response.json()
+            data = await _edgar_search(company_name, filing_type, keywords)
         
         except httpx.HTTPStatusError as e:
             logger.warning("SEC search failed", status=e.response.status_code)
@@ -134,41 +126,9 @@ class SECFilingsTool(Tool):
             }
         
         # Parse results
-        hits = data.get("hits", {}).get("hits", [])
-        total = data.get("hits", {}).get("total", {}).get("value", 0)
-        
-        filings = []
-        for hit in hits:
-            source = hit.get("_source", {})
-            
-            # Build filing URL
-            accession = source.get("adsh", "").replace("-", "")
-            cik = source.get("ciks", [""])[0] if source.get("ciks") else ""
-            file_name = source.get("file_name", "")
-            
-            if accession and cik:
-                url = f"{EDGAR_BASE_URL}/Archives/edgar/data/{cik}/{accession}/{file_name}"
-            else:
-                url = ""
-            
-            # Extract excerpt if available
-            excerpt = None
-            highlights = hit.get("highlight", {})
-            if highlights:
-                # Get first highlight
-                for field, excerpts in highlights.items():
-                    if excerpts:
-                        excerpt = excerpts[0][:500]  # Limit excerpt length
-                        break
-            
-            filings.append({
-                "filing_type": source.get("form", ""),
-                "filed_date": source.get("file_date", ""),
-                "company": source.get("display_names", [company_name])[0],
-                "description": source.get("file_description", ""),
-                "url": url,
-                "excerpt": excerpt,
-            })
+        hits_obj = data.get("hits", {})
+        total = hits_obj.get("total", {}).get("value", 0)
+        filings = [_build_filing(hit, company_name) for hit in hits_obj.get("hits", [])]
         
         logger.info(
             "SEC filings search completed",
@@ -182,3 +142,64 @@ class SECFilingsTool(Tool):
             "filings": filings,
             "total_found": total,
         }
+
+
+def _build_filing(hit: dict, company_name: str) -> dict:
+    """Build a filing result from one EDGAR search hit."""
+    source = hit.get("_source", {})
+    
+    # Build filing URL
+    accession = source.get("adsh", "").translate(_STRIP_DASHES)
+    cik = (source.get("ciks") or ("",))[0]
+    if accession and cik:
+        url = f"{EDGAR_BASE_URL}/Archives/edgar/data/{cik}/{accession}/{source.get('file_name', '')}"
+    else:
+        url = ""
+    
+    # First non-empty highlight, if any, as the excerpt
+    excerpt = next(
+        (excerpts[0][:500] for excerpts in hit.get("highlight", {}).values() if excerpts),
+        None,
+    )
+    
+    return {
+        "filing_type": source.get("form", ""),
+        "filed_date": source.get("file_date", ""),
+        "company": (source.get("display_names") or (company_name,))[0],
+        "description": source.get("file_description", ""),
+        "url": url,
+        "excerpt": excerpt,
+    }
+
+
+async def _edgar_search(company_name: str, filing_type: str, keywords: str) -> dict:
+    """Run an EDGAR full-text search, reusing a recent response for the same query."""
+    key = (company_name, filing_type, keywords)
+    entry = _EDGAR_CACHE.get(key)
+    if entry is not None:
+        expires_at, data = entry
+        if expires_at >= time.monotonic():
+            _EDGAR_CACHE.move_to_end(key)
+            return data
+        del _EDGAR_CACHE[key]
+    
+    query = _COMPANY_CLAUSE.format(company_name)
+    if filing_type:
+        query += _FORM_CLAUSE.format(filing_type)
+    if keywords:
+        query += _KEYWORDS_CLAUSE.format(keywords)
+    
+    response = await get_sec_client().get(
+        EDGAR_SEARCH_URL,
+        headers=_SEC_HEADERS,
+        params={**_BASE_PARAMS, "q": query, "forms": filing_type or "-0"},  # -0 means all forms
+    )
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    
+    # Only successful responses are cached; results are read-only downstream
+    _EDGAR_CACHE[key] = (time.monotonic() + EDGAR_CACHE_TTL_SECONDS, data)
+    _EDGAR_CACHE.move_to_end(key)
+    while len(_EDGAR_CACHE) > EDGAR_CACHE_MAX_ENTRIES:
+        _EDGAR_CACHE.popitem(last=False)
+    return data
@@ -1,12 +1,16 @@
-"""Web scraping tool using httpx and BeautifulSoup."""
+"""Web scraping tool using httpx and lxml."""
 
+import asyncio
 import re
+from functools import lru_cache
 import httpx
+import lxml.html
 import structlog
-from bs4 import BeautifulSoup
+from lxml import etree
 from urllib.parse import urlparse
 
 from app.agents.tools.base import Tool
+from app.agents.tools.http_client import get_scrape_client
 
 logger = structlog.get_logger()
 
@@ -25,40 +29,86 @@ REMOVE_CLASS_PATTERNS = [
 ]
 
 MAX_CONTENT_LENGTH = 8000  # Characters
+MAX_HEADINGS = 20
+MAX_CONCURRENT_SCRAPES = 10  # Per execute_many call
+
+# Compiled once - the class patterns as a single alternation so each element
+# is tested with one search instead of one per pattern
+_REMOVE_CLASS_RE = re.compile("|".join(f"(?:{p})" for p in REMOVE_CLASS_PATTERNS), re.IGNORECASE)
+_CONTENT_AREA_RE = re.compile(r"content|main|article", re.IGNORECASE)
+
+# Elements whose text is kept as a separate block of content
+_TEXT_BLOCK_TAGS = frozenset({"p", "li", "td", "th", "div"})
+
+# Raw HTML read per page; anything past this is dropped and the partial
+# document is parsed as-is (lxml recovers unclosed tags)
+MAX_HTML_BYTES = 2 * 1024 * 1024
+_READ_CHUNK_SIZE = 64 * 1024
+
+# A charset declared in a <meta> tag near the top of the document
+_META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset=["']?([\w.:-]+)""", re.IGNORECASE)
+_META_SNIFF_BYTES = 2048
+
+# All REMOVE_TAGS elements in one document-order pass
+_REMOVE_TAGS_XPATH = etree.XPath(" | ".join(f"//{tag}" for tag in REMOVE_TAGS))
+
+
+def _sniff_meta_charset(head: bytes) -> str | None:
+    """Find a <meta> charset declaration in the first bytes of a page."""
+    match = _META_CHARSET_RE.search(head, 0, _META_SNIFF_BYTES)
+    return match.group(1).decode("ascii") if match else None
+
+
+def _new_html_parser(encoding: str | None) -> lxml.html.HTMLParser:
+    """
+    Create a feed parser for one page (feed() keeps per-document state across awaits).
+    
+    Comments and processing instructions are dropped at parse time (their
+    tails are kept). Unknown encodings fall back to UTF-8.
+    """
+    try:
+        return lxml.html.HTMLParser(encoding=encoding or "utf-8", remove_comments=True, remove_pis=True)
+    except LookupError:
+        return lxml.html.HTMLParser(encoding="utf-8", remove_comments=True, remove_pis=True)
+
+
+@lru_cache(maxsize=4096)
+def _is_removable_class(class_attr: str) -> bool:
+    """
+    Check a class attribute against the ad/tracking patterns.
+    
+    Memoized: pages repeat the same class strings across many elements (and
+    sites share framework class names), so most lookups skip the regex.
+    """
+    return _REMOVE_CLASS_RE.search(class_attr) is not None
 
 
 class WebScrapeTool(Tool):
     """Fetch and extract readable content from a web page."""
     
-    @property
-    def name(self) -> str:
-        return "web_scrape"
+    name = "web_scrape"
     
-    @property
-    def description(self) -> str:
-        return (
-            "Fetch and extract the main readable content from a specific web page. "
-            "Use this after web_search to get detailed information from promising URLs. "
-            "Returns the page title, main text content, headings, and meta description."
-        )
+    description = (
+        "Fetch and extract the main readable content from a specific web page. "
+        "Use this after web_search to get detailed information from promising URLs. "
+        "Returns the page title, main text content, headings, and meta description."
+    )
     
-    @property
-    def schema(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "url": {
-                    "type": "string",
-                    "description": "The full URL of the page to scrape.",
-                },
-                "extract_headings": {
-                    "type": "boolean",
-                    "description": "Whether to extract section headings. Default is true.",
-                    "default": True,
-                },
+    schema = {
+        "type": "object",
+        "properties": {
+            "url": {
+                "type": "string",
+                "description": "The full URL of the page to scrape.",
             },
-            "required": ["url"],
-        }
+            "extract_headings": {
+                "type": "boolean",
+                "description": "Whether to extract section headings. Default is true.",
+                "default": True,
+            },
+        },
+        "required": ["url"],
+    }
     
     async def execute(self, url: str, extract_headings: bool = True) -> dict:
         """
@@ -90,8 +140,9 @@ class WebScrapeTool(Tool):
         }
         
         try:
-            async with httpx.AsyncClient(follow_redirects=True) as client:
-                response = await client.get(url, headers=headers, timeout=15.0)
+            # The body is fed to lxml chunk by chunk as it arrives, so parsing
+            # overlaps the download and no decoded copy of the page is kept
+            async with get_scrape_client().stream("GET", url, headers=headers) as response:
                 response.raise_for_status()
                 
                 # Check content type
@@ -102,7 +153,18 @@ class WebScrapeTool(Tool):
                         "error": f"Not an HTML page: {content_type}",
                     }
                 
-                html = response.text
+                parser = None
+                bytes_read = 0
+                async for chunk in response.aiter_bytes(_READ_CHUNK_SIZE):
+                    if parser is None:
+                        # Header charset, else an early <meta charset>, else UTF-8
+                        parser = _new_html_parser(
+                            response.charset_encoding or _sniff_meta_charset(chunk)
+                        )
+                    parser.feed(chunk)
+                    bytes_read += len(chunk)
+                    if bytes_read >= MAX_HTML_BYTES:
+                        break
         
         except httpx.TimeoutException:
             return {"url": url, "error": "Request timed out"}
@@ -111,75 +173,66 @@ class WebScrapeTool(Tool):
         except Exception as e:
             return {"url": url, "error": str(e)}
         
-        # Parse HTML
-        soup = BeautifulSoup(html, "lxml")
+        if parser is None:
+            return {"url": url, "error": "Could not parse HTML: document is empty"}
+        
+        # lxml builds the tree in C, unlike BeautifulSoup's Python traversal
+        try:
+            tree = parser.close()
+        except etree.XMLSyntaxError as e:
+            return {"url": url, "error": f"Could not parse HTML: {e}"}
+        if tree is None:
+            return {"url": url, "error": "Could not parse HTML: document is empty"}
         
         # Extract title
         title = ""
-        if soup.title:
-            title = soup.title.get_text(strip=True)
+        title_el = tree.find(".//title")
+        if title_el is not None:
+            title = title_el.text_content().strip()
         
         # Extract meta description
         meta_desc = None
-        meta_tag = soup.find("meta", attrs={"name": "description"})
-        if meta_tag:
-            meta_desc = meta_tag.get("content", "").strip()
+        meta_content = tree.xpath("//meta[@name='description']/@content")
+        if meta_content:
+            meta_desc = meta_content[0].strip()
         
-        # Remove unwanted elements
-        for tag in REMOVE_TAGS:
-            for element in soup.find_all(tag):
-                element.decompose()
+        # Remove unwanted elements (drop_tree keeps the text that follows each one)
+        for element in _REMOVE_TAGS_XPATH(tree):
+            element.drop_tree()
         
-        # Remove elements with ad-related classes
-        for pattern in REMOVE_CLASS_PATTERNS:
-            regex = re.compile(pattern, re.IGNORECASE)
-            for element in soup.find_all(class_=regex):
-                element.decompose()
+        # Remove elements with ad-related classes (the root can't be dropped)
+        for element in tree.xpath("//*[@class]"):
+            if _is_removable_class(element.get("class")) and element.getparent() is not None:
+                element.drop_tree()
         
         # Extract headings
         headings = None
         if extract_headings:
             headings = []
-            for h in soup.find_all(["h1", "h2", "h3"]):
-                text = h.get_text(strip=True)
+            for h in tree.iter("h1", "h2", "h3"):
+                text = h.text_content().strip()
                 if text and len(text) < 200:
                     headings.append(text)
-            headings = headings[:20]  # Limit to 20 headings
+                    if len(headings) >= MAX_HEADINGS:
+                        break
         
         # Extract main content
-        # Try to find main content area
-        main_content = (
-            soup.find("main") or 
-            soup.find("article") or 
-            soup.find(id=re.compile(r"content|main|article", re.I)) or
-            soup.find(class_=re.compile(r"content|main|article", re.I)) or
-            soup.body
-        )
+        main_content = _find_main_content(tree)
         
-        if main_content:
-            # Get text with some structure
-            text_parts = []
-            for element in main_content.find_all(["p", "li", "td", "th", "div"]):
-                text = element.get_text(separator=" ", strip=True)
-                if text and len(text) > 20:  # Skip tiny fragments
-                    text_parts.append(text)
-            
-            content = "\n\n".join(text_parts)
+        if main_content is not None:
+            # Blocks come back whitespace-normalized, so no clean-up pass is needed
+            content = " ".join(_extract_text_blocks(main_content))
         else:
-            content = soup.get_text(separator=" ", strip=True)
-        
-        # Clean up whitespace
-        content = re.sub(r"\s+", " ", content).strip()
+            content = " ".join(tree.text_content().split())
         
         # Truncate if needed
         truncated = False
         if len(content) > MAX_CONTENT_LENGTH:
-            # Try to truncate at sentence boundary
+            # Try to truncate at a sentence boundary in the last 20% of the budget,
+            # searching only that window
             truncated = True
-            content = content[:MAX_CONTENT_LENGTH]
-            last_period = content.rfind(".")
-            if last_period > MAX_CONTENT_LENGTH * 0.8:
-                content = content[:last_period + 1]
+            last_period = content.rfind(".", int(MAX_CONTENT_LENGTH * 0.8) + 1, MAX_CONTENT_LENGTH)
+            content = content[:last_period + 1 if last_period != -1 else MAX_CONTENT_LENGTH]
         
         logger.info(
             "Web scrape completed",
@@ -197,3 +250,70 @@ class WebScrapeTool(Tool):
             "content_length": len(content),
             "truncated": truncated,
         }
+    
+    async def execute_many(self, urls: list[str], extract_headings: bool = True) -> list[dict]:
+        """
+        Scrape several pages concurrently over the shared client.
+        
+        At most MAX_CONCURRENT_SCRAPES fetches are in flight at once. Results
+        keep the order of urls; a scrape that raises becomes an error dict like
+        the ones execute returns.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES)
+        
+        async def scrape(url: str) -> dict:
+            async with semaphore:
+                return await self.execute(url, extract_headings=extract_headings)
+        
+        results = await asyncio.gather(*(scrape(url) for url in urls), return_exceptions=True)
+        return [
+            {"url": url, "error": str(result)} if isinstance(result, Exception) else result
+            for url, result in zip(urls, results)
+        ]
+
+
+def _find_main_content(tree: lxml.html.HtmlElement) -> lxml.html.HtmlElement | None:
+    """Find the main content area: <main>, <article>, a content-like id or class, else <body>."""
+    # Explicit None checks - lxml elements without children are falsy
+    for tag in ("main", "article"):
+        element = tree.find(f".//{tag}")
+        if element is not None:
+            return element
+    
+    for attr in ("id", "class"):
+        for element in tree.xpath(f"//*[@{attr}]"):
+            if _CONTENT_AREA_RE.search(element.get(attr)):
+                return element
+    
+    return tree.find(".//body")
+
+
+def _extract_text_blocks(root: lxml.html.HtmlElement) -> list[str]:
+    """
+    Collect the text of each block element under root in a single walk.
+    
+    Text is attributed to its innermost enclosing block, so nested blocks
+    (div > div > p) don't repeat their children's text. Blocks keep the order
+    in which they open; tiny fragments are skipped.
+    """
+    blocks: list[list[str]] = [[]]  # Text pieces per block; root's own text first
+    open_blocks = [0]  # Indexes into blocks, innermost last
+    
+    for event, element in etree.iterwalk(root, events=("start", "end")):
+        is_block = element is not root and element.tag in _TEXT_BLOCK_TAGS
+        if event == "start":
+            if is_block:
+                open_blocks.append(len(blocks))
+                blocks.append([])
+            if element.text:
+                blocks[open_blocks[-1]].append(element.text)
+        else:
+            if element is root:
+                break
+            if is_block:
+                open_blocks.pop()
+            if element.tail:
+                blocks[open_blocks[-1]].append(element.tail)
+    
+    texts = (" ".join(" ".join(pieces).split()) for pieces in blocks)
+    return [text for text in texts if len(text) > 20]
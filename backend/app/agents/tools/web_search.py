@@ -1,9 +1,10 @@
 """Web search tool using Brave Search API."""
 
-import httpx
+import orjson
 import structlog
 
 from app.agents.tools.base import Tool
+from app.agents.tools.http_client import get_brave_client
 from app.config import get_settings
 
 logger = structlog.get_logger()
@@ -15,37 +16,31 @@ BRAVE_SEARCH_URL = "https://api.search.brave.com/res/v1/web/search"
 class WebSearchTool(Tool):
     """Search the web using Brave Search API."""
     
-    @property
-    def name(self) -> str:
-        return "web_search"
+    name = "web_search"
     
-    @property
-    def description(self) -> str:
-        return (
-            "Search the web for information about companies, people, technologies, "
-            "and topics. Returns a list of relevant web pages with titles, URLs, "
-            "and descriptions. Use this to discover relevant sources before scraping."
-        )
+    description = (
+        "Search the web for information about companies, people, technologies, "
+        "and topics. Returns a list of relevant web pages with titles, URLs, "
+        "and descriptions. Use this to discover relevant sources before scraping."
+    )
     
-    @property
-    def schema(self) -> dict:
-        return {
-            "type": "object",
-            "properties": {
-                "query": {
-                    "type": "string",
-                    "description": "The search query. Be specific and include company names, technologies, or topics.",
-                },
-                "count": {
-                    "type": "integer",
-                    "description": "Number of results to return (1-20). Default is 10.",
-                    "default": 10,
-                    "minimum": 1,
-                    "maximum": 20,
-                },
+    schema = {
+        "type": "object",
+        "properties": {
+            "query": {
+                "type": "string",
+                "description": "The search query. Be specific and include company names, technologies, or topics.",
             },
-            "required": ["query"],
-        }
+            "count": {
+                "type": "integer",
+                "description": "Number of results to return (1-20). Default is 10.",
+                "default": 10,
+                "minimum": 1,
+                "maximum": 20,
+            },
+        },
+        "required": ["query"],
+    }
     
     async def execute(self, query: str, count: int = 10) -> dict:
         """
@@ -73,11 +68,7 @@ class WebSearchTool(Tool):
                 "error": "Brave Search API key not configured",
             }
         
-        headers = {
-            "Accept": "application/json",
-            "Accept-Encoding": "gzip",
-            "X-Subscription-Token": settings.brave_search_api_key,
-        }
+        headers = {"X-Subscription-Token": settings.brave_search_api_key}
         
         params = {
             "q": query,
@@ -86,15 +77,13 @@ class WebSearchTool(Tool):
             "search_lang": "en",
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                BRAVE_SEARCH_URL,
-                headers=headers,
-                params=params,
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await get_brave_client().get(
+            BRAVE_SEARCH_URL,
+            headers=headers,
+            params=params,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
         
         # Parse results
         web_results = data.get("web", {}).get("results", [])
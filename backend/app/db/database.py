@@ -1,7 +1,10 @@
 """Async SQLAlchemy database configuration."""
 
+import random
 from typing import AsyncGenerator
+import orjson
 import structlog
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -14,13 +17,33 @@ from app.config import get_settings
 logger = structlog.get_logger()
 settings = get_settings()
 
-# Create async engine
+
+def _json_serializer(value) -> str:
+    """Serialize JSONB values with orjson (str keys like the stdlib encoder produces)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Create async engine. Connections through the Cloud SQL proxy are expensive to
+# open, so keep a larger pool, recycle before the proxy drops idle ones, and
+# reuse the most recently returned connection (LIFO) so the idle tail can expire.
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
     pool_pre_ping=True,
-    pool_size=5,
+    pool_size=settings.db_pool_size,
     max_overflow=10,
+    pool_recycle=1800,
+    pool_use_lifo=True,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    connect_args={
+        # Short OLTP queries don't benefit from JIT compilation
+        "server_settings": {"jit": "off"},
+        # asyncpg's own cache and SQLAlchemy's adapter-level cache; both must be
+        # off behind PgBouncer, which can't track per-connection prepared statements
+        "statement_cache_size": settings.db_statement_cache_size,
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+    },
 )
 
 # Create session factory
@@ -42,21 +65,24 @@ async def init_db() -> None:
     import asyncio
     
     max_retries = 10
-    retry_delay = 2  # seconds
     
     for attempt in range(max_retries):
         try:
             async with engine.begin() as conn:
                 # Just verify connection, don't create tables (use Alembic)
-                await conn.run_sync(lambda _: None)
+                await conn.execute(text("SELECT 1"))
             logger.info("Database connection established", attempt=attempt + 1)
             return
         except Exception as e:
             if attempt < max_retries - 1:
+                # Exponential backoff (0.5s, 1s, 2s, ... capped at 30s) so an early
+                # proxy is picked up quickly; jitter spreads out replicas
+                retry_delay = min(30.0, 0.5 * 2 ** attempt) + random.uniform(0, 0.5)
                 logger.warning(
                     "Database connection failed, retrying...",
                     attempt=attempt + 1,
                     max_retries=max_retries,
+                    retry_delay=round(retry_delay, 2),
                     error=str(e)
                 )
                 await asyncio.sleep(retry_delay)
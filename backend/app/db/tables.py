@@ -3,11 +3,14 @@
 from datetime import datetime
 from typing import Optional
 from enum import Enum as PyEnum
+import os
+import secrets
+import time
 import uuid
 
 from sqlalchemy import (
     Column, String, Text, Boolean, Integer, Float,
-    ForeignKey, DateTime, Enum, Index,
+    ForeignKey, DateTime, Enum, Index, func,
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship, Mapped, mapped_column
@@ -15,6 +18,40 @@ from sqlalchemy.orm import relationship, Mapped, mapped_column
 from app.db.database import Base
 
 
+_UUID7_VERSION_VARIANT = 0x7 << 76 | 0b10 << 62  # version 7, RFC 4122 variant
+_MASK_62 = (1 << 62) - 1
+
+
+def _uuid7_from(unix_ms: int, rand: int) -> uuid.UUID:
+    """Assemble a UUIDv7 from a millisecond timestamp and 74 random bits."""
+    return uuid.UUID(int=(
+        (unix_ms & 0xFFFF_FFFF_FFFF) << 80
+        | _UUID7_VERSION_VARIANT
+        | (rand >> 62 & 0xFFF) << 64
+        | rand & _MASK_62
+    ))
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUIDv7 (RFC 9562) for primary keys.
+    
+    The high 48 bits are the Unix time in milliseconds, so new rows land at the
+    right-hand edge of the B-tree index instead of at random pages.
+    """
+    return _uuid7_from(time.time_ns() // 1_000_000, secrets.randbits(74))
+
+
+def uuid7_batch(n: int) -> list[uuid.UUID]:
+    """Generate n UUIDv7s from one timestamp read and one urandom call."""
+    unix_ms = time.time_ns() // 1_000_000
+    buf = os.urandom(10 * n)
+    return [
+        _uuid7_from(unix_ms, int.from_bytes(buf[i:i + 10], "big"))
+        for i in range(0, 10 * n, 10)
+    ]
+
+
 # Enums
 class ResearchStatus(str, PyEnum):
     """Status of a research session."""
@@ -58,9 +95,9 @@ class Team(Base):
     """Team/organization that shares research profiles."""
     __tablename__ = "teams"
     
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
     users: Mapped[list["User"]] = relationship("User", back_populates="team")
@@ -72,18 +109,20 @@ class User(Base):
     """User account."""
     __tablename__ = "users"
     
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     team_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("teams.id"), nullable=False)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
-    email: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
     password_hash: Mapped[str] = mapped_column(String(255), nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
     team: Mapped["Team"] = relationship("Team", back_populates="users")
     
     __table_args__ = (
-        Index("ix_users_email", "email"),
+        # Case-insensitive uniqueness; also the index for login lookups and the
+        # ON CONFLICT target at registration
+        Index("ux_users_email_lower", func.lower(email), unique=True),
     )
 
 
@@ -91,20 +130,38 @@ class CompanyProfile(Base):
     """Target company being researched."""
     __tablename__ = "company_profiles"
     
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     team_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("teams.id"), nullable=False)
     company_name: Mapped[str] = mapped_column(String(255), nullable=False)
     industry: Mapped[Optional[str]] = mapped_column(String(255))
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     
     # Relationships
     team: Mapped["Team"] = relationship("Team", back_populates="company_profiles")
     initiatives: Mapped[list["Initiative"]] = relationship("Initiative", back_populates="company_profile")
     
     __table_args__ = (
-        Index("ix_company_profiles_team", "team_id"),
+        # Only live (not soft-deleted) companies are ever listed or looked up,
+        # so the team index skips deleted rows; (updated_at, id) is the list's
+        # keyset order, scanned backwards
+        Index(
+            "ix_company_profiles_live_team",
+            "team_id",
+            "updated_at",
+            "id",
+            postgresql_where=deleted_at.is_(None),
+        ),
+        # One live profile per company name in a team; the ON CONFLICT target
+        # when research starts
+        Index(
+            "ux_company_profiles_live_team_name",
+            "team_id",
+            "company_name",
+            unique=True,
+            postgresql_where=deleted_at.is_(None),
+        ),
     )
 
 
@@ -112,13 +169,13 @@ class Initiative(Base):
     """A specific project or initiative being researched for a company."""
     __tablename__ = "initiatives"
     
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     company_profile_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("company_profiles.id"), nullable=False)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text)
     discovered_by_agent: Mapped[bool] = mapped_column(Boolean, default=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     # Relationships
     company_profile: Mapped["CompanyProfile"] = relationship("CompanyProfile", back_populates="initiatives")
@@ -126,37 +183,48 @@ class Initiative(Base):
     findings: Mapped[list["ResearchFinding"]] = relationship("ResearchFinding", back_populates="initiative")
     synthesized_intelligence: Mapped[list["SynthesizedIntelligence"]] = relationship("SynthesizedIntelligence", back_populates="initiative")
     dashboard_content: Mapped[Optional["DashboardContent"]] = relationship("DashboardContent", back_populates="initiative", uselist=False)
+    
+    __table_args__ = (
+        # Initiatives of a company - loaded with company reads, listed latest
+        # first by the (updated_at, id) keyset
+        Index("ix_initiatives_company_updated", "company_profile_id", "updated_at", "id"),
+    )
 
 
 class ResearchSession(Base):
     """A research session - one run of the agent loop."""
     __tablename__ = "research_sessions"
     
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     initiative_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("initiatives.id"), nullable=False)
     triggered_by: Mapped[str] = mapped_column(String(100), nullable=False)  # "user", "follow_up", "refresh", or user_id
     status: Mapped[ResearchStatus] = mapped_column(Enum(ResearchStatus), default=ResearchStatus.PENDING)
     follow_up_question: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
-    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Relationships
     initiative: Mapped["Initiative"] = relationship("Initiative", back_populates="research_sessions")
     cycles: Mapped[list["ResearchCycle"]] = relationship("ResearchCycle", back_populates="session")
+    
+    __table_args__ = (
+        # Sessions for an initiative, latest first (scanned backwards)
+        Index("ix_research_sessions_initiative_started", "initiative_id", "started_at"),
+    )
 
 
 class ResearchCycle(Base):
     """A single cycle of the research loop."""
     __tablename__ = "research_cycles"
     
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     research_session_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("research_sessions.id"), nullable=False)
     cycle_number: Mapped[int] = mapped_column(Integer, nullable=False)
     prime_agent_plan: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
     confidence_assessment: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
-    started_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     
     # Relationships
     session: Mapped["ResearchSession"] = relationship("ResearchSession", back_populates="cycles")
@@ -167,7 +235,7 @@ class ResearchPath(Base):
     """A research sub-agent assignment and its execution."""
     __tablename__ = "research_paths"
     
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     research_cycle_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("research_cycles.id"), nullable=False)
     assignment_id: Mapped[str] = mapped_column(String(50), nullable=False)
     topic: Mapped[str] = mapped_column(String(500), nullable=False)
@@ -175,19 +243,24 @@ class ResearchPath(Base):
     status: Mapped[PathStatus] = mapped_column(Enum(PathStatus), default=PathStatus.ACTIVE)
     reasoning: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     tools_used: Mapped[int] = mapped_column(Integer, default=0)
-    started_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     
     # Relationships
     cycle: Mapped["ResearchCycle"] = relationship("ResearchCycle", back_populates="paths")
     findings: Mapped[list["ResearchFinding"]] = relationship("ResearchFinding", back_populates="path")
+    
+    __table_args__ = (
+        # Path lookup by cycle and agent assignment when recording results
+        Index("ix_research_paths_cycle_assignment", "research_cycle_id", "assignment_id"),
+    )
 
 
 class ResearchFinding(Base):
     """A single finding from a research sub-agent."""
     __tablename__ = "research_findings"
     
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     research_path_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("research_paths.id"), nullable=False)
     initiative_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("initiatives.id"), nullable=False)
     category: Mapped[FindingCategory] = mapped_column(Enum(FindingCategory), nullable=False)
@@ -195,15 +268,25 @@ class ResearchFinding(Base):
     source_url: Mapped[Optional[str]] = mapped_column(String(2048), nullable=True)
     source_type: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     confidence_score: Mapped[float] = mapped_column(Float, default=0.5)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     
     # Relationships
     path: Mapped["ResearchPath"] = relationship("ResearchPath", back_populates="findings")
     initiative: Mapped["Initiative"] = relationship("Initiative", back_populates="findings")
     
     __table_args__ = (
-        Index("ix_research_findings_initiative", "initiative_id"),
-        Index("ix_research_findings_category", "category"),
+        # Findings for an initiative by category, in time order; also serves
+        # initiative-only lookups. confidence_score is carried for index-only scans.
+        Index(
+            "ix_research_findings_initiative_category",
+            "initiative_id", "category", "created_at",
+            postgresql_include=["confidence_score"],
+        ),
+        # Containment (@>) filters on finding content
+        Index(
+            "ix_research_findings_content_gin", "content",
+            postgresql_using="gin", postgresql_ops={"content": "jsonb_path_ops"},
+        ),
     )
 
 
@@ -211,29 +294,36 @@ class SynthesizedIntelligence(Base):
     """Merged and categorized intelligence for an initiative."""
     __tablename__ = "synthesized_intelligence"
     
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     initiative_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("initiatives.id"), nullable=False)
     category: Mapped[FindingCategory] = mapped_column(Enum(FindingCategory), nullable=False)
     structured_content: Mapped[dict] = mapped_column(JSONB, nullable=False)
     confidence_score: Mapped[float] = mapped_column(Float, default=0.0)
     last_updated_cycle_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     # Relationships
     initiative: Mapped["Initiative"] = relationship("Initiative", back_populates="synthesized_intelligence")
+    
+    __table_args__ = (
+        Index(
+            "ix_synthesized_intelligence_content_gin", "structured_content",
+            postgresql_using="gin", postgresql_ops={"structured_content": "jsonb_path_ops"},
+        ),
+    )
 
 
 class DashboardContent(Base):
     """Presentation-ready content for the dashboard."""
     __tablename__ = "dashboard_content"
     
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     initiative_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("initiatives.id"), nullable=False, unique=True)
     content: Mapped[dict] = mapped_column(JSONB, nullable=False)
     portfolio_recommendations: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     # Relationships
     initiative: Mapped["Initiative"] = relationship("Initiative", back_populates="dashboard_content")
@@ -243,13 +333,22 @@ class PortfolioItem(Base):
     """A vendor partnership or capability in the team's portfolio."""
     __tablename__ = "portfolio_items"
     
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     team_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("teams.id"), nullable=False)
     vendor_name: Mapped[str] = mapped_column(String(255), nullable=False)
     partnership_level: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     capabilities: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     # Relationships
     team: Mapped["Team"] = relationship("Team", back_populates="portfolio_items")
+    
+    __table_args__ = (
+        # Team portfolio listing, already in vendor_name order
+        Index("ix_portfolio_items_team_vendor", "team_id", "vendor_name"),
+        Index(
+            "ix_portfolio_items_capabilities_gin", "capabilities",
+            postgresql_using="gin", postgresql_ops={"capabilities": "jsonb_path_ops"},
+        ),
+    )
@@ -1,26 +1,34 @@
 """FastAPI application entry point."""
 
+import orjson
 import structlog
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import get_settings
 from app.db.database import init_db, close_db
+from app.agents.tools.http_client import close_http_clients
+
+settings = get_settings()
+
+# Configure structured logging. Nothing logs with stack_info, so the stack
+# renderer only stays in development; format_exc_info is needed for exc_info=True
+_LOG_PROCESSORS = [
+    structlog.stdlib.filter_by_level,
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.PositionalArgumentsFormatter(),
+    structlog.processors.TimeStamper(fmt="iso"),
+    *([structlog.processors.StackInfoRenderer()] if settings.environment == "development" else []),
+    structlog.processors.format_exc_info,
+    structlog.processors.UnicodeDecoder(),
+    structlog.processors.JSONRenderer(),
+]
 
-# Configure structured logging
 structlog.configure(
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer(),
-    ],
+    processors=_LOG_PROCESSORS,
     wrapper_class=structlog.stdlib.BoundLogger,
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
@@ -28,7 +36,6 @@ structlog.configure(
 )
 
 logger = structlog.get_logger()
-settings = get_settings()
 
 
 @asynccontextmanager
@@ -37,6 +44,7 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Scout", environment=settings.environment)
     await init_db()
     yield
+    await close_http_clients()
     await close_db()
     logger.info("Scout shutdown complete")
 
@@ -46,6 +54,7 @@ app = FastAPI(
     description="Agentic Sales Intelligence Platform",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # orjson writes bytes directly; several times faster than json
 )
 
 # CORS middleware
@@ -59,30 +68,38 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 
+# Probe bodies never change for the life of the process, so they are
+# encoded once instead of per request
+_HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "app": settings.app_name,
+    "environment": settings.environment,
+})
+_READY_BODY = orjson.dumps({
+    "status": "ready",
+    "checks": {
+        "database": "ok",
+        "vertex_ai": "ok",
+    }
+})
+
+
 @app.get("/api/v1/health")
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "app": settings.app_name,
-        "environment": settings.environment,
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/api/v1/health/ready")
 async def readiness_check():
     """Readiness check - verifies dependencies."""
-    # TODO: Check database connection, Vertex AI access
-    return {
-        "status": "ready",
-        "checks": {
-            "database": "ok",
-            "vertex_ai": "ok",
-        }
-    }
+    # TODO: Check database connection, Vertex AI access - once these run, only
+    # cache the all-green body and rebuild it when a check fails
+    return Response(content=_READY_BODY, media_type="application/json")
 
 
 # Import and include routers
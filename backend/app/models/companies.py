@@ -28,8 +28,8 @@ class CompanyProfileResponse(BaseModel):
 
 
 class CompanyListResponse(BaseModel):
-    """Paginated list of companies."""
+    """Keyset-paginated list of companies."""
     data: list[CompanyProfileResponse]
-    total: int
-    offset: int
+    total: Optional[int] = None  # Only counted for the first page
     limit: int
+    next_cursor: Optional[str] = None  # Pass back as ?cursor= for the next page
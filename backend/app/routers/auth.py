@@ -1,14 +1,19 @@
 """Auth API endpoints (placeholder implementation)."""
 
-import uuid
+import asyncio
+import base64
 import hashlib
-import secrets
+import hmac
 from datetime import datetime, timezone, timedelta
 from fastapi import APIRouter, HTTPException, Depends, Header
+from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+import bcrypt
 import structlog
 
+from app.config import get_settings
 from app.db.database import get_db
 from app.db import tables
 from app.models.auth import (
@@ -19,21 +24,59 @@ from app.models.auth import (
 )
 
 logger = structlog.get_logger()
+settings = get_settings()
 router = APIRouter()
 
-# Simple token store (in production, use Redis or JWT)
-# Format: {token: user_id}
-_token_store: dict[str, str] = {}
+# Login lookup built once; each request only binds the (lowercased) email
+_USER_BY_EMAIL = select(tables.User).where(func.lower(tables.User.email) == bindparam("email"))
+
+_BCRYPT_ROUNDS = 12
+
+
+def _prehash(password: str) -> bytes:
+    """
+    Reduce a password to a fixed 44-byte bcrypt input.
+
+    bcrypt only reads the first 72 bytes; a BLAKE2b digest keeps long
+    passwords fully significant, and base64 keeps NUL bytes out.
+    """
+    return base64.b64encode(hashlib.blake2b(password.encode(), digest_size=32).digest())
 
 
 def _hash_password(password: str) -> str:
-    """Simple password hashing (use bcrypt in production)."""
-    return hashlib.sha256(password.encode()).hexdigest()
+    """Hash a password with bcrypt (CPU-bound - call via asyncio.to_thread)."""
+    return bcrypt.hashpw(_prehash(password), bcrypt.gensalt(_BCRYPT_ROUNDS)).decode()
+
+
+def _is_legacy_hash(password_hash: str) -> bool:
+    """Check for an unsalted SHA-256 hex digest from the placeholder implementation."""
+    return not password_hash.startswith("$2")
+
 
+def _verify_password(password: str, password_hash: str) -> bool:
+    """Check a password against a bcrypt or legacy SHA-256 hash (call via asyncio.to_thread)."""
+    if _is_legacy_hash(password_hash):
+        return hmac.compare_digest(password_hash, hashlib.sha256(password.encode()).hexdigest())
+    return bcrypt.checkpw(_prehash(password), password_hash.encode())
 
-def _generate_token() -> str:
-    """Generate a secure token."""
-    return secrets.token_urlsafe(32)
+
+def _generate_token(user: UserResponse) -> str:
+    """
+    Issue a signed JWT carrying the user's profile claims.
+
+    Tokens are stateless, so they survive restarts, work across replicas, and
+    /me can answer from the claims without a database lookup.
+    """
+    now = datetime.now(timezone.utc)
+    claims = {
+        "sub": user.id,
+        "team": user.team_id,
+        "name": user.name,
+        "email": user.email,
+        "iat": now,
+        "exp": now + timedelta(minutes=settings.jwt_expire_minutes),
+    }
+    return jwt.encode(claims, settings.jwt_secret, algorithm=settings.jwt_algorithm)
 
 
 @router.post("/login", response_model=TokenResponse)
@@ -42,32 +85,29 @@ async def login(
     db: AsyncSession = Depends(get_db),
 ):
     """Login with email and password."""
-    result = await db.execute(
-        select(tables.User).where(tables.User.email == request.email)
-    )
+    result = await db.execute(_USER_BY_EMAIL, {"email": request.email.lower()})
     user = result.scalar_one_or_none()
 
     if not user:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    # Check password (placeholder - use bcrypt in production)
-    password_hash = _hash_password(request.password)
-    if user.password_hash != password_hash:
+    # Check password - bcrypt runs in a worker thread to keep the event loop free
+    if not await asyncio.to_thread(_verify_password, request.password, user.password_hash):
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    # Generate token
-    token = _generate_token()
-    _token_store[token] = user.id
-
-    return TokenResponse(
-        token=token,
-        user=UserResponse(
-            id=user.id,
-            name=user.name,
-            email=user.email,
-            team_id=user.team_id,
-        ),
+    # Upgrade legacy SHA-256 hashes now that the plaintext is known to be right
+    if _is_legacy_hash(user.password_hash):
+        user.password_hash = await asyncio.to_thread(_hash_password, request.password)
+        await db.commit()
+
+    # Built from the stored row, so field validation is skipped
+    user_response = UserResponse.model_construct(
+        id=str(user.id),
+        name=user.name,
+        email=user.email,
+        team_id=str(user.team_id),
     )
+    return TokenResponse(token=_generate_token(user_response), user=user_response)
 
 
 @router.post("/register", response_model=TokenResponse)
@@ -76,71 +116,62 @@ async def register(
     db: AsyncSession = Depends(get_db),
 ):
     """Register a new user and team."""
-    # Check if email exists
+    # Create team and user with Core inserts - ids are generated here, so no
+    # ORM flush is needed to link them
+    team_id = tables.uuid7()
+    user_id = tables.uuid7()
+    password_hash = await asyncio.to_thread(_hash_password, request.password)
+    await db.execute(insert(tables.Team).values(id=team_id, name=request.team_name))
+
+    # The unique lower(email) index decides duplicates atomically - no
+    # SELECT probe that a concurrent registration could race past
     result = await db.execute(
-        select(tables.User).where(tables.User.email == request.email)
+        pg_insert(tables.User)
+        .values(
+            id=user_id,
+            team_id=team_id,
+            name=request.name,
+            email=request.email,
+            password_hash=password_hash,
+        )
+        .on_conflict_do_nothing(index_elements=[func.lower(tables.User.email)])
+        .returning(tables.User.id)
     )
-    if result.scalar_one_or_none():
+    if result.scalar_one_or_none() is None:
+        await db.rollback()
         raise HTTPException(status_code=400, detail="Email already registered")
+    await db.commit()
 
-    # Create team
-    team = tables.Team(
-        id=str(uuid.uuid4()),
-        name=request.team_name,
-    )
-    db.add(team)
-    await db.flush()
-
-    # Create user
-    user = tables.User(
-        id=str(uuid.uuid4()),
-        team_id=team.id,
+    user_response = UserResponse(
+        id=str(user_id),
         name=request.name,
         email=request.email,
-        password_hash=_hash_password(request.password),
-    )
-    db.add(user)
-    await db.commit()
-
-    # Generate token
-    token = _generate_token()
-    _token_store[token] = user.id
-
-    return TokenResponse(
-        token=token,
-        user=UserResponse(
-            id=user.id,
-            name=user.name,
-            email=user.email,
-            team_id=user.team_id,
-        ),
+        team_id=str(team_id),
     )
+    return TokenResponse(token=_generate_token(user_response), user=user_response)
 
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user(
     authorization: str = Header(...),
-    db: AsyncSession = Depends(get_db),
 ):
-    """Get current user from token."""
+    """Get current user from token claims (no database lookup)."""
     if not authorization.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="Invalid token format")
 
-    token = authorization[7:]
-    user_id = _token_store.get(token)
-
-    if not user_id:
+    try:
+        claims = jwt.decode(
+            authorization[7:],
+            settings.jwt_secret,
+            algorithms=[settings.jwt_algorithm],
+        )
+    except JWTError:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
 
-    result = await db.execute(select(tables.User).where(tables.User.id == user_id))
-    user = result.scalar_one_or_none()
-
-    if not user:
-        raise HTTPException(status_code=401, detail="User not found")
-
-    return UserResponse(
-        id=user.id,
-        name=user.name,
-        email=user.email,
-        team_id=user.team_id,
+    # Claims are signed by us, so field validation is skipped
+    return UserResponse.model_construct(
+        id=claims["sub"],
+        name=claims["name"],
+        email=claims["email"],
+        team_id=claims["team"],
     )
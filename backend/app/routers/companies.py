@@ -1,10 +1,14 @@
 """Companies API endpoints."""
 
+import base64
 import uuid
-from fastapi import APIRouter, HTTPException, Depends, Query
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Depends, Header, Query, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import Text, case, cast, literal, select, func, tuple_
+from sqlalchemy.orm import joinedload, load_only, raiseload, selectinload
 import structlog
 
 from app.db.database import get_db
@@ -19,10 +23,20 @@ from app.models.research import StartResearchResponse, ResearchStatus
 logger = structlog.get_logger()
 router = APIRouter()
 
+# Company columns read by _company_to_response
+_COMPANY_RESPONSE_COLUMNS = load_only(
+    tables.CompanyProfile.id,
+    tables.CompanyProfile.team_id,
+    tables.CompanyProfile.company_name,
+    tables.CompanyProfile.industry,
+    tables.CompanyProfile.created_at,
+    tables.CompanyProfile.updated_at,
+)
+
 
 def _initiative_to_response(initiative: tables.Initiative) -> InitiativeResponse:
-    """Convert ORM initiative to response model."""
-    return InitiativeResponse(
+    """Convert ORM initiative to response model (trusted DB row - not re-validated)."""
+    return InitiativeResponse.model_construct(
         id=str(initiative.id),
         company_profile_id=str(initiative.company_profile_id),
         name=initiative.name,
@@ -33,9 +47,37 @@ def _initiative_to_response(initiative: tables.Initiative) -> InitiativeResponse
     )
 
 
+def _initiative_to_dict(initiative: tables.Initiative) -> dict:
+    """Convert ORM initiative to an InitiativeResponse-shaped dict for orjson."""
+    return {
+        "id": initiative.id,
+        "company_profile_id": initiative.company_profile_id,
+        "name": initiative.name,
+        "description": initiative.description,
+        "discovered_by_agent": initiative.discovered_by_agent,
+        "created_at": initiative.created_at,
+        "updated_at": initiative.updated_at,
+    }
+
+
+def _encode_cursor(row: tables.CompanyProfile | tables.Initiative) -> str:
+    """Encode a row's (updated_at, id) sort key as an opaque page cursor."""
+    key = f"{row.updated_at.isoformat()}|{row.id}"
+    return base64.urlsafe_b64encode(key.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Decode a page cursor back into its (updated_at, id) sort key."""
+    try:
+        updated_at, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(updated_at), uuid.UUID(row_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
 def _company_to_response(company: tables.CompanyProfile) -> CompanyProfileResponse:
-    """Convert ORM company to response model."""
-    return CompanyProfileResponse(
+    """Convert ORM company to response model (trusted DB row - not re-validated)."""
+    return CompanyProfileResponse.model_construct(
         id=str(company.id),
         team_id=str(company.team_id),
         company_name=company.company_name,
@@ -48,53 +90,90 @@ def _company_to_response(company: tables.CompanyProfile) -> CompanyProfileRespon
 
 @router.get("", response_model=CompanyListResponse)
 async def list_companies(
-    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None),
     limit: int = Query(20, ge=1, le=100),
     db: AsyncSession = Depends(get_db),
 ):
-    """List all companies for the current team."""
+    """List all companies for the current team, most recently updated first."""
     # Placeholder team_id - will use auth when implemented
     team_id = uuid.UUID("00000000-0000-0000-0000-000000000001")
+    live_team = (
+        tables.CompanyProfile.team_id == team_id,
+        tables.CompanyProfile.deleted_at.is_(None),
+    )
 
-    # Get total count
-    count_result = await db.execute(
-        select(func.count(tables.CompanyProfile.id)).where(
-            tables.CompanyProfile.team_id == team_id
+    # Keyset pagination - seek past the previous page's last (updated_at, id)
+    # on the live-team index instead of scanning and discarding OFFSET rows.
+    # The first page also carries the team total as a window count, so it
+    # comes back with the rows instead of in a separate COUNT round trip;
+    # later pages just follow next_cursor
+    query = select(tables.CompanyProfile).where(*live_team)
+    if cursor is None:
+        query = query.add_columns(func.count().over())
+    else:
+        query = query.where(
+            tuple_(tables.CompanyProfile.updated_at, tables.CompanyProfile.id)
+            < tuple_(*_decode_cursor(cursor))
         )
-    )
-    total = count_result.scalar() or 0
 
-    # Get companies with initiatives
+    # Get companies with initiatives - only the response columns, with the
+    # (few) initiatives per company joined in the same round trip; the page
+    # LIMIT applies to companies via a subquery. Any other relationship access
+    # raises instead of lazy-loading per company
     result = await db.execute(
-        select(tables.CompanyProfile)
-        .where(tables.CompanyProfile.team_id == team_id)
-        .options(selectinload(tables.CompanyProfile.initiatives))
-        .order_by(tables.CompanyProfile.updated_at.desc())
-        .offset(offset)
+        query
+        .options(
+            _COMPANY_RESPONSE_COLUMNS,
+            joinedload(tables.CompanyProfile.initiatives),
+            raiseload("*"),
+        )
+        .order_by(tables.CompanyProfile.updated_at.desc(), tables.CompanyProfile.id.desc())
         .limit(limit)
     )
-    companies = result.scalars().all()
-
-    return CompanyListResponse(
-        data=[_company_to_response(c) for c in companies],
-        total=total,
-        offset=offset,
-        limit=limit,
-    )
+    rows = result.unique().all()
+    companies = [row[0] for row in rows]
+
+    total = None
+    if cursor is None:
+        total = rows[0][1] if rows else 0
+
+    # Plain dicts straight to orjson (which writes UUIDs and datetimes itself) -
+    # returning a Response skips FastAPI's response_model validation pass, which
+    # would only re-check trusted rows; response_model still documents the shape
+    return ORJSONResponse({
+        "data": [
+            {
+                "id": c.id,
+                "team_id": c.team_id,
+                "company_name": c.company_name,
+                "industry": c.industry,
+                "created_at": c.created_at,
+                "updated_at": c.updated_at,
+                "initiatives": [_initiative_to_dict(i) for i in c.initiatives],
+            }
+            for c in companies
+        ],
+        "total": total,
+        "limit": limit,
+        "next_cursor": _encode_cursor(companies[-1]) if len(companies) == limit else None,
+    })
 
 
 @router.get("/{company_id}", response_model=CompanyProfileResponse)
 async def get_company(
-    company_id: str,
+    company_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
 ):
     """Get a company by ID."""
-    result = await db.execute(
-        select(tables.CompanyProfile)
-        .where(tables.CompanyProfile.id == company_id)
-        .options(selectinload(tables.CompanyProfile.initiatives))
+    company = await db.get(
+        tables.CompanyProfile,
+        company_id,
+        options=[
+            _COMPANY_RESPONSE_COLUMNS,
+            selectinload(tables.CompanyProfile.initiatives),
+            raiseload("*"),
+        ],
     )
-    company = result.scalar_one_or_none()
 
     if not company:
         raise HTTPException(status_code=404, detail="Company not found")
@@ -104,30 +183,49 @@ async def get_company(
 
 @router.get("/{company_id}/initiatives", response_model=list[InitiativeResponse])
 async def get_company_initiatives(
-    company_id: str,
+    company_id: uuid.UUID,
+    response: Response,
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(50, ge=1, le=200),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get all initiatives for a company."""
-    result = await db.execute(
+    """
+    Get a company's initiatives, most recently updated first.
+
+    Keyset-paginated like the company list; when the page is full the cursor
+    for the next one is returned in the X-Next-Cursor header.
+    """
+    query = (
         select(tables.Initiative)
         .where(tables.Initiative.company_profile_id == company_id)
-        .order_by(tables.Initiative.updated_at.desc())
+        .options(raiseload("*"))
+    )
+    if cursor is not None:
+        query = query.where(
+            tuple_(tables.Initiative.updated_at, tables.Initiative.id)
+            < tuple_(*_decode_cursor(cursor))
+        )
+
+    result = await db.execute(
+        query
+        .order_by(tables.Initiative.updated_at.desc(), tables.Initiative.id.desc())
+        .limit(limit)
     )
     initiatives = result.scalars().all()
 
+    if len(initiatives) == limit:
+        response.headers["X-Next-Cursor"] = _encode_cursor(initiatives[-1])
+
     return [_initiative_to_response(i) for i in initiatives]
 
 
 @router.delete("/{company_id}")
 async def delete_company(
-    company_id: str,
+    company_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a company and all its data."""
-    result = await db.execute(
-        select(tables.CompanyProfile).where(tables.CompanyProfile.id == company_id)
-    )
-    company = result.scalar_one_or_none()
+    company = await db.get(tables.CompanyProfile, company_id)
 
     if not company:
         raise HTTPException(status_code=404, detail="Company not found")
@@ -143,23 +241,20 @@ async def delete_company(
     response_model=StartResearchResponse,
 )
 async def refresh_initiative(
-    company_id: str,
-    initiative_id: str,
+    company_id: uuid.UUID,
+    initiative_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
 ):
     """Start a refresh research session for an initiative."""
-    result = await db.execute(
-        select(tables.Initiative).where(tables.Initiative.id == initiative_id)
-    )
-    initiative = result.scalar_one_or_none()
+    initiative = await db.get(tables.Initiative, initiative_id, options=[raiseload("*")])
 
-    if not initiative or str(initiative.company_profile_id) != company_id:
+    if not initiative or initiative.company_profile_id != company_id:
         raise HTTPException(status_code=404, detail="Initiative not found")
 
     # Create new research session
     session = tables.ResearchSession(
-        id=str(uuid.uuid4()),
-        initiative_id=str(initiative.id),
+        id=tables.uuid7(),
+        initiative_id=initiative.id,
         triggered_by="refresh",
         status="pending",
     )
@@ -173,27 +268,56 @@ async def refresh_initiative(
     )
 
 
+def _parse_if_none_match(header: Optional[str]) -> list[str]:
+    """Extract the opaque tags from an If-None-Match header (weak or strong)."""
+    if not header:
+        return []
+    return [tag.strip().removeprefix("W/").strip('"') for tag in header.split(",")]
+
+
 @router.get("/initiatives/{initiative_id}/dashboard")
 async def get_initiative_dashboard(
-    initiative_id: str,
+    initiative_id: uuid.UUID,
+    if_none_match: Optional[str] = Header(None),
     db: AsyncSession = Depends(get_db),
 ):
     """Get the dashboard content for an initiative."""
+    # Postgres builds the response document and returns it as JSON text, so the
+    # (large) content JSONB is never parsed into Python and re-serialized.
+    # The ETag is a hash of (id, updated_at) - dashboards only change when a
+    # research cycle rewrites them - and when the client already holds the
+    # current version the document is not built at all
+    dashboard = tables.DashboardContent
+    etag = func.md5(cast(dashboard.id, Text) + literal(":") + cast(dashboard.updated_at, Text))
+    document = cast(
+        func.jsonb_build_object(
+            "id", dashboard.id,
+            "initiative_id", dashboard.initiative_id,
+            "content", dashboard.content,
+            "portfolio_recommendations", dashboard.portfolio_recommendations,
+            "created_at", dashboard.created_at,
+            "updated_at", dashboard.updated_at,
+        ),
+        Text,
+    )
+    client_tags = _parse_if_none_match(if_none_match)
+    if client_tags:
+        document = case((etag.in_(client_tags), None), else_=document)
+
     result = await db.execute(
-        select(tables.DashboardContent).where(
-            tables.DashboardContent.initiative_id == initiative_id
-        )
+        select(etag, document).where(dashboard.initiative_id == initiative_id)
     )
-    dashboard = result.scalar_one_or_none()
+    row = result.one_or_none()
 
-    if not dashboard:
+    if row is None:
         raise HTTPException(status_code=404, detail="Dashboard not found")
 
-    return {
-        "id": str(dashboard.id),
-        "initiative_id": str(dashboard.initiative_id),
-        "content": dashboard.content,
-        "portfolio_recommendations": dashboard.portfolio_recommendations,
-        "created_at": dashboard.created_at,
-        "updated_at": dashboard.updated_at,
+    current_etag, dashboard_json = row
+    headers = {
+        "ETag": f'"{current_etag}"',
+        "Cache-Control": "private, max-age=0, must-revalidate",
     }
+    if dashboard_json is None:
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=dashboard_json, media_type="application/json", headers=headers)
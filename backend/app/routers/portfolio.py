@@ -1,10 +1,12 @@
 """Portfolio API endpoints."""
 
+import time
 import uuid
 from datetime import datetime, timezone
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select
+import orjson
 import structlog
 
 from app.db.database import get_db
@@ -19,12 +21,26 @@ from app.models.portfolio import (
 logger = structlog.get_logger()
 router = APIRouter()
 
+# Encoded list_portfolio bodies by team: team_id -> (version, expires_at, body).
+# Writes on this instance bump the team's version, which invalidates at once;
+# the short TTL bounds how stale another instance's writes can look.
+_PORTFOLIO_CACHE: dict[str, tuple[int, float, bytes]] = {}
+_PORTFOLIO_VERSION: dict[str, int] = {}
+PORTFOLIO_CACHE_TTL_SECONDS = 2.0
+
+
+def _invalidate_portfolio(team_id: str | uuid.UUID) -> None:
+    """Bump a team's portfolio version so cached and in-flight list bodies are dropped."""
+    key = str(team_id)
+    _PORTFOLIO_VERSION[key] = _PORTFOLIO_VERSION.get(key, 0) + 1
+    _PORTFOLIO_CACHE.pop(key, None)
+
 
 def _item_to_response(item: tables.PortfolioItem) -> PortfolioItemResponse:
-    """Convert ORM item to response model."""
-    return PortfolioItemResponse(
-        id=item.id,
-        team_id=item.team_id,
+    """Convert ORM item to response model (trusted DB row - not re-validated)."""
+    return PortfolioItemResponse.model_construct(
+        id=str(item.id),
+        team_id=str(item.team_id),
         vendor_name=item.vendor_name,
         partnership_level=item.partnership_level,
         capabilities=item.capabilities,
@@ -41,14 +57,33 @@ async def list_portfolio(
     # Placeholder team_id - will use auth
     team_id = "default-team"
 
+    version = _PORTFOLIO_VERSION.get(team_id, 0)
+    entry = _PORTFOLIO_CACHE.get(team_id)
+    if entry is not None and entry[0] == version and entry[1] >= time.monotonic():
+        return Response(content=entry[2], media_type="application/json")
+
     result = await db.execute(
         select(tables.PortfolioItem)
         .where(tables.PortfolioItem.team_id == team_id)
         .order_by(tables.PortfolioItem.vendor_name)
     )
-    items = result.scalars().all()
-
-    return [_item_to_response(i) for i in items]
+    body = orjson.dumps([
+        {
+            "id": item.id,
+            "team_id": item.team_id,
+            "vendor_name": item.vendor_name,
+            "partnership_level": item.partnership_level,
+            "capabilities": item.capabilities,
+            "created_at": item.created_at,
+            "updated_at": item.updated_at,
+        }
+        for item in result.scalars().all()
+    ])
+
+    # Skip storing if a write landed while the query ran
+    if _PORTFOLIO_VERSION.get(team_id, 0) == version:
+        _PORTFOLIO_CACHE[team_id] = (version, time.monotonic() + PORTFOLIO_CACHE_TTL_SECONDS, body)
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("", response_model=PortfolioItemResponse)
@@ -61,7 +96,7 @@ async def create_portfolio_item(
     team_id = "default-team"
 
     item = tables.PortfolioItem(
-        id=str(uuid.uuid4()),
+        id=tables.uuid7(),
         team_id=team_id,
         vendor_name=request.vendor_name,
         partnership_level=request.partnership_level,
@@ -69,6 +104,7 @@ async def create_portfolio_item(
     )
     db.add(item)
     await db.commit()
+    _invalidate_portfolio(team_id)
     await db.refresh(item)
 
     return _item_to_response(item)
@@ -76,7 +112,7 @@ async def create_portfolio_item(
 
 @router.put("/{item_id}", response_model=PortfolioItemResponse)
 async def update_portfolio_item(
-    item_id: str,
+    item_id: uuid.UUID,
     request: PortfolioItemUpdate,
     db: AsyncSession = Depends(get_db),
 ):
@@ -99,6 +135,7 @@ async def update_portfolio_item(
 
     item.updated_at = datetime.now(timezone.utc)
     await db.commit()
+    _invalidate_portfolio(item.team_id)
     await db.refresh(item)
 
     return _item_to_response(item)
@@ -106,7 +143,7 @@ async def update_portfolio_item(
 
 @router.delete("/{item_id}")
 async def delete_portfolio_item(
-    item_id: str,
+    item_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a portfolio item."""
@@ -120,6 +157,7 @@ async def delete_portfolio_item(
 
     await db.delete(item)
     await db.commit()
+    _invalidate_portfolio(item.team_id)
 
     return {"status": "deleted"}
 
@@ -133,22 +171,26 @@ async def bulk_import_portfolio(
     # Placeholder team_id - will use auth
     team_id = "default-team"
 
-    created_items = []
-    for item_data in request.items:
-        item = tables.PortfolioItem(
-            id=str(uuid.uuid4()),
-            team_id=team_id,
-            vendor_name=item_data.vendor_name,
-            partnership_level=item_data.partnership_level,
-            capabilities=item_data.capabilities,
-        )
-        db.add(item)
-        created_items.append(item)
+    if not request.items:
+        return []
 
+    # One multi-row INSERT ... RETURNING brings back the server-side timestamps
+    # with the rows - no per-item refresh round trip
+    result = await db.execute(
+        insert(tables.PortfolioItem).returning(tables.PortfolioItem, sort_by_parameter_order=True),
+        [
+            {
+                "id": item_id,
+                "team_id": team_id,
+                "vendor_name": item_data.vendor_name,
+                "partnership_level": item_data.partnership_level,
+                "capabilities": item_data.capabilities,
+            }
+            for item_id, item_data in zip(tables.uuid7_batch(len(request.items)), request.items)
+        ],
+    )
+    created_items = result.scalars().all()
     await db.commit()
-
-    # Refresh all items
-    for item in created_items:
-        await db.refresh(item)
+    _invalidate_portfolio(team_id)
 
     return [_item_to_response(i) for i in created_items]
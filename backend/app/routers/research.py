@@ -1,15 +1,18 @@
 """Research API endpoints."""
 
-import uuid
 import asyncio
+import time
+import uuid
+from collections import OrderedDict
 from datetime import datetime, timezone
 from typing import AsyncGenerator
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Depends
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import raiseload
 import structlog
-import json
 
 from app.db.database import get_db, AsyncSessionLocal
 from app.db import tables
@@ -22,11 +25,43 @@ from app.models.research import (
     ResearchStatus,
 )
 from app.services.research_service import ResearchService
-from app.streams.sse import sse_manager, create_event_callback, format_sse_message
+from app.streams.sse import (
+    sse_manager,
+    create_event_callback,
+    format_sse_heartbeat,
+    format_sse_message,
+)
 
 logger = structlog.get_logger()
 router = APIRouter()
 
+# Session ids recently confirmed to exist: session_id -> expires_at. Stream
+# reconnects (page navigation, network blips) skip the existence query.
+# Only hits are cached, so a just-created session is never reported missing.
+_KNOWN_SESSIONS: OrderedDict[uuid.UUID, float] = OrderedDict()
+KNOWN_SESSIONS_MAX_ENTRIES = 1024
+KNOWN_SESSIONS_TTL_SECONDS = 5
+
+
+async def _session_exists(db: AsyncSession, session_id: uuid.UUID) -> bool:
+    """Check that a research session exists, reusing a recent positive answer."""
+    expires_at = _KNOWN_SESSIONS.get(session_id)
+    if expires_at is not None and expires_at >= time.monotonic():
+        return True
+    
+    result = await db.execute(
+        select(tables.ResearchSession.id).where(tables.ResearchSession.id == session_id)
+    )
+    if result.scalar_one_or_none() is None:
+        _KNOWN_SESSIONS.pop(session_id, None)
+        return False
+    
+    _KNOWN_SESSIONS[session_id] = time.monotonic() + KNOWN_SESSIONS_TTL_SECONDS
+    _KNOWN_SESSIONS.move_to_end(session_id)
+    while len(_KNOWN_SESSIONS) > KNOWN_SESSIONS_MAX_ENTRIES:
+        _KNOWN_SESSIONS.popitem(last=False)
+    return True
+
 
 @router.post("/start", response_model=StartResearchResponse)
 async def start_research(
@@ -47,41 +82,44 @@ async def start_research(
 
     # Get or create team (placeholder - will use auth)
     # Using a fixed UUID for default team until auth is implemented
-    team_id = "00000000-0000-0000-0000-000000000001"
-
-    # Get or create company profile
+    team_id = uuid.UUID("00000000-0000-0000-0000-000000000001")
+
+    # Get or create company profile in one atomic statement - concurrent starts
+    # for the same company converge on one row instead of racing a SELECT.
+    # The conflict update rewrites company_name with its own value only so
+    # RETURNING yields the existing row; updated_at (the company list's sort
+    # and cursor key) is left alone
+    insert_company = pg_insert(tables.CompanyProfile).values(
+        id=tables.uuid7(),
+        team_id=team_id,
+        company_name=request.company_name,
+        industry=request.industry,
+    )
     result = await db.execute(
-        select(tables.CompanyProfile).where(
-            tables.CompanyProfile.team_id == team_id,
-            tables.CompanyProfile.company_name == request.company_name,
+        insert_company
+        .on_conflict_do_update(
+            index_elements=[tables.CompanyProfile.team_id, tables.CompanyProfile.company_name],
+            index_where=tables.CompanyProfile.deleted_at.is_(None),
+            set_={"company_name": insert_company.excluded.company_name},
         )
+        .returning(tables.CompanyProfile.id)
     )
-    company = result.scalar_one_or_none()
-
-    if not company:
-        company = tables.CompanyProfile(
-            id=str(uuid.uuid4()),
-            team_id=team_id,
-            company_name=request.company_name,
-            industry=request.industry,
-        )
-        db.add(company)
-        await db.flush()
+    company_id = result.scalar_one()
 
-    # Create initiative
+    # Ids are generated here, so the session links to its initiative without
+    # an intermediate flush; the commit writes both rows in dependency order
     initiative = tables.Initiative(
-        id=str(uuid.uuid4()),
-        company_profile_id=company.id,
+        id=tables.uuid7(),
+        company_profile_id=company_id,
         name=request.initiative_description[:100],
         description=request.initiative_description,
         discovered_by_agent=False,
     )
     db.add(initiative)
-    await db.flush()
 
     # Create research session
     session = tables.ResearchSession(
-        id=str(uuid.uuid4()),
+        id=tables.uuid7(),
         initiative_id=initiative.id,
         triggered_by="user",
         status="pending",
@@ -102,14 +140,11 @@ async def start_research(
 
 @router.get("/{session_id}", response_model=ResearchSessionResponse)
 async def get_research_session(
-    session_id: str,
+    session_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
 ):
     """Get research session details."""
-    result = await db.execute(
-        select(tables.ResearchSession).where(tables.ResearchSession.id == session_id)
-    )
-    session = result.scalar_one_or_none()
+    session = await db.get(tables.ResearchSession, session_id, options=[raiseload("*")])
 
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
@@ -128,14 +163,11 @@ async def get_research_session(
 
 @router.post("/{session_id}/stop")
 async def stop_research(
-    session_id: str,
+    session_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
 ):
     """Stop an active research session."""
-    result = await db.execute(
-        select(tables.ResearchSession).where(tables.ResearchSession.id == session_id)
-    )
-    session = result.scalar_one_or_none()
+    session = await db.get(tables.ResearchSession, session_id, options=[raiseload("*")])
 
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
@@ -144,7 +176,7 @@ async def stop_research(
         raise HTTPException(status_code=400, detail="Session is not active")
 
     session.status = "stopped"
-    session.completed_at = datetime.utcnow()
+    session.completed_at = datetime.now(timezone.utc)
     await db.commit()
 
     return {"status": "stopped"}
@@ -152,15 +184,12 @@ async def stop_research(
 
 @router.post("/{session_id}/paths/{path_id}/stop")
 async def stop_research_path(
-    session_id: str,
-    path_id: str,
+    session_id: uuid.UUID,
+    path_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
 ):
     """Stop a specific research path."""
-    result = await db.execute(
-        select(tables.ResearchPath).where(tables.ResearchPath.id == path_id)
-    )
-    path = result.scalar_one_or_none()
+    path = await db.get(tables.ResearchPath, path_id, options=[raiseload("*")])
 
     if not path:
         raise HTTPException(status_code=404, detail="Path not found")
@@ -169,7 +198,7 @@ async def stop_research_path(
         raise HTTPException(status_code=400, detail="Path is not active")
 
     path.status = "stopped"
-    path.completed_at = datetime.utcnow()
+    path.completed_at = datetime.now(timezone.utc)
     await db.commit()
 
     return {"status": "stopped"}
@@ -177,23 +206,19 @@ async def stop_research_path(
 
 @router.post("/{session_id}/follow-up", response_model=StartResearchResponse)
 async def follow_up_research(
-    session_id: str,
+    session_id: uuid.UUID,
     request: FollowUpRequest,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
     """Start a follow-up research session."""
-    result = await db.execute(
-        select(tables.ResearchSession).where(tables.ResearchSession.id == session_id)
-    )
-    original_session = result.scalar_one_or_none()
+    original_session = await db.get(tables.ResearchSession, session_id, options=[raiseload("*")])
 
     if not original_session:
         raise HTTPException(status_code=404, detail="Session not found")
 
     # Create new session for follow-up
     new_session = tables.ResearchSession(
-        id=str(uuid.uuid4()),
+        id=tables.uuid7(),
         initiative_id=original_session.initiative_id,
         triggered_by="follow_up",
         status="pending",
@@ -202,11 +227,8 @@ async def follow_up_research(
     db.add(new_session)
     await db.commit()
 
-    # Start research in background
-    # background_tasks.add_task(
-    #     ResearchService(db).run_research,
-    #     new_session.id,
-    # )
+    # Like start_research, the /stream endpoint runs the session when the
+    # client connects - nothing is scheduled here
 
     return StartResearchResponse(
         session_id=str(new_session.id),
@@ -217,7 +239,7 @@ async def follow_up_research(
 
 @router.get("/{session_id}/stream")
 async def stream_research(
-    session_id: str,
+    session_id: uuid.UUID,
     db: AsyncSession = Depends(get_db),
 ):
     """Stream research events via SSE.
@@ -227,18 +249,16 @@ async def stream_research(
     """
     
     # Verify session exists
-    result = await db.execute(
-        select(tables.ResearchSession).where(tables.ResearchSession.id == session_id)
-    )
-    session = result.scalar_one_or_none()
-    
-    if not session:
+    if not await _session_exists(db, session_id):
         raise HTTPException(status_code=404, detail="Session not found")
 
-    async def event_generator() -> AsyncGenerator[str, None]:
+    # SSE subscriptions and the research service key sessions by string
+    session_key = str(session_id)
+
+    async def event_generator() -> AsyncGenerator[bytes, None]:
         """Generate SSE events and run research."""
         # Subscribe to session events
-        queue = await sse_manager.subscribe(session_id)
+        queue = await sse_manager.subscribe(session_key)
         research_task = None
         task_db = None
         
@@ -246,8 +266,8 @@ async def stream_research(
             # Send connected event
             yield format_sse_message({
                 "type": "connected",
-                "session_id": session_id,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "session_id": session_key,
+                "timestamp": datetime.now(timezone.utc),  # orjson writes ISO 8601
             })
             
             # Create a database session that stays open during research
@@ -264,40 +284,33 @@ async def stream_research(
                 
                 # Run research in a task but keep streaming
                 service = ResearchService(task_db)
-                event_callback = await create_event_callback(session_id)
+                event_callback = await create_event_callback(session_key)
                 
                 # Create task but don't await it yet - we'll process events
                 research_task = asyncio.create_task(
-                    service.run_research(session_id, event_callback)
+                    service.run_research(session_key, event_callback)
                 )
             elif current_session:
                 logger.info("Session already started", session_id=session_id, status=current_session.status)
             
             # Stream events from queue while research runs
-            timeout = 600  # 10 minutes max for research
-            start_time = asyncio.get_event_loop().time()
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + 600  # 10 minutes max for research
             
-            while True:
-                elapsed = asyncio.get_event_loop().time() - start_time
-                if elapsed >= timeout:
-                    logger.warning("Research stream timeout", session_id=session_id)
-                    break
-                
+            while (remaining := deadline - loop.time()) > 0:
                 try:
                     # Wait for event with timeout for heartbeat
-                    event = await asyncio.wait_for(queue.get(), timeout=15)
-                    yield format_sse_message(event)
+                    # Events arrive already framed by the publisher
+                    event_type, message = await asyncio.wait_for(queue.get(), timeout=min(15, remaining))
+                    yield message
                     
                     # Check if research is complete
-                    if event.get("type") in ("research_complete", "error"):
+                    if event_type in ("research_complete", "error"):
                         break
                         
                 except asyncio.TimeoutError:
                     # Send heartbeat to keep connection alive
-                    yield format_sse_message({
-                        "type": "heartbeat",
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
-                    })
+                    yield format_sse_heartbeat()
                     
                     # Check if research task failed
                     if research_task and research_task.done():
@@ -307,20 +320,22 @@ async def stream_research(
                             yield format_sse_message({
                                 "type": "error",
                                 "message": str(exc),
-                                "timestamp": datetime.now(timezone.utc).isoformat(),
+                                "timestamp": datetime.now(timezone.utc),
                             })
                             break
+            else:
+                logger.warning("Research stream timeout", session_id=session_id)
         
         except Exception as e:
             logger.error("Stream error", error=str(e), session_id=session_id, exc_info=True)
             yield format_sse_message({
                 "type": "error",
                 "message": str(e),
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": datetime.now(timezone.utc),
             })
         
         finally:
-            await sse_manager.unsubscribe(session_id, queue)
+            await sse_manager.unsubscribe(session_key, queue)
             if research_task and not research_task.done():
                 research_task.cancel()
             if task_db:
@@ -3,21 +3,55 @@
 import uuid
 import asyncio
 from datetime import datetime, timezone
-from typing import Any, AsyncGenerator, Callable, Optional
+from typing import Any, AsyncGenerator, Callable, Coroutine, Optional
 import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import bindparam, func, insert, select
+from sqlalchemy.orm import joinedload, load_only
 
 from app.db import tables
 from app.agents.tools.base import create_default_registry
 from app.agents.prime import plan_research, assess_confidence, should_stop_research
-from app.agents.researcher import execute_research_paths_parallel
-from app.agents.synthesis import synthesize_findings, generate_portfolio_recommendations
+from app.agents.researcher import iter_research_paths_parallel
+from app.agents.synthesis import synthesize_and_recommend
 from app.models.research import ResearchStatus, FindingCategory
 
 logger = structlog.get_logger()
 
+# Category names in FindingCategory declaration order
+_CATEGORY_NAMES = tuple(category.value for category in FindingCategory)
+
+# Lookups built once; each execution only binds its parameters
+_SESSION_WITH_CONTEXT = (
+    select(tables.ResearchSession)
+    .where(tables.ResearchSession.id == bindparam("session_id"))
+    .options(
+        joinedload(tables.ResearchSession.initiative)
+        .joinedload(tables.Initiative.company_profile)
+    )
+)
+_DASHBOARD_BY_INITIATIVE = (
+    select(tables.DashboardContent)
+    .where(tables.DashboardContent.initiative_id == bindparam("initiative_id"))
+    .options(load_only(tables.DashboardContent.id, tables.DashboardContent.initiative_id))
+)
+_TEAM_PORTFOLIO = select(
+    tables.PortfolioItem.vendor_name,
+    tables.PortfolioItem.partnership_level,
+    tables.PortfolioItem.capabilities,
+).where(tables.PortfolioItem.team_id == bindparam("team_id"))
+_DISCOVERED_INITIATIVE_COUNT = (
+    select(func.count())
+    .select_from(tables.Initiative)
+    .where(
+        tables.Initiative.company_profile_id == bindparam("company_profile_id"),
+        tables.Initiative.discovered_by_agent == True,
+    )
+)
+
+# Agent-discovered initiatives kept per company
+_MAX_DISCOVERED_INITIATIVES = 5
+
 
 class ResearchService:
     """Orchestrates the multi-agent research process."""
@@ -38,15 +72,9 @@ class ResearchService:
             session_id: Research session ID
             event_callback: Optional async callback for SSE events
         """
-        # Load session with related data
-        result = await self.db.execute(
-            select(tables.ResearchSession)
-            .where(tables.ResearchSession.id == session_id)
-            .options(
-                selectinload(tables.ResearchSession.initiative)
-                .selectinload(tables.Initiative.company_profile)
-            )
-        )
+        # Load session with related data - both are many-to-one, so JOIN them
+        # into the session query instead of two follow-up SELECTs
+        result = await self.db.execute(_SESSION_WITH_CONTEXT, {"session_id": session_id})
         session = result.scalar_one_or_none()
         
         if not session:
@@ -65,7 +93,7 @@ class ResearchService:
         
         # Update session status
         session.status = "running"
-        session.started_at = datetime.utcnow()
+        session.started_at = datetime.now(timezone.utc)
         await self.db.commit()
         
         await self._emit_event(event_callback, "research_started", {
@@ -85,7 +113,7 @@ class ResearchService:
             
             # Mark complete
             session.status = "completed"
-            session.completed_at = datetime.utcnow()
+            session.completed_at = datetime.now(timezone.utc)
             await self.db.commit()
             
             await self._emit_event(event_callback, "research_complete", {
@@ -96,7 +124,7 @@ class ResearchService:
             logger.error("Research failed", session_id=session_id, error=str(e))
             session.status = "failed"
             session.error_message = str(e)
-            session.completed_at = datetime.utcnow()
+            session.completed_at = datetime.now(timezone.utc)
             await self.db.commit()
             
             await self._emit_event(event_callback, "error", {
@@ -113,71 +141,86 @@ class ResearchService:
     ) -> None:
         """Run the Prime → Research → Synthesis cycle."""
         
-        findings_by_category: dict[str, list] = {cat.value: [] for cat in FindingCategory}
-        confidence_assessment: dict[str, str] = {cat.value: "none" for cat in FindingCategory}
+        findings_by_category: dict[str, list] = {name: [] for name in _CATEGORY_NAMES}
+        confidence_assessment: dict[str, str] = dict.fromkeys(_CATEGORY_NAMES, "none")
         
         max_cycles = 5
         
+        # Neither changes during a session: the portfolio is read once, and the
+        # dashboard row is looked up (or created) once and then reused
+        portfolio_items = await self._get_portfolio_items(company.team_id)
+        dashboard: Optional[tables.DashboardContent] = None
+        
+        # The last good synthesis is the base the next one merges its new findings
+        # into; findings wait in pending_by_category until a synthesis absorbs them
+        synthesis: Optional[dict] = None
+        last_good_synthesis: Optional[dict] = None
+        recommendations: list[dict] = []
+        pending_by_category: dict[str, list] = {}
+        
+        # The next cycle's plan, requested while this cycle's results are saved
+        next_plan: Optional[asyncio.Task] = None
+        
+        # Context bound once, so each cycle's log calls only pass what varies
+        session_log = logger.bind(session_id=str(session.id))
+        
         for cycle_number in range(1, max_cycles + 1):
-            logger.info(
-                "Starting research cycle",
-                cycle=cycle_number,
-                session_id=str(session.id),
-            )
+            cycle_log = session_log.bind(cycle=cycle_number)
+            cycle_log.info("Starting research cycle")
             
             # Create cycle record
             cycle = tables.ResearchCycle(
-                id=str(uuid.uuid4()),
-                research_session_id=str(session.id),
+                id=tables.uuid7(),
+                research_session_id=session.id,
                 cycle_number=cycle_number,
             )
             self.db.add(cycle)
-            await self.db.flush()
             
             await self._emit_event(event_callback, "cycle_started", {
                 "cycle_number": cycle_number,
                 "session_id": str(session.id),
             })
             
-            # 1. Prime Agent plans research
-            plan = await plan_research(
-                company_name=company.company_name,
-                initiative_description=initiative.description or initiative.name,
-                industry=company.industry,
-                current_findings=findings_by_category,
-                current_confidence=confidence_assessment,
-                cycle_number=cycle_number,
-                follow_up_question=session.follow_up_question,
-            )
+            # 1. Prime Agent plans research (already in flight after cycle 1)
+            if next_plan is None:
+                plan = await self._plan_cycle(
+                    session, initiative, company,
+                    findings_by_category, confidence_assessment, cycle_number,
+                )
+            else:
+                plan = await next_plan
+                next_plan = None
             
             cycle.prime_agent_plan = plan
-            await self.db.flush()
             
             # Check if we should stop
             if not plan.get("should_continue", True):
-                logger.info("Prime Agent decided to stop", cycle=cycle_number)
-                cycle.completed_at = datetime.utcnow()
+                cycle_log.info("Prime Agent decided to stop")
+                cycle.completed_at = datetime.now(timezone.utc)
                 break
             
             # 2. Execute research paths
             research_paths = plan.get("research_paths", [])
             
             if not research_paths:
-                logger.warning("No research paths planned", cycle=cycle_number)
-                cycle.completed_at = datetime.utcnow()
+                cycle_log.warning("No research paths planned")
+                cycle.completed_at = datetime.now(timezone.utc)
                 break
             
-            # Create path records and emit events
+            # Create path records and emit events; results are matched back to
+            # these records by assignment id, so no lookup query is needed later
+            paths_by_assignment: dict[str, tables.ResearchPath] = {}
             for path_def in research_paths:
                 path = tables.ResearchPath(
-                    id=str(uuid.uuid4()),
-                    research_cycle_id=str(cycle.id),
+                    id=tables.uuid7(),
+                    research_cycle_id=cycle.id,
                     assignment_id=path_def.get("id", str(uuid.uuid4())),
                     topic=path_def["topic"],
                     instructions=path_def.get("instructions"),
                     status="active",
                 )
                 self.db.add(path)
+                paths_by_assignment[path.assignment_id] = path
                 
                 await self._emit_event(event_callback, "subagent_started", {
                     "path_id": str(path.id),
@@ -185,34 +228,26 @@ class ResearchService:
                     "priority": path_def.get("priority", "medium"),
                 })
             
-            await self.db.flush()
+            # Execute research in parallel, processing each path's results as
+            # soon as it finishes so subscribers see progress from fast paths
+            new_findings = []
+            finding_rows = []
+            tangential_signals = []
             
-            # Execute research in parallel
-            path_results = await execute_research_paths_parallel(
+            async for result in iter_research_paths_parallel(
                 paths=research_paths,
                 company_name=company.company_name,
                 tool_registry=self.tool_registry,
-            )
-            
-            # Process results
-            new_findings = []
-            tangential_signals = []
-            
-            for result in path_results:
+                current_confidence=confidence_assessment,
+            ):
                 path_id = result.get("path_id")
                 
-                # Update path record - filter by both assignment_id AND cycle to avoid duplicates
-                path_result = await self.db.execute(
-                    select(tables.ResearchPath).where(
-                        tables.ResearchPath.assignment_id == path_id,
-                        tables.ResearchPath.research_cycle_id == str(cycle.id),
-                    )
-                )
-                path_record = path_result.scalar_one_or_none()
+                # Update this cycle's path record
+                path_record = paths_by_assignment.get(path_id)
                 
                 if path_record:
                     path_record.status = "completed" if result["status"] == "completed" else "error"
-                    path_record.completed_at = datetime.utcnow()
+                    path_record.completed_at = datetime.now(timezone.utc)
                     path_record.tools_used = result.get("turns", 0)
                     path_record.reasoning = result.get("error")
                 
@@ -220,19 +255,18 @@ class ResearchService:
                 for finding in result.get("findings", []):
                     category = finding.get("category", result.get("category", "initiative"))
                     
-                    finding_record = tables.ResearchFinding(
-                        id=str(uuid.uuid4()),
-                        research_path_id=str(path_record.id) if path_record else None,
-                        initiative_id=str(initiative.id),
-                        category=category,
-                        content=finding,
-                        source_url=finding.get("source_url"),
-                        source_type="web",
-                        confidence_score=finding.get("confidence", 0.5),
-                    )
-                    self.db.add(finding_record)
+                    finding_rows.append({
+                        "research_path_id": path_record.id if path_record else None,
+                        "initiative_id": initiative.id,
+                        "category": category,
+                        "content": finding,
+                        "source_url": finding.get("source_url"),
+                        "source_type": "web",
+                        "confidence_score": finding.get("confidence", 0.5),
+                    })
                     
                     findings_by_category[category].append(finding)
+                    pending_by_category.setdefault(category, []).append(finding)
                     new_findings.append(finding)
                 
                 tangential_signals.extend(result.get("tangential_signals", []))
@@ -244,79 +278,139 @@ class ResearchService:
                     "tangential_signals": result.get("tangential_signals", []),
                 })
             
-            await self.db.flush()
+            # One batched Core insert for the cycle's findings instead of an ORM
+            # object (and unit-of-work bookkeeping) per finding. The session
+            # doesn't autoflush, so the cycle and paths they reference are
+            # flushed first; everything else waits for the cycle's commit
+            if finding_rows:
+                await self.db.flush()
+                for row, finding_id in zip(finding_rows, tables.uuid7_batch(len(finding_rows))):
+                    row["id"] = finding_id
+                await self.db.execute(insert(tables.ResearchFinding), finding_rows)
             
-            # 3. Synthesize findings
-            synthesis = await synthesize_findings(
-                company_name=company.company_name,
-                initiative_description=initiative.description or initiative.name,
-                findings_by_category=findings_by_category,
-            )
+            # 3. Synthesize findings and portfolio recommendations in one call.
+            # Only findings not yet synthesized are sent, merged into the last
+            # good synthesis, so the prompt doesn't grow with every cycle; a
+            # cycle that found nothing new keeps the previous synthesis as is
+            if pending_by_category or synthesis is None:
+                merged, merged_recommendations = await synthesize_and_recommend(
+                    company_name=company.company_name,
+                    initiative_description=initiative.description or initiative.name,
+                    findings_by_category=pending_by_category,
+                    portfolio_items=portfolio_items,
+                    previous_synthesis=last_good_synthesis,
+                )
+                if "error" in merged:
+                    # Unparseable response: the fallback placeholder never becomes
+                    # the merge base, and the pending findings are retried next cycle
+                    cycle_log.warning("Synthesis failed, keeping last good synthesis")
+                    synthesis = last_good_synthesis or merged
+                else:
+                    synthesis = last_good_synthesis = merged
+                    recommendations = merged_recommendations
+                    pending_by_category = {}
             
-            # 4. Update confidence assessment
+            # 4. Update confidence - the plan's assessment, raised locally where
+            # this cycle's findings justify more, and never below what an
+            # earlier cycle already reached
             confidence_assessment = await assess_confidence(
                 findings_by_category=findings_by_category,
                 previous_assessment=confidence_assessment,
+                plan_assessment=plan["confidence_assessment"],
             )
             cycle.confidence_assessment = confidence_assessment
-            cycle.completed_at = datetime.utcnow()
+            cycle.completed_at = datetime.now(timezone.utc)
             
-            # 5. Update dashboard content
-            await self._update_dashboard(
-                initiative=initiative,
-                synthesis=synthesis,
-                confidence=confidence_assessment,
-                event_callback=event_callback,
-            )
+            # The next plan only reads the findings and confidence, so its
+            # Prime Agent call runs while this cycle is saved below
+            stop = should_stop_research(confidence_assessment, cycle_number)
+            if not stop:
+                next_plan = asyncio.create_task(self._plan_cycle(
+                    session, initiative, company,
+                    findings_by_category, confidence_assessment, cycle_number + 1,
+                ))
             
-            await self.db.commit()
-            
-            await self._emit_event(event_callback, "synthesis_complete", {
-                "cycle_number": cycle_number,
-                "new_findings": len(new_findings),
-                "confidence": confidence_assessment,
-            })
+            try:
+                # 5. Update dashboard content
+                dashboard = await self._update_dashboard(
+                    initiative=initiative,
+                    dashboard=dashboard,
+                    synthesis=synthesis,
+                    recommendations=recommendations,
+                    confidence=confidence_assessment,
+                    event_callback=event_callback,
+                )
+                
+                await self.db.commit()
+                
+                await self._emit_event(event_callback, "synthesis_complete", {
+                    "cycle_number": cycle_number,
+                    "new_findings": len(new_findings),
+                    "confidence": confidence_assessment,
+                })
+                
+                # Handle tangential initiatives
+                if not stop:
+                    await self._create_discovered_initiatives(
+                        company=company,
+                        signals=tangential_signals[:3],  # Limit to 3
+                        event_callback=event_callback,
+                    )
+            except BaseException:
+                if next_plan is not None:
+                    next_plan.cancel()
+                raise
             
             # Check if we should stop based on confidence
-            if should_stop_research(confidence_assessment, cycle_number):
-                logger.info(
+            if stop:
+                cycle_log.info(
                     "Stopping research - confidence threshold reached",
-                    cycle=cycle_number,
                     confidence=confidence_assessment,
                 )
                 break
-            
-            # Handle tangential initiatives
-            for signal in tangential_signals[:3]:  # Limit to 3
-                await self._maybe_create_initiative(
-                    company=company,
-                    signal=signal,
-                    event_callback=event_callback,
-                )
+    
+    def _plan_cycle(
+        self,
+        session: tables.ResearchSession,
+        initiative: tables.Initiative,
+        company: tables.CompanyProfile,
+        findings_by_category: dict[str, list],
+        confidence_assessment: dict[str, str],
+        cycle_number: int,
+    ) -> Coroutine[Any, Any, dict[str, Any]]:
+        """Build the Prime Agent planning call for a cycle (no database access)."""
+        return plan_research(
+            company_name=company.company_name,
+            initiative_description=initiative.description or initiative.name,
+            industry=company.industry,
+            current_findings=findings_by_category,
+            current_confidence=confidence_assessment,
+            cycle_number=cycle_number,
+            follow_up_question=session.follow_up_question,
+        )
     
     async def _update_dashboard(
         self,
         initiative: tables.Initiative,
+        dashboard: Optional[tables.DashboardContent],
         synthesis: dict,
+        recommendations: list[dict],
         confidence: dict[str, str],
         event_callback: Optional[Callable],
-    ) -> None:
-        """Update or create dashboard content."""
+    ) -> tables.DashboardContent:
+        """Update or create dashboard content; returns the row for the next cycle."""
         
-        # Get existing dashboard
-        result = await self.db.execute(
-            select(tables.DashboardContent).where(
-                tables.DashboardContent.initiative_id == str(initiative.id)
-            )
-        )
-        dashboard = result.scalar_one_or_none()
+        # Get existing dashboard on the first cycle - its JSONB columns are
+        # overwritten below, so they are never fetched
+        if dashboard is None:
+            result = await self.db.execute(_DASHBOARD_BY_INITIATIVE, {"initiative_id": initiative.id})
+            dashboard = result.scalar_one_or_none()
         
         # Build content structure
         categories = synthesis.get("categories", {})
         content = {}
         
-        for cat in FindingCategory:
-            cat_name = cat.value
+        for cat_name in _CATEGORY_NAMES:
             cat_data = categories.get(cat_name, {})
             
             content[cat_name] = {
@@ -327,38 +421,19 @@ class ResearchService:
                 **{k: v for k, v in cat_data.items() if k not in ("summary", "findings", "insights", "confidence")},
             }
         
-        # Get portfolio recommendations
-        portfolio_result = await self.db.execute(
-            select(tables.PortfolioItem).where(
-                tables.PortfolioItem.team_id == initiative.company_profile.team_id
-            )
-        )
-        portfolio_items = [
-            {
-                "vendor_name": p.vendor_name,
-                "partnership_level": p.partnership_level,
-                "capabilities": p.capabilities,
-            }
-            for p in portfolio_result.scalars().all()
-        ]
-        
-        recommendations = await generate_portfolio_recommendations(synthesis, portfolio_items)
-        
         if dashboard:
             dashboard.content = content
             dashboard.portfolio_recommendations = recommendations
-            dashboard.updated_at = datetime.utcnow()
+            # updated_at is set to now() by the column's onupdate
         else:
             dashboard = tables.DashboardContent(
-                id=str(uuid.uuid4()),
-                initiative_id=str(initiative.id),
+                id=tables.uuid7(),
+                initiative_id=initiative.id,
                 content=content,
                 portfolio_recommendations=recommendations,
             )
             self.db.add(dashboard)
         
-        await self.db.flush()
-        
         await self._emit_event(event_callback, "findings_updated", {
             "initiative_id": str(initiative.id),
             "dashboard_content": {
@@ -368,47 +443,54 @@ class ResearchService:
                 "portfolio_recommendations": recommendations,
             },
         })
+        
+        return dashboard
+    
+    async def _get_portfolio_items(self, team_id: uuid.UUID) -> list[dict]:
+        """Load the team's vendor portfolio for recommendations."""
+        # Plain column rows - only three fields are read, so no ORM instances
+        portfolio_result = await self.db.execute(_TEAM_PORTFOLIO, {"team_id": team_id})
+        return [row._asdict() for row in portfolio_result.all()]
     
-    async def _maybe_create_initiative(
+    async def _create_discovered_initiatives(
         self,
         company: tables.CompanyProfile,
-        signal: str,
+        signals: list[str],
         event_callback: Optional[Callable],
     ) -> None:
-        """Maybe create a new initiative from a tangential signal."""
+        """Create initiatives from a cycle's tangential signals, up to the company's limit."""
         # Simple heuristic - create if signal is substantial
-        if len(signal) < 30:
+        signals = [signal for signal in signals if len(signal) >= 30]
+        if not signals:
             return
         
-        # Check if similar initiative exists
-        result = await self.db.execute(
-            select(tables.Initiative).where(
-                tables.Initiative.company_profile_id == str(company.id),
-                tables.Initiative.discovered_by_agent == True,
-            )
-        )
-        existing = result.scalars().all()
-        
-        # Limit discovered initiatives
-        if len(existing) >= 5:
+        # Limit discovered initiatives - counted once for the whole batch
+        result = await self.db.execute(_DISCOVERED_INITIATIVE_COUNT, {"company_profile_id": company.id})
+        remaining = _MAX_DISCOVERED_INITIATIVES - result.scalar_one()
+        if remaining <= 0:
             return
         
-        # Create new initiative
-        initiative = tables.Initiative(
-            id=str(uuid.uuid4()),
-            company_profile_id=str(company.id),
-            name=signal[:100],
-            description=signal,
-            discovered_by_agent=True,
-        )
-        self.db.add(initiative)
+        # Create new initiatives
+        initiatives = [
+            tables.Initiative(
+                id=tables.uuid7(),
+                company_profile_id=company.id,
+                name=signal[:100],
+                description=signal,
+                discovered_by_agent=True,
+            )
+            for signal in signals[:remaining]
+        ]
+        self.db.add_all(initiatives)
+        # Flushed so the next cycle's count sees them (the session doesn't autoflush)
         await self.db.flush()
         
-        await self._emit_event(event_callback, "initiative_discovered", {
-            "initiative_id": str(initiative.id),
-            "initiative_name": initiative.name,
-            "description": signal,
-        })
+        for initiative in initiatives:
+            await self._emit_event(event_callback, "initiative_discovered", {
+                "initiative_id": str(initiative.id),
+                "initiative_name": initiative.name,
+                "description": initiative.description,
+            })
     
     async def _emit_event(
         self,
@@ -422,7 +504,7 @@ class ResearchService:
         
         event = {
             "type": event_type,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.now(timezone.utc),
             **data,
         }
         
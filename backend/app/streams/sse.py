@@ -1,9 +1,9 @@
 """Server-Sent Events (SSE) manager for research sessions."""
 
 import asyncio
-import json
 from datetime import datetime, timezone
 from typing import Any
+import orjson
 import structlog
 
 logger = structlog.get_logger()
@@ -17,8 +17,9 @@ class SSEManager:
     """
     
     def __init__(self):
-        # session_id -> list of queues
-        self._subscribers: dict[str, list[asyncio.Queue]] = {}
+        # session_id -> queues; tuples are replaced, never mutated, so
+        # publish can iterate a snapshot without taking the lock
+        self._subscribers: dict[str, tuple[asyncio.Queue, ...]] = {}
         self._lock = asyncio.Lock()
     
     async def subscribe(self, session_id: str) -> asyncio.Queue:
@@ -26,9 +27,7 @@ class SSEManager:
         queue: asyncio.Queue = asyncio.Queue()
         
         async with self._lock:
-            if session_id not in self._subscribers:
-                self._subscribers[session_id] = []
-            self._subscribers[session_id].append(queue)
+            self._subscribers[session_id] = self._subscribers.get(session_id, ()) + (queue,)
         
         logger.debug("SSE subscriber added", session_id=session_id)
         return queue
@@ -36,27 +35,32 @@ class SSEManager:
     async def unsubscribe(self, session_id: str, queue: asyncio.Queue) -> None:
         """Unsubscribe from session events."""
         async with self._lock:
-            if session_id in self._subscribers:
-                try:
-                    self._subscribers[session_id].remove(queue)
-                    if not self._subscribers[session_id]:
-                        del self._subscribers[session_id]
-                except ValueError:
-                    pass
+            remaining = tuple(q for q in self._subscribers.get(session_id, ()) if q is not queue)
+            if remaining:
+                self._subscribers[session_id] = remaining
+            else:
+                self._subscribers.pop(session_id, None)
         
         logger.debug("SSE subscriber removed", session_id=session_id)
     
     async def publish(self, session_id: str, event: dict[str, Any]) -> None:
-        """Publish an event to all subscribers for a session."""
-        async with self._lock:
-            subscribers = self._subscribers.get(session_id, [])
+        """
+        Publish an event to all subscribers for a session.
         
+        The event is framed once here and queued as (type, SSE bytes), so each
+        subscriber streams the shared bytes instead of re-serializing the dict.
+        """
+        subscribers = self._subscribers.get(session_id, ())
         if not subscribers:
             return
         
+        item = (event.get("type"), format_sse_message(event))
+        
+        # Lock-free: the tuple read here is a snapshot, and unbounded queues
+        # mean put_nowait never blocks
         for queue in subscribers:
             try:
-                await queue.put(event)
+                queue.put_nowait(item)
             except Exception as e:
                 logger.warning("Failed to publish to subscriber", error=str(e))
     
@@ -83,7 +87,16 @@ async def create_event_callback(session_id: str) -> callable:
     return callback
 
 
-def format_sse_message(event: dict) -> str:
-    """Format an event as an SSE message."""
-    data = json.dumps(event)
-    return f"data: {data}\n\n"
+def format_sse_message(event: dict) -> bytes:
+    """Format an event as an SSE message (UTF-8 bytes, ready to stream)."""
+    return b"data: " + orjson.dumps(event) + b"\n\n"
+
+
+# Heartbeat framing around the only varying part, the timestamp
+_HEARTBEAT_PREFIX = b'data: {"type":"heartbeat","timestamp":"'
+_HEARTBEAT_SUFFIX = b'"}\n\n'
+
+
+def format_sse_heartbeat() -> bytes:
+    """Format a heartbeat SSE message without building and serializing an event dict."""
+    return _HEARTBEAT_PREFIX + datetime.now(timezone.utc).isoformat().encode() + _HEARTBEAT_SUFFIX
@@ -0,0 +1,201 @@
+"""Tests for Claude client helpers."""
+
+import asyncio
+import copy
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.agents.claude_client import (
+    _JsonObjectScanner,
+    _truncate_old_tool_results,
+    call_claude,
+    call_claude_with_tools,
+    extract_json_text,
+)
+
+
+class TestExtractJsonText:
+    """Tests for extract_json_text."""
+    
+    def test_json_fence(self):
+        """Test extracting an object from a ```json fence with trailing prose."""
+        text = 'Here is the plan:\n```json\n{"a": {"b": 1}}\n```\nLet me know.'
+        
+        assert extract_json_text(text) == '{"a": {"b": 1}}'
+    
+    def test_bare_fence(self):
+        """Test extracting an object from an untagged fence."""
+        assert extract_json_text('```\n{"y": 2}\n```') == '{"y": 2}'
+    
+    def test_unclosed_fence(self):
+        """Test a response cut off before the closing fence still extracts."""
+        assert extract_json_text('```json\n{"z": 3}') == '{"z": 3}'
+    
+    def test_unfenced_text_returned_as_is(self):
+        """Test unfenced responses are passed through unchanged."""
+        assert extract_json_text('{"x": 1}') == '{"x": 1}'
+    
+    def test_bare_json_skips_fence_search(self):
+        """Test leading-brace responses are returned without a regex scan."""
+        text = '\n {"note": "see ```json\n{\\"inner\\": 1}\n``` example"}'
+        
+        assert extract_json_text(text) == text
+
+
+class TestJsonObjectScanner:
+    """Tests for _JsonObjectScanner."""
+    
+    def test_detects_close_across_chunks(self):
+        """Test the object is detected as closed only on the final brace."""
+        scanner = _JsonObjectScanner()
+        chunks = ['```json\n{"a": ', '{"b": [1, 2]}', ', "c": 3', '}', '\n```']
+        
+        assert [scanner.feed(c) for c in chunks[:4]] == [False, False, False, True]
+    
+    def test_ignores_braces_in_strings(self):
+        """Test braces and escaped quotes inside strings do not affect depth."""
+        scanner = _JsonObjectScanner()
+        
+        assert scanner.feed('{"text": "a } and \\" { here"') is False
+        assert scanner.feed("}") is True
+
+
+class TestCallClaude:
+    """Tests for call_claude."""
+    
+    @pytest.mark.asyncio
+    async def test_caps_concurrent_requests(self):
+        """Test in-flight requests never exceed the shared semaphore's limit."""
+        in_flight = 0
+        peak = 0
+        
+        async def create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return SimpleNamespace(content=[], stop_reason="end_turn", usage=None)
+        
+        client = MagicMock()
+        client.messages.create = create
+        
+        with patch("app.agents.claude_client.get_claude_client", return_value=client), \
+             patch("app.agents.claude_client._LLM_SEMAPHORE", asyncio.Semaphore(2)), \
+             patch("app.agents.claude_client._usage_to_dict", return_value={}):
+            await asyncio.gather(*(
+                call_claude(messages=[{"role": "user", "content": "hi"}]) for _ in range(5)
+            ))
+        
+        assert peak == 2
+
+
+class TestCallClaudeWithTools:
+    """Tests for call_claude_with_tools."""
+    
+    @pytest.mark.asyncio
+    async def test_runs_tool_calls_concurrently_in_order(self):
+        """Test multiple tool_use blocks execute concurrently and keep their order."""
+        tool_turn = {
+            "content": [],
+            "stop_reason": "tool_use",
+            "tool_calls": [
+                {"id": "t1", "name": "slow", "input": {}},
+                {"id": "t2", "name": "fast", "input": {}},
+            ],
+        }
+        final_turn = {"content": [], "text": "done", "stop_reason": "end_turn", "tool_calls": []}
+        started = []
+        release = asyncio.Event()
+        
+        async def executor(name: str, input_data: dict) -> str:
+            started.append(name)
+            if name == "slow":
+                await asyncio.wait_for(release.wait(), timeout=1)
+            else:
+                release.set()
+            return f"{name} result"
+        
+        with patch("app.agents.claude_client.call_claude", AsyncMock(side_effect=[tool_turn, final_turn])) as mock_call:
+            response = await call_claude_with_tools(
+                messages=[{"role": "user", "content": "go"}],
+                system="system",
+                tools=[{"name": "slow"}, {"name": "fast"}],
+                tool_executor=executor,
+            )
+        
+        assert started == ["slow", "fast"]
+        assert [r["tool"] for r in response["tool_results"]] == ["slow", "fast"]
+        tool_message = mock_call.call_args_list[1].kwargs["messages"][-1]
+        assert [b["tool_use_id"] for b in tool_message["content"]] == ["t1", "t2"]
+
+    
+    @pytest.mark.asyncio
+    async def test_history_before_breakpoint_stable_between_truncations(self):
+        """Test old tool results are truncated in batches, not rewritten every turn."""
+        def tool_turn(i: int) -> dict:
+            return {
+                "content": [],
+                "stop_reason": "tool_use",
+                "tool_calls": [{"id": f"t{i}", "name": "search", "input": {}}],
+            }
+        
+        final_turn = {"content": [], "text": "done", "stop_reason": "end_turn", "tool_calls": []}
+        responses = iter([tool_turn(i) for i in range(4)] + [final_turn])
+        sent = []
+        
+        async def fake_call(messages, **kwargs):
+            # The history is truncated in place later, so keep what was actually sent
+            sent.append(copy.deepcopy(messages))
+            return next(responses)
+        
+        async def executor(name: str, input_data: dict) -> str:
+            return "x" * 100
+        
+        with patch("app.agents.claude_client.call_claude", side_effect=fake_call):
+            await call_claude_with_tools(
+                messages=[{"role": "user", "content": "go"}],
+                system="system",
+                tools=[{"name": "search"}],
+                tool_executor=executor,
+                keep_recent_tool_turns=1,
+                truncate_batch_turns=3,
+            )
+        
+        def without_markers(messages: list[dict]) -> list[dict]:
+            return [
+                {**m, "content": [
+                    {k: v for k, v in b.items() if k != "cache_control"} for b in m["content"]
+                ]} if isinstance(m["content"], list) else m
+                for m in messages
+            ]
+        
+        # The prefix up to each call's rolling breakpoint (its last message) is
+        # resent unchanged until three stale turns have built up
+        for before, after in zip(sent[1:3], sent[2:4]):
+            assert without_markers(after[:len(before)]) == without_markers(before)
+        
+        results = [m["content"][0]["content"] for m in sent[4][2::2]]
+        assert results == [f"[tool_result_id=t{i} truncated]" for i in range(3)] + ["x" * 100]
+
+
+class TestTruncateOldToolResults:
+    """Tests for _truncate_old_tool_results."""
+    
+    def test_keeps_recent_turns_verbatim(self):
+        """Test only tool turns outside the window are replaced."""
+        messages = [{"role": "user", "content": "assignment"}]
+        for i in range(4):
+            messages.append({"role": "assistant", "content": []})
+            messages.append({
+                "role": "user",
+                "content": [{"type": "tool_result", "tool_use_id": f"t{i}", "content": "x" * 100}],
+            })
+        
+        _truncate_old_tool_results(messages, keep_recent=3)
+        
+        contents = [m["content"][0]["content"] for m in messages[2::2]]
+        assert contents[0] == "[tool_result_id=t0 truncated]"
+        assert contents[1:] == ["x" * 100] * 3
+        assert messages[0]["content"] == "assignment"
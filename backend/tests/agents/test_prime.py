@@ -0,0 +1,108 @@
+"""Tests for Prime Agent planning helpers."""
+
+import pytest
+
+from app.agents.prime import assess_confidence, should_stop_research
+
+
+def _findings(count: int) -> list[dict]:
+    return [{"summary": f"Finding {i}"} for i in range(count)]
+
+
+class TestAssessConfidence:
+    """Tests for assess_confidence."""
+    
+    @pytest.mark.asyncio
+    async def test_levels_by_finding_count(self):
+        """Test count thresholds map to the expected levels."""
+        assessment = await assess_confidence({
+            "people": _findings(0),
+            "initiative": _findings(1),
+            "technology": _findings(3),
+            "competitive": _findings(4),
+            "financial": _findings(6),
+            "market": _findings(12),
+        })
+        
+        assert assessment == {
+            "people": "none",
+            "initiative": "low",
+            "technology": "medium",
+            "competitive": "high",
+            "financial": "sufficient",
+            "market": "sufficient",
+        }
+    
+    @pytest.mark.asyncio
+    async def test_carries_forward_higher_previous_level(self):
+        """Test a higher previous level is never downgraded."""
+        assessment = await assess_confidence(
+            {"people": _findings(1), "technology": _findings(6)},
+            previous_assessment={"people": "high", "technology": "low"},
+        )
+        
+        assert assessment["people"] == "high"
+        assert assessment["technology"] == "sufficient"
+        assert assessment["market"] == "none"
+    
+    @pytest.mark.asyncio
+    async def test_plan_downgrade_keeps_previous_level(self):
+        """Test a plan rating a category lower than the last cycle doesn't lower it."""
+        assessment = await assess_confidence(
+            {"people": _findings(1), "technology": _findings(1)},
+            previous_assessment={"people": "high", "technology": "low"},
+            plan_assessment={"people": "low", "technology": "medium"},
+        )
+        
+        assert assessment["people"] == "high"
+        assert assessment["technology"] == "medium"
+    
+    @pytest.mark.asyncio
+    async def test_ignores_unknown_previous_level(self):
+        """Test unknown previous levels rank as none."""
+        assessment = await assess_confidence(
+            {"people": _findings(2)},
+            previous_assessment={"people": "bogus"},
+        )
+        
+        assert assessment["people"] == "medium"
+
+
+class TestShouldStopResearch:
+    """Tests for should_stop_research."""
+    
+    def test_stops_after_max_cycles(self):
+        """Test research stops at cycle 5 regardless of confidence."""
+        assert should_stop_research({"people": "none"}, cycle_number=5) is True
+    
+    def test_stops_when_all_sufficient(self):
+        """Test research stops when every category is sufficient."""
+        assessment = {"people": "sufficient", "market": "sufficient"}
+        
+        assert should_stop_research(assessment, cycle_number=1) is True
+    
+    def test_stops_when_five_high_or_sufficient(self):
+        """Test research stops when 5 of 6 categories are high or better."""
+        assessment = {
+            "people": "high",
+            "initiative": "sufficient",
+            "technology": "high",
+            "competitive": "high",
+            "financial": "high",
+            "market": "none",
+        }
+        
+        assert should_stop_research(assessment, cycle_number=2) is True
+    
+    def test_continues_with_gaps(self):
+        """Test research continues while several categories are weak."""
+        assessment = {
+            "people": "high",
+            "initiative": "high",
+            "technology": "low",
+            "competitive": "none",
+            "financial": "medium",
+            "market": "high",
+        }
+        
+        assert should_stop_research(assessment, cycle_number=2) is False
@@ -0,0 +1,176 @@
+"""Tests for Research Sub-Agent orchestration."""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.agents.researcher import execute_research_paths_parallel, iter_research_paths_parallel
+from app.agents.tools.base import ToolRegistry
+
+
+class TestExecuteResearchPathsParallel:
+    """Tests for execute_research_paths_parallel."""
+    
+    @pytest.mark.asyncio
+    async def test_runs_all_paths_with_bounded_concurrency(self):
+        """Test every path runs while at most max_parallel run at once."""
+        running = 0
+        peak = 0
+        
+        async def fake_execute(**kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return {"findings": [{"summary": kwargs["topic"]}]}
+        
+        paths = [{"id": f"path_{i}", "topic": f"Topic {i}"} for i in range(7)]
+        
+        with patch("app.agents.researcher.execute_research_path", side_effect=fake_execute):
+            results = await execute_research_paths_parallel(
+                paths=paths,
+                company_name="Acme",
+                tool_registry=ToolRegistry(),
+                max_parallel=3,
+            )
+        
+        assert [r["path_id"] for r in results] == [p["id"] for p in paths]
+        assert all(r["status"] == "completed" for r in results)
+        assert peak == 3
+
+    
+    @pytest.mark.asyncio
+    async def test_batches_shallow_refinement_paths(self):
+        """Test batch candidates refining known categories share one Claude call."""
+        paths = [
+            {"id": "path_1", "topic": "CIO name", "category": "people", "batch_candidate": True},
+            {"id": "path_2", "topic": "ERP vendor", "category": "technology", "batch_candidate": True},
+        ]
+        response = {
+            "text": '{"paths": {"path_1": {"findings": [{"summary": "Jane Doe is CIO"}]}, "path_2": {}}}',
+            "turns": 2,
+        }
+        
+        with patch(
+            "app.agents.researcher.call_claude_with_tools", AsyncMock(return_value=response)
+        ) as mock_call, patch("app.agents.researcher.execute_research_path") as mock_path:
+            results = await execute_research_paths_parallel(
+                paths=paths,
+                company_name="Acme",
+                tool_registry=ToolRegistry(),
+                current_confidence={"people": "medium", "technology": "high"},
+            )
+        
+        assert mock_call.await_count == 1
+        assert mock_call.await_args.kwargs["complexity"] == "simple"
+        mock_path.assert_not_called()
+        assert [r["path_id"] for r in results] == ["path_1", "path_2"]
+        assert results[0]["findings"][0]["category"] == "people"
+        assert results[1]["findings"] == []
+    
+    @pytest.mark.asyncio
+    async def test_batch_usage_counted_once(self):
+        """Test the batch's usage is attributed once, not copied onto every path."""
+        paths = [
+            {"id": f"path_{i}", "topic": f"Topic {i}", "category": "people", "batch_candidate": True}
+            for i in range(3)
+        ]
+        usage = {"input_tokens": 1200, "output_tokens": 300}
+        response = {"text": '{"paths": {}}', "turns": 2, "usage": usage}
+        
+        with patch("app.agents.researcher.call_claude_with_tools", AsyncMock(return_value=response)):
+            results = await execute_research_paths_parallel(
+                paths=paths,
+                company_name="Acme",
+                tool_registry=ToolRegistry(),
+                current_confidence={"people": "medium"},
+            )
+        
+        for key, total in usage.items():
+            assert sum(r["usage"].get(key, 0) for r in results) == total
+        assert sum(r["turns"] for r in results) == 2
+    
+    @pytest.mark.asyncio
+    async def test_falls_back_to_per_path_when_batch_unparseable(self):
+        """Test an unparseable batched response reruns the paths individually."""
+        paths = [
+            {"id": "path_1", "topic": "CIO name", "category": "people", "batch_candidate": True},
+            {"id": "path_2", "topic": "ERP vendor", "category": "people", "batch_candidate": True},
+        ]
+        
+        with patch(
+            "app.agents.researcher.call_claude_with_tools",
+            AsyncMock(return_value={"text": "no json here"}),
+        ), patch(
+            "app.agents.researcher.execute_research_path",
+            AsyncMock(return_value={"findings": []}),
+        ) as mock_path:
+            results = await execute_research_paths_parallel(
+                paths=paths,
+                company_name="Acme",
+                tool_registry=ToolRegistry(),
+                current_confidence={"people": "medium"},
+            )
+        
+        assert mock_path.await_count == 2
+        assert all(r["status"] == "completed" for r in results)
+    
+    @pytest.mark.asyncio
+    async def test_failed_batch_usage_added_to_fallback(self):
+        """Test an unparseable batch's usage is still counted alongside the reruns."""
+        paths = [
+            {"id": "path_1", "topic": "CIO name", "category": "people", "batch_candidate": True},
+            {"id": "path_2", "topic": "ERP vendor", "category": "people", "batch_candidate": True},
+        ]
+        batch_response = {
+            "text": "no json here",
+            "turns": 3,
+            "usage": {"input_tokens": 900, "output_tokens": 200},
+        }
+        path_result = {"findings": [], "turns": 1, "usage": {"input_tokens": 100, "output_tokens": 20}}
+        
+        with patch(
+            "app.agents.researcher.call_claude_with_tools", AsyncMock(return_value=batch_response)
+        ), patch(
+            "app.agents.researcher.execute_research_path",
+            AsyncMock(side_effect=lambda **kwargs: dict(path_result)),
+        ):
+            results = await execute_research_paths_parallel(
+                paths=paths,
+                company_name="Acme",
+                tool_registry=ToolRegistry(),
+                current_confidence={"people": "medium"},
+            )
+        
+        assert sum(r["usage"]["input_tokens"] for r in results) == 1100
+        assert sum(r["usage"]["output_tokens"] for r in results) == 240
+        assert sum(r["turns"] for r in results) == 5
+
+
+class TestIterResearchPathsParallel:
+    """Tests for iter_research_paths_parallel."""
+    
+    @pytest.mark.asyncio
+    async def test_yields_results_in_completion_order(self):
+        """Test a fast path's result arrives before a slower path finishes."""
+        slow_release = asyncio.Event()
+        
+        async def fake_execute(**kwargs):
+            if kwargs["topic"] == "slow":
+                await asyncio.wait_for(slow_release.wait(), timeout=1)
+            return {"findings": []}
+        
+        paths = [{"id": "path_1", "topic": "slow"}, {"id": "path_2", "topic": "fast"}]
+        
+        with patch("app.agents.researcher.execute_research_path", side_effect=fake_execute):
+            order = []
+            async for result in iter_research_paths_parallel(
+                paths=paths,
+                company_name="Acme",
+                tool_registry=ToolRegistry(),
+            ):
+                order.append(result["path_id"])
+                slow_release.set()
+        
+        assert order == ["path_2", "path_1"]
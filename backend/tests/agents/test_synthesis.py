@@ -0,0 +1,186 @@
+"""Tests for Synthesis Agent."""
+
+import orjson
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.agents import synthesis
+from app.agents.synthesis import (
+    generate_portfolio_recommendations,
+    synthesize_and_recommend,
+    synthesize_findings,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_synthesis_cache():
+    """Isolate tests from syntheses cached by other tests."""
+    synthesis._SYNTHESIS_CACHE.clear()
+    yield
+    synthesis._SYNTHESIS_CACHE.clear()
+
+
+FINDINGS = {
+    "people": [
+        {"summary": "Jane Doe is CIO", "source_url": "https://a.example"},
+        {"summary": "John Roe leads ERP", "source_url": "https://b.example"},
+    ],
+}
+
+
+class TestSynthesisCache:
+    """Tests for synthesis response caching."""
+    
+    @pytest.mark.asyncio
+    async def test_unchanged_findings_hit_cache(self):
+        """Test re-synthesizing the same findings in any order skips Claude."""
+        mock_call = AsyncMock(return_value={"text": '{"categories": {}}'})
+        reordered = {"people": list(reversed(FINDINGS["people"]))}
+        
+        with patch("app.agents.synthesis.call_claude", mock_call):
+            first = await synthesize_findings("Acme", "ERP migration", FINDINGS)
+            second = await synthesize_findings("Acme", "ERP migration", reordered)
+        
+        assert mock_call.await_count == 1
+        assert first == second == {"categories": {}}
+    
+    @pytest.mark.asyncio
+    async def test_no_cache_forces_refresh(self):
+        """Test no_cache bypasses a cached synthesis."""
+        mock_call = AsyncMock(return_value={"text": '{"categories": {}}'})
+        
+        with patch("app.agents.synthesis.call_claude", mock_call):
+            await synthesize_findings("Acme", "ERP migration", FINDINGS)
+            await synthesize_findings("Acme", "ERP migration", FINDINGS, no_cache=True)
+        
+        assert mock_call.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_parse_failure_not_cached(self):
+        """Test a fallback synthesis from an unparseable response is not cached."""
+        mock_call = AsyncMock(return_value={"text": "not json"})
+        
+        with patch("app.agents.synthesis.call_claude", mock_call):
+            await synthesize_findings("Acme", "ERP migration", FINDINGS)
+            await synthesize_findings("Acme", "ERP migration", FINDINGS)
+        
+        assert mock_call.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_untagged_fence_with_trailing_prose(self):
+        """Test a response in an untagged fence followed by prose still parses."""
+        mock_call = AsyncMock(return_value={
+            "text": 'Here you go:\n```\n{"categories": {}}\n```\nLet me know if you need more.',
+        })
+        
+        with patch("app.agents.synthesis.call_claude", mock_call):
+            result = await synthesize_findings("Acme", "ERP migration", FINDINGS)
+        
+        assert result == {"categories": {}}
+
+
+class TestIncrementalSynthesis:
+    """Tests for merging each cycle's findings into the previous synthesis."""
+    
+    @pytest.mark.asyncio
+    async def test_first_cycle_survives_later_merges(self):
+        """Test a large first-cycle synthesis reaches the model intact on every later cycle."""
+        first = {
+            "categories": {"people": {"summary": "Jane Doe is CIO. " * 200, "confidence": "high"}},
+            "tangential_initiatives": ["Data lake consolidation"],
+            "overall_assessment": "Strong ERP fit",
+        }
+        
+        async def fake_claude(messages, **kwargs):
+            # Stands in for a model that merges new categories into the previous synthesis
+            content = messages[0]["content"]
+            marker = "**Previous Synthesis to Merge:**\n"
+            if marker not in content:
+                return {"text": orjson.dumps(first).decode()}
+            previous = orjson.loads(content.split(marker, 1)[1].split("\n\nSynthesize", 1)[0])
+            category = "technology" if "ERP vendor" in content else "market"
+            previous["categories"][category] = {"summary": category, "confidence": "medium"}
+            return {"text": orjson.dumps(previous).decode()}
+        
+        cycles = [
+            FINDINGS,
+            {"technology": [{"summary": "ERP vendor is SAP"}]},
+            {"market": [{"summary": "Expanding into EMEA"}]},
+        ]
+        
+        result = None
+        with patch("app.agents.synthesis.call_claude", AsyncMock(side_effect=fake_claude)):
+            for findings in cycles:
+                result = await synthesize_findings(
+                    "Acme", "ERP migration", findings, previous_synthesis=result
+                )
+        
+        assert result["categories"]["people"] == first["categories"]["people"]
+        assert set(result["categories"]) == {"people", "technology", "market"}
+        assert result["tangential_initiatives"] == first["tangential_initiatives"]
+        assert result["overall_assessment"] == first["overall_assessment"]
+
+
+class TestSynthesizeAndRecommend:
+    """Tests for synthesize_and_recommend."""
+    
+    @pytest.mark.asyncio
+    async def test_single_call_returns_both(self):
+        """Test synthesis and recommendations come back from one Claude call."""
+        portfolio = [{"vendor_name": "Globex", "capabilities": ["ERP"]}]
+        mock_call = AsyncMock(return_value={
+            "text": '{"categories": {}, "portfolio_recommendations": [{"vendor": "Globex"}]}',
+        })
+        
+        with patch("app.agents.synthesis.call_claude", mock_call):
+            synth, recs = await synthesize_and_recommend("Acme", "ERP migration", FINDINGS, portfolio)
+            cached_synth, cached_recs = await synthesize_and_recommend(
+                "Acme", "ERP migration", FINDINGS, portfolio
+            )
+        
+        assert mock_call.await_count == 1
+        assert "Globex" in mock_call.await_args.kwargs["messages"][0]["content"]
+        assert synth == cached_synth == {"categories": {}}
+        assert recs == cached_recs == [{"vendor": "Globex"}]
+    
+    @pytest.mark.asyncio
+    async def test_empty_portfolio_skips_recommendations(self):
+        """Test an empty portfolio runs a plain synthesis."""
+        mock_call = AsyncMock(return_value={"text": '{"categories": {}}'})
+        
+        with patch("app.agents.synthesis.call_claude", mock_call):
+            synth, recs = await synthesize_and_recommend("Acme", "ERP migration", FINDINGS, [])
+        
+        assert synth == {"categories": {}}
+        assert recs == []
+        assert "portfolio" not in mock_call.await_args.kwargs["messages"][0]["content"].lower()
+
+
+class TestEmptyInputs:
+    """Tests for skipping Claude when there is nothing to work with."""
+    
+    @pytest.mark.asyncio
+    async def test_no_findings_skips_claude(self):
+        """Test synthesis with no findings returns the empty structure without a call."""
+        mock_call = AsyncMock()
+        
+        with patch("app.agents.synthesis.call_claude", mock_call):
+            synth, recs = await synthesize_and_recommend(
+                "Acme", "ERP migration", {"people": []}, [{"vendor_name": "Globex"}]
+            )
+        
+        mock_call.assert_not_awaited()
+        assert synth["categories"]["people"]["confidence"] == "none"
+        assert recs == []
+    
+    @pytest.mark.asyncio
+    async def test_low_confidence_synthesis_skips_recommendations(self):
+        """Test recommendations are skipped when every category is none or low."""
+        mock_call = AsyncMock()
+        synth = {"categories": {"people": {"confidence": "low"}, "market": {"confidence": "none"}}}
+        
+        with patch("app.agents.synthesis.call_claude", mock_call):
+            recs = await generate_portfolio_recommendations(synth, [{"vendor_name": "Globex"}])
+        
+        mock_call.assert_not_awaited()
+        assert recs == []
@@ -4,7 +4,7 @@ import asyncio
 from typing import AsyncGenerator, Generator
 import pytest
 from httpx import AsyncClient, ASGITransport
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
 from app.main import app
 from app.db.database import Base, get_session
@@ -42,16 +42,25 @@ async def test_engine():
 
 @pytest.fixture
 async def db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Provide a database session for each test."""
-    async_session_maker = async_sessionmaker(
-        test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
+    """
+    Provide a database session for each test.
     
-    async with async_session_maker() as session:
+    The session joins an outer transaction on one connection and turns its own
+    commits into SAVEPOINTs, so rolling the outer transaction back leaves the
+    schema clean for the next test.
+    """
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        
         yield session
-        await session.rollback()
+        
+        await session.close()
+        await trans.rollback()
 
 
 @pytest.fixture
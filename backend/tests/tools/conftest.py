@@ -0,0 +1,84 @@
+"""Shared fixtures for tool tests."""
+
+import pytest
+from unittest.mock import patch
+
+from app.agents.tools.base import Tool, ToolRegistry, create_default_registry
+from app.agents.tools.web_search import WebSearchTool
+from app.agents.tools.web_scrape import WebScrapeTool
+from app.agents.tools.sec_filings import SECFilingsTool
+from app.agents.tools.news_search import NewsSearchTool
+from app.agents.tools.job_postings import JobPostingsTool
+
+
+@pytest.fixture(scope="session")
+def web_search_tool() -> WebSearchTool:
+    """Share one WebSearchTool across the session - tools hold no per-call state."""
+    return WebSearchTool()
+
+
+@pytest.fixture(scope="session")
+def web_scrape_tool() -> WebScrapeTool:
+    """Share one WebScrapeTool across the session - tools hold no per-call state."""
+    return WebScrapeTool()
+
+
+@pytest.fixture(scope="session")
+def sec_filings_tool() -> SECFilingsTool:
+    """Share one SECFilingsTool across the session - tools hold no per-call state."""
+    return SECFilingsTool()
+
+
+@pytest.fixture(scope="session")
+def news_search_tool() -> NewsSearchTool:
+    """Share one NewsSearchTool across the session - tools hold no per-call state."""
+    return NewsSearchTool()
+
+
+@pytest.fixture(scope="session")
+def job_postings_tool() -> JobPostingsTool:
+    """Share one JobPostingsTool across the session - tools hold no per-call state."""
+    return JobPostingsTool()
+
+
+@pytest.fixture(scope="module")
+def default_registry() -> ToolRegistry:
+    """Build the default registry once per module - tests only read from it."""
+    return create_default_registry()
+
+
+@pytest.fixture
+def registry() -> ToolRegistry:
+    """Provide an empty registry per test - tests register into it."""
+    return ToolRegistry()
+
+
+class StubTool(Tool):
+    """Minimal concrete Tool - returns result, or raises error when set."""
+    
+    name = "stub_tool"
+    description = "Stub tool for run_tool tests"
+    schema = {"type": "object", "properties": {}}
+    
+    def __init__(self):
+        self.result: dict = {}
+        self.error: Exception | None = None
+    
+    async def execute(self, **kwargs) -> dict:
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+@pytest.fixture
+def stub_tool() -> StubTool:
+    """Provide a fresh StubTool; tests set its name, result or error."""
+    return StubTool()
+
+
+@pytest.fixture
+def patched_settings():
+    """Patch web_search settings with an API key set; tests may clear it."""
+    with patch("app.agents.tools.web_search.settings") as mock_settings:
+        mock_settings.brave_search_api_key = "test-key"
+        yield mock_settings
@@ -73,8 +73,11 @@ export const researchApi = {
 
 // Companies API
 export const companiesApi = {
-  list: (offset = 0, limit = 20): Promise<{ data: CompanyProfile[]; total: number }> =>
-    request(`/companies?offset=${offset}&limit=${limit}`),
+  list: (
+    cursor?: string,
+    limit = 20,
+  ): Promise<{ data: CompanyProfile[]; total: number | null; next_cursor: string | null }> =>
+    request(`/companies?limit=${limit}${cursor ? `&cursor=${encodeURIComponent(cursor)}` : ""}`),
 
   get: (id: string): Promise<CompanyProfile> =>
     request(`/companies/${id}`),